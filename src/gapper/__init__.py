@@ -1,12 +1,17 @@
 """The gapper (gap) package."""
 
-from .core.problem import gs_connect, problem
+from .core.fuzzing import fuzz
+from .core.packed_files import binary_input
+from .core.problem import gs_connect, leaderboard, problem
+from .core.stdout_check import stdout_check
 from .core.test_parameter import (
     param,
     tc,
     tcs,
     test_case,
     test_cases,
+    test_cases_from_file,
+    test_cases_generated,
     test_cases_param_iter,
     test_cases_params,
     test_cases_product,
@@ -18,13 +23,19 @@ from .core.tester import post_tests, pre_tests
 from .core.unittest_wrapper import post_hook, pre_hook
 
 __all__ = [
+    "binary_input",
+    "fuzz",
     "gs_connect",
+    "leaderboard",
     "problem",
     "param",
+    "stdout_check",
     "tc",
     "tcs",
     "test_case",
     "test_cases",
+    "test_cases_from_file",
+    "test_cases_generated",
     "test_cases_param_iter",
     "test_cases_params",
     "test_cases_product",
@@ -4,11 +4,12 @@ import typer
 from .check import check
 from .gen import gen
 from .login import login
+from .minimize import minimize
 from .run import run
 from .run_in_prod import run_in_prod
 from .upload import upload
 
-command_impls = [check, run, run_in_prod, upload, login, gen]
+command_impls = [check, run, run_in_prod, upload, login, gen, minimize]
 
 app = typer.Typer()
 for command_impl in command_impls:
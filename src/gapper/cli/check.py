@@ -1,4 +1,6 @@
 """Command line interface for checking the problem against the gap_check fields."""
+from time import perf_counter
+
 import typer
 
 from gapper.cli.cli_options import (
@@ -12,6 +14,7 @@ from gapper.cli.rich_test_check_output import rich_print_test_check
 from gapper.cli.utils import cli_logger, setup_root_logger
 from gapper.core.injection import InjectionHandler
 from gapper.core.problem import Problem
+from gapper.core.unittest_wrapper import TestCaseWrapper
 
 
 @timed
@@ -45,3 +48,28 @@ def check(
     except Exception as e:
         typer.echo(f"Error: {e}")
         raise typer.Exit(code=1)
+
+    if problem.duplicate_test_params:
+        typer.echo(
+            f"{len(problem.duplicate_test_params)} duplicate test cases take "
+            f"{_time_duplicates(problem):.3f}s to run the solution, "
+            f"and run again with every submission."
+        )
+
+
+def _time_duplicates(problem: Problem) -> float:
+    """Time the solution on the duplicate test cases, except the override tests."""
+    elapsed = 0.0
+    for test_param in problem.duplicate_test_params:
+        if test_param.param_info.gap_override_test is not None:
+            continue
+
+        test = TestCaseWrapper(test_param, problem)
+        start = perf_counter()
+        try:
+            test._select_eval_fn()(problem.solution, test_param)
+        except Exception:
+            pass
+        elapsed += perf_counter() - start
+
+    return elapsed
@@ -68,7 +68,10 @@ def gen(
     ):
         typer.echo("Overwriting...")
 
-    AutograderZipper(tester).generate_zip(autograder_save_path)
+    zipper = AutograderZipper(tester)
+    zipper.generate_zip(autograder_save_path)
+    if zipper.intern_report is not None and zipper.intern_report.interned_values:
+        typer.echo(zipper.intern_report.format())
     typer.echo(
         f"Autograder zip generated successfully at {autograder_save_path.absolute()}"
     )
@@ -0,0 +1,78 @@
+"""CLI command reporting redundant test cases using the solution's coverage."""
+import json
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+
+from gapper.cli.cli_options import (
+    AutoInjectOpt,
+    InjectOpt,
+    ProblemPathArg,
+    VerboseOpt,
+    timed,
+)
+from gapper.cli.rich_test_minimize_output import rich_print_minimization
+from gapper.cli.utils import cli_logger, setup_root_logger
+from gapper.core.coverage import measure_test_coverage, minimize_suite
+from gapper.core.injection import InjectionHandler
+from gapper.core.problem import Problem
+
+
+@timed
+def minimize(
+    path: ProblemPathArg,
+    auto_inject: AutoInjectOpt,
+    inject: InjectOpt,
+    keep_list_path: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--output",
+            "-o",
+            help="The path to save the ranked keep list as JSON.",
+            dir_okay=False,
+        ),
+    ] = None,
+    verbose: VerboseOpt = False,
+) -> None:
+    """Find the test cases adding no new coverage of the solution."""
+    setup_root_logger(verbose)
+
+    InjectionHandler().setup(auto_inject, inject).inject()
+    cli_logger.debug("Injection setup")
+
+    problem = Problem.from_path(path)
+    cli_logger.debug("Problem loaded")
+
+    try:
+        coverages = measure_test_coverage(problem)
+    except RuntimeError as e:
+        typer.echo(f"Error: {e}")
+        raise typer.Exit(code=1)
+    cli_logger.debug(f"Coverage measured for {len(coverages)} test cases")
+
+    report = minimize_suite(coverages)
+    rich_print_minimization(report)
+
+    if keep_list_path is not None:
+        keep_list_path.write_text(
+            json.dumps(
+                {
+                    "keep": [
+                        {
+                            "index": entry.case.index,
+                            "param": entry.case.test_param.format(),
+                            "gain": entry.gain,
+                            "measured": entry.case.is_measured,
+                        }
+                        for entry in report.keep
+                    ],
+                    "redundant": [
+                        {"index": case.index, "param": case.test_param.format()}
+                        for case in report.redundant
+                    ],
+                },
+                indent=2,
+            )
+        )
+        typer.echo(f"Keep list saved to {keep_list_path.absolute()}")
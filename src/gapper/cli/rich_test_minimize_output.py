@@ -0,0 +1,53 @@
+"""Rich print the test suite minimization report."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from rich import print as rprint
+from rich.box import ROUNDED
+from rich.panel import Panel
+from rich.table import Table
+
+if TYPE_CHECKING:
+    from gapper.core.coverage import MinimizationReport
+
+
+RICH_PANEL_OPTS = {
+    "box": ROUNDED,
+    "title_align": "left",
+    "subtitle_align": "right",
+}
+
+
+def rich_print_minimization(report: MinimizationReport) -> None:
+    """Print the ranked keep list and the redundant test cases.
+
+    :param report: The minimization report.
+    """
+    keep_table = Table("Rank", "Index", "Test Case", "New Coverage", box=ROUNDED)
+    for rank, entry in enumerate(report.keep, start=1):
+        keep_table.add_row(
+            str(rank),
+            str(entry.case.index),
+            entry.case.test_param.format(),
+            str(entry.gain) if entry.case.is_measured else "not measured",
+        )
+    rprint(keep_table)
+
+    if report.redundant:
+        redundant_table = Table("Index", "Test Case", "Error", box=ROUNDED)
+        for case in report.redundant:
+            redundant_table.add_row(
+                str(case.index), case.test_param.format(), case.error or ""
+            )
+        rprint(redundant_table)
+
+    total_cases = len(report.keep) + len(report.redundant)
+    rprint(
+        Panel(
+            f"{len(report.redundant)} of {total_cases} test cases add no new coverage.",
+            title="Summary",
+            subtitle=f"{report.total_coverage} lines and branches covered",
+            **RICH_PANEL_OPTS,  # type: ignore
+        )
+    )
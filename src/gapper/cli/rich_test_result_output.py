@@ -9,6 +9,9 @@ from rich.panel import Panel
 
 if TYPE_CHECKING:
     from gapper.core.test_result import TestResult
+    from gapper.gradescope.datatypes.gradescope_output import (
+        GradescopeLeaderboardEntry,
+    )
 
 
 RICH_PANEL_OPTS = {
@@ -22,12 +25,14 @@ def rich_print_test_results(
     results: List[TestResult],
     score_obtained: float,
     total_score: float,
+    leaderboard: List[GradescopeLeaderboardEntry] | None = None,
 ) -> None:
     """Print a fancy summary of the problem.
 
     :param results: The results of the problem.
     :param score_obtained: The score obtained by the submissions.
     :param total_score: The total score of all tests.
+    :param leaderboard: The leaderboard entries measured on the submission.
     """
     rprint(
         Panel(
@@ -49,3 +54,15 @@ def rich_print_test_results(
                 **RICH_PANEL_OPTS,  # type: ignore
             )
         )
+
+    if leaderboard:
+        rprint(
+            Panel(
+                "\n".join(
+                    f"{entry.name}: {entry.value} ({entry.order})"
+                    for entry in leaderboard
+                ),
+                title="Leaderboard",
+                **RICH_PANEL_OPTS,  # type: ignore
+            )
+        )
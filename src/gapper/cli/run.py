@@ -62,4 +62,6 @@ def run(
     ).synthesize_score()
     cli_logger.debug(f"Score obtained from synthesizer {score_obtained}")
 
-    rich_print_test_results(test_results, score_obtained, total_score)
+    rich_print_test_results(
+        test_results, score_obtained, total_score, tester.leaderboard
+    )
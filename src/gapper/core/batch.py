@@ -0,0 +1,100 @@
+"""Support for gap_batch test cases, evaluated once on stacked inputs."""
+from __future__ import annotations
+
+from types import ModuleType
+from typing import Any, Dict, List, Sequence, Tuple
+
+from gapper.core.errors import InternalError
+
+__all__ = [
+    "MAX_REPORTED_MISMATCHES",
+    "batch_element",
+    "elementwise_equal",
+    "find_mismatches",
+]
+
+MAX_REPORTED_MISMATCHES = 5
+"""The number of mismatching batch elements described in a failed test."""
+
+
+def elementwise_equal(expected: Any, actual: Any) -> Sequence[bool]:
+    """Compare two batches of results element by element.
+
+    numpy arrays are compared in one vectorized operation, where an element is equal
+    if all of its entries are. Other sequences are compared with ==, or with
+    numpy.array_equal for their elements that are arrays.
+
+    :param expected: The batch of results of the solution.
+    :param actual: The batch of results of the submission.
+    :raises AssertionError: If the batches have different shapes.
+    :raises InternalError: If two elements cannot be compared with ==.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None and (
+        isinstance(expected, np.ndarray) or isinstance(actual, np.ndarray)
+    ):
+        expected, actual = np.asarray(expected), np.asarray(actual)
+        if expected.shape != actual.shape:
+            raise AssertionError(
+                f"The batch of results has shape {actual.shape}, "
+                f"but {expected.shape} is expected."
+            )
+        equal = expected == actual
+        return equal.reshape(len(equal), -1).all(axis=1) if equal.ndim > 1 else equal
+
+    if len(expected) != len(actual):
+        raise AssertionError(
+            f"The batch has {len(actual)} results, but {len(expected)} are expected."
+        )
+    return [_element_equal(e, a, np) for e, a in zip(expected, actual)]
+
+
+def _element_equal(expected: Any, actual: Any, np: ModuleType | None) -> bool:
+    """Compare two elements of batches that are not numpy arrays themselves."""
+    if np is not None and (
+        isinstance(expected, np.ndarray) or isinstance(actual, np.ndarray)
+    ):
+        return bool(np.array_equal(expected, actual))
+
+    try:
+        return bool(expected == actual)
+    except ValueError as e:
+        raise InternalError(
+            f"The batch elements {expected!r} and {actual!r} cannot be compared "
+            f"with ==. Pass an element-wise check to gap_batch instead."
+        ) from e
+
+
+def find_mismatches(equal: Sequence[bool]) -> List[int]:
+    """Return the indices of the elements that are not equal.
+
+    :param equal: The element-wise comparison of two batches.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        if isinstance(equal, np.ndarray):
+            return np.flatnonzero(~equal.astype(bool)).tolist()
+
+    return [index for index, is_equal in enumerate(equal) if not is_equal]
+
+
+def batch_element(
+    args: Tuple[Any, ...], kwargs: Dict[str, Any], index: int
+) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    """Return the input at an index of the stacked arguments of a batch.
+
+    :param args: The stacked positional arguments.
+    :param kwargs: The stacked keyword arguments.
+    :param index: The index of the input.
+    """
+    return (
+        tuple(arg[index] for arg in args),
+        {key: value[index] for key, value in kwargs.items()},
+    )
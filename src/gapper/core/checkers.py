@@ -0,0 +1,405 @@
+"""Built-in equality checks for gap_override_check, with tolerance for numbers."""
+from __future__ import annotations
+
+import re
+import reprlib
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from functools import cache
+from numbers import Number, Real
+from types import ModuleType
+from typing import Any, Callable, List
+
+__all__ = [
+    "Checker",
+    "allclose",
+    "sequence_equal",
+    "mapping_equal",
+]
+
+_NUMBER_TOKEN = re.compile(r"([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)")
+_short = reprlib.Repr(
+    maxlevel=3,
+    maxtuple=6,
+    maxlist=6,
+    maxdict=6,
+    maxset=6,
+    maxfrozenset=6,
+    maxstring=60,
+    maxother=60,
+).repr
+
+
+@cache
+def _numpy() -> ModuleType | None:
+    """Return numpy if it is installed."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
+class Checker(ABC):
+    """An equality check to be passed to gap_override_check.
+
+    It is called like assertEqual, with the expected and the actual values, and
+    raises an AssertionError with a short description of the first difference.
+    Two strings, such as the stdout when check_stdout is enabled, are compared line
+    by line, with the numbers in the lines compared with the tolerance.
+    """
+
+    def __call__(self, expected: Any, actual: Any, msg: str | None = None) -> None:
+        """Check the actual value against the expected one.
+
+        :param expected: The value of the solution.
+        :param actual: The value of the submission.
+        :param msg: The message to prefix the difference with.
+        :raises AssertionError: If the values differ.
+        """
+        if isinstance(expected, str) and isinstance(actual, str):
+            diff = None if expected == actual else self.diff_text(expected, actual)
+        else:
+            diff = self.diff(expected, actual)
+
+        if diff is not None:
+            raise AssertionError(diff if msg is None else f"{msg}: {diff}")
+
+    @property
+    def __name__(self) -> str:
+        """The name of the check, shown in the logs."""
+        return repr(self)
+
+    @abstractmethod
+    def diff(self, expected: Any, actual: Any) -> str | None:
+        """Describe the first difference between two values.
+
+        :param expected: The value of the solution.
+        :param actual: The value of the submission.
+        :return: The description of the difference, or None if they match.
+        """
+        ...
+
+    @abstractmethod
+    def diff_text(self, expected: str, actual: str) -> str | None:
+        """Describe the first difference between two different texts.
+
+        :param expected: The text of the solution.
+        :param actual: The text of the submission.
+        :return: The description of the difference, or None if they match.
+        """
+        ...
+
+
+@dataclass(frozen=True)
+class _TolerantChecker(Checker):
+    rtol: float = 0.0
+    atol: float = 0.0
+    equal_nan: bool = False
+
+    def __post_init__(self) -> None:
+        if self.rtol < 0 or self.atol < 0:
+            raise ValueError("The tolerances must not be negative.")
+
+    @property
+    def exact(self) -> bool:
+        return self.rtol == 0 and self.atol == 0
+
+    def numbers_close(self, expected: Any, actual: Any) -> bool:
+        try:
+            if expected == actual:
+                return True
+            if expected != expected and actual != actual:
+                return self.equal_nan
+            return abs(actual - expected) <= self.atol + self.rtol * abs(expected)
+        except TypeError:
+            return False
+
+    def lines_close(self, expected: str, actual: str) -> bool:
+        if expected == actual:
+            return True
+        if self.exact:
+            return False
+
+        expected_parts = _NUMBER_TOKEN.split(expected)
+        actual_parts = _NUMBER_TOKEN.split(actual)
+        if len(expected_parts) != len(actual_parts):
+            return False
+        return all(
+            self.numbers_close(float(e), float(a)) if i % 2 else e == a
+            for i, (e, a) in enumerate(zip(expected_parts, actual_parts))
+        )
+
+    def diff_value(self, expected: Any, actual: Any, path: str = "") -> str | None:
+        """Describe the first difference between two values, recursively."""
+        if _is_number(expected) and _is_number(actual):
+            if self.numbers_close(expected, actual):
+                return None
+            return _mismatch(path, expected, actual)
+
+        if (arrays := _numeric_arrays(expected, actual)) is not None:
+            return self.diff_arrays(*arrays, path)
+
+        if isinstance(expected, Mapping) and isinstance(actual, Mapping):
+            return self.diff_mapping(expected, actual, path)
+
+        if isinstance(expected, (list, tuple)) and type(expected) is type(actual):
+            return self.diff_sequence(expected, actual, path)
+
+        if isinstance(expected, str) and isinstance(actual, str):
+            if expected == actual:
+                return None
+            return _mismatch(path, expected, actual)
+
+        try:
+            equal = bool(expected == actual)
+        except ValueError:
+            equal = False
+        return None if equal else _mismatch(path, expected, actual)
+
+    def diff_arrays(self, expected: Any, actual: Any, path: str) -> str | None:
+        np = _numpy()
+        if expected.shape != actual.shape:
+            return _at(path, f"expected shape {expected.shape}, got {actual.shape}")
+
+        if self.exact and not self.equal_nan:
+            close = expected == actual
+        else:
+            close = np.isclose(
+                actual,
+                expected,
+                rtol=self.rtol,
+                atol=self.atol,
+                equal_nan=self.equal_nan,
+            )
+        if close.all():
+            return None
+
+        wrong = ~close
+        index = tuple(np.argwhere(wrong)[0].tolist())
+        index_path = path + "".join(f"[{i}]" for i in index)
+        return (
+            f"{_mismatch(index_path, expected[index].item(), actual[index].item())} "
+            f"({np.count_nonzero(wrong)} of {close.size} elements differ)"
+        )
+
+    def diff_sequence(
+        self, expected: List[Any] | tuple, actual: List[Any] | tuple, path: str
+    ) -> str | None:
+        if len(expected) != len(actual):
+            return _at(path, f"expected {len(expected)} items, got {len(actual)}")
+        for index, (e, a) in enumerate(zip(expected, actual)):
+            if (diff := self.diff_value(e, a, f"{path}[{index}]")) is not None:
+                return diff
+        return None
+
+    def diff_mapping(
+        self, expected: Mapping[Any, Any], actual: Mapping[Any, Any], path: str
+    ) -> str | None:
+        missing = [key for key in expected if key not in actual]
+        unexpected = [key for key in actual if key not in expected]
+        if missing or unexpected:
+            return _at(
+                path,
+                f"missing keys {_short(missing)}, unexpected keys {_short(unexpected)}",
+            )
+        for key, value in expected.items():
+            if (
+                diff := self.diff_value(value, actual[key], f"{path}[{key!r}]")
+            ) is not None:
+                return diff
+        return None
+
+    def diff_lines(self, expected: List[str], actual: List[str]) -> str | None:
+        for number, (e, a) in enumerate(zip(expected, actual), start=1):
+            if not self.lines_close(e, a):
+                return f"Line {number}: expected {_short(e)}, got {_short(a)}"
+        if len(expected) != len(actual):
+            return f"Expected {len(expected)} lines, got {len(actual)}"
+        return None
+
+    def diff_text(self, expected: str, actual: str) -> str | None:
+        return self.diff_lines(expected.split("\n"), actual.split("\n"))
+
+
+@dataclass(frozen=True)
+class _AllClose(_TolerantChecker):
+    rtol: float = 1e-05
+    atol: float = 1e-08
+
+    def diff(self, expected: Any, actual: Any) -> str | None:
+        return self.diff_value(expected, actual)
+
+
+@dataclass(frozen=True)
+class _SequenceEqual(_TolerantChecker):
+    ordered: bool = True
+
+    def diff(self, expected: Any, actual: Any) -> str | None:
+        if not _is_collection(actual):
+            return f"Expected a sequence, got {_short(actual)}"
+
+        expected, actual = _as_list(expected), _as_list(actual)
+        if self.ordered:
+            if (arrays := _numeric_arrays(expected, actual)) is not None:
+                return self.diff_arrays(*arrays, "")
+            return self.diff_sequence(expected, actual, "")
+        return self.diff_unordered(expected, actual)
+
+    def diff_text(self, expected: str, actual: str) -> str | None:
+        if self.ordered:
+            return super().diff_text(expected, actual)
+        return self.diff_unordered(
+            expected.split("\n"), actual.split("\n"), self.lines_close
+        )
+
+    def diff_unordered(
+        self,
+        expected: List[Any],
+        actual: List[Any],
+        match: Callable[[Any, Any], bool] | None = None,
+    ) -> str | None:
+        if match is None and self.exact:
+            try:
+                expected_counts, actual_counts = Counter(expected), Counter(actual)
+            except TypeError:
+                pass
+            else:
+                return _unordered_diff(
+                    list((expected_counts - actual_counts).elements()),
+                    list((actual_counts - expected_counts).elements()),
+                )
+
+        if match is None and all(isinstance(v, Real) for v in expected + actual):
+            return self.diff_sorted(sorted(expected), sorted(actual))
+
+        match = match or (lambda e, a: self.diff_value(e, a) is None)
+        unexpected = list(actual)
+        missing = []
+        for e in expected:
+            for index, a in enumerate(unexpected):
+                if match(e, a):
+                    del unexpected[index]
+                    break
+            else:
+                missing.append(e)
+        return _unordered_diff(missing, unexpected)
+
+    def diff_sorted(self, expected: List[Real], actual: List[Real]) -> str | None:
+        """Match two sorted lists of numbers in one pass."""
+        missing, unexpected = [], []
+        i = j = 0
+        while i < len(expected) and j < len(actual):
+            if self.numbers_close(expected[i], actual[j]):
+                i, j = i + 1, j + 1
+            elif expected[i] < actual[j]:
+                missing.append(expected[i])
+                i += 1
+            else:
+                unexpected.append(actual[j])
+                j += 1
+        missing.extend(expected[i:])
+        unexpected.extend(actual[j:])
+        return _unordered_diff(missing, unexpected)
+
+
+@dataclass(frozen=True)
+class _MappingEqual(_TolerantChecker):
+    def diff(self, expected: Any, actual: Any) -> str | None:
+        if not isinstance(actual, Mapping):
+            return f"Expected a mapping, got {_short(actual)}"
+        return self.diff_mapping(expected, actual, "")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, Number)
+
+
+def _is_collection(value: Any) -> bool:
+    return isinstance(value, Iterable) and not isinstance(value, (str, bytes, Mapping))
+
+
+def _as_list(value: Any) -> List[Any]:
+    np = _numpy()
+    if np is not None and isinstance(value, np.ndarray):
+        return value.tolist()
+    return value if isinstance(value, list) else list(value)
+
+
+def _numeric_arrays(expected: Any, actual: Any) -> tuple[Any, Any] | None:
+    """Convert two values to numpy arrays if both are arrays or lists of numbers."""
+    np = _numpy()
+    if np is None or not (
+        isinstance(expected, (list, tuple, np.ndarray))
+        and isinstance(actual, (list, tuple, np.ndarray))
+    ):
+        return None
+
+    try:
+        expected, actual = np.asarray(expected), np.asarray(actual)
+    except (ValueError, TypeError):
+        return None
+    if expected.dtype.kind not in "biuf" or actual.dtype.kind not in "biuf":
+        return None
+    return expected, actual
+
+
+def _at(path: str, difference: str) -> str:
+    return (
+        f"At {path}: {difference}" if path else difference[:1].upper() + difference[1:]
+    )
+
+
+def _mismatch(path: str, expected: Any, actual: Any) -> str:
+    return _at(path, f"expected {_short(expected)}, got {_short(actual)}")
+
+
+def _unordered_diff(missing: List[Any], unexpected: List[Any]) -> str | None:
+    if not missing and not unexpected:
+        return None
+    return (
+        f"{len(missing)} missing items {_short(missing)}, "
+        f"{len(unexpected)} unexpected items {_short(unexpected)}"
+    )
+
+
+def allclose(
+    rtol: float = 1e-05, atol: float = 1e-08, equal_nan: bool = False
+) -> Checker:
+    """Compare numbers, and arrays, sequences, and mappings of them, with a tolerance.
+
+    Two numbers match if abs(actual - expected) <= atol + rtol * abs(expected), like
+    numpy.isclose. Arrays and lists of numbers are compared in one vectorized
+    operation when numpy is installed, and other values are compared recursively.
+
+    :param rtol: The relative tolerance.
+    :param atol: The absolute tolerance.
+    :param equal_nan: Whether two NaNs match.
+    """
+    return _AllClose(rtol, atol, equal_nan)
+
+
+def sequence_equal(
+    ordered: bool = True, rtol: float = 0.0, atol: float = 0.0
+) -> Checker:
+    """Compare two sequences, optionally ignoring the order of the items.
+
+    The actual value can be any iterable, such as a generator or a set. Unordered
+    sequences are compared as multisets, and texts are compared as sequences of lines.
+
+    :param ordered: Whether the order of the items matters.
+    :param rtol: The relative tolerance for numbers.
+    :param atol: The absolute tolerance for numbers.
+    """
+    return _SequenceEqual(rtol, atol, ordered=ordered)
+
+
+def mapping_equal(rtol: float = 0.0, atol: float = 0.0) -> Checker:
+    """Compare two mappings by their keys, and by their values with a tolerance.
+
+    :param rtol: The relative tolerance for numbers.
+    :param atol: The absolute tolerance for numbers.
+    """
+    return _MappingEqual(rtol, atol)
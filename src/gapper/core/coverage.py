@@ -0,0 +1,219 @@
+"""Coverage-driven test suite minimization."""
+from __future__ import annotations
+
+import heapq
+import logging
+import sys
+from dataclasses import dataclass, field
+from types import CodeType
+from typing import TYPE_CHECKING, Any, FrozenSet, Hashable, Iterable, List, Self, Set
+
+from gapper.core.profiler import submission_source_files
+
+if TYPE_CHECKING:
+    from gapper.core.problem import Problem
+    from gapper.core.test_parameter import TestParam
+
+__all__ = [
+    "CaseCoverage",
+    "CoverageCollector",
+    "MinimizationEntry",
+    "MinimizationReport",
+    "measure_test_coverage",
+    "minimize_suite",
+]
+
+_coverage_logger = logging.getLogger("gapper.coverage")
+
+
+class CoverageCollector:
+    """Collect line and branch coverage of some files using ``sys.monitoring``.
+
+    Line and branch events are disabled at their location once seen, so each line
+    and branch only costs a callback the first time it runs during a case. A branch
+    location is disabled for both of its directions, so only the direction it takes
+    first is recorded in a case, and the other one is covered by the lines it
+    reaches. Call :meth:`reset` between cases to start a fresh coverage set.
+    """
+
+    def __init__(self, target_files: Iterable[str]) -> None:
+        """Create a coverage collector.
+
+        :param target_files: The files whose lines and branches are recorded.
+        """
+        self._target_files = frozenset(target_files)
+        self._covered: Set[Hashable] = set()
+        self._tool_id = sys.monitoring.COVERAGE_ID
+
+    @property
+    def covered(self) -> FrozenSet[Hashable]:
+        """The lines and branches covered since the last reset."""
+        return frozenset(self._covered)
+
+    def reset(self) -> None:
+        """Clear the coverage collected so far and re-enable disabled events."""
+        self._covered = set()
+        sys.monitoring.restart_events()
+
+    def _on_line(self, code: CodeType, line_number: int) -> Any:
+        if code.co_filename in self._target_files:
+            self._covered.add(("line", code.co_filename, line_number))
+        return sys.monitoring.DISABLE
+
+    def _on_branch(self, code: CodeType, source: int, destination: int) -> Any:
+        if code.co_filename not in self._target_files:
+            return sys.monitoring.DISABLE
+        self._covered.add(
+            ("branch", code.co_filename, code.co_qualname, source, destination)
+        )
+        return sys.monitoring.DISABLE
+
+    def __enter__(self) -> Self:
+        """Start collecting coverage."""
+        monitoring = sys.monitoring
+        try:
+            monitoring.use_tool_id(self._tool_id, "gapper-coverage")
+        except ValueError as e:
+            raise RuntimeError(
+                "Another coverage tool is running. Please run without it."
+            ) from e
+
+        monitoring.register_callback(
+            self._tool_id, monitoring.events.LINE, self._on_line
+        )
+        monitoring.register_callback(
+            self._tool_id, monitoring.events.BRANCH, self._on_branch
+        )
+        monitoring.set_events(
+            self._tool_id, monitoring.events.LINE | monitoring.events.BRANCH
+        )
+        monitoring.restart_events()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop collecting coverage."""
+        monitoring = sys.monitoring
+        monitoring.set_events(self._tool_id, monitoring.events.NO_EVENTS)
+        monitoring.register_callback(self._tool_id, monitoring.events.LINE, None)
+        monitoring.register_callback(self._tool_id, monitoring.events.BRANCH, None)
+        monitoring.free_tool_id(self._tool_id)
+
+
+@dataclass(frozen=True)
+class CaseCoverage:
+    """The coverage of the solution obtained by a single test case.
+
+    :param index: The index of the test case in the problem.
+    :param test_param: The test case.
+    :param covered: The lines and branches covered. None if the case is not measured.
+    :param error: The error raised by the solution, if any.
+    """
+
+    index: int
+    test_param: TestParam
+    covered: FrozenSet[Hashable] | None
+    error: str | None = None
+
+    @property
+    def is_measured(self) -> bool:
+        """Whether the coverage of this case is measured."""
+        return self.covered is not None
+
+
+@dataclass(frozen=True)
+class MinimizationEntry:
+    """A test case in the ranked keep list.
+
+    :param case: The coverage of the case.
+    :param gain: The number of lines and branches this case adds over the cases before it.
+    """
+
+    case: CaseCoverage
+    gain: int
+
+
+@dataclass
+class MinimizationReport:
+    """The result of minimizing a test suite.
+
+    :param keep: The cases to keep, ranked by the new coverage they add.
+    :param redundant: The cases adding no new coverage over the kept ones.
+    :param total_coverage: The number of lines and branches covered by the suite.
+    """
+
+    keep: List[MinimizationEntry] = field(default_factory=list)
+    redundant: List[CaseCoverage] = field(default_factory=list)
+    total_coverage: int = 0
+
+
+def measure_test_coverage(problem: Problem) -> List[CaseCoverage]:
+    """Run every test case against the solution and record its coverage.
+
+    Cases using gap_override_test or gap_fuzz are not measured, since their inputs
+    are not fixed arguments passed to the solution.
+
+    :param problem: The problem whose test cases are measured.
+    """
+    target_files = submission_source_files(problem.solution)
+    _coverage_logger.debug(f"Measuring coverage in {target_files}")
+
+    coverages: List[CaseCoverage] = []
+    with CoverageCollector(target_files) as collector:
+        for index, test in enumerate(problem.generate_tests()):
+            param_info = test.test_param.param_info
+            if (
+                param_info.gap_override_test is not None
+                or param_info.gap_fuzz is not None
+            ):
+                coverages.append(CaseCoverage(index, test.test_param, None))
+                continue
+
+            collector.reset()
+            error = None
+            try:
+                test._select_eval_fn()(problem.solution, test.test_param)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+
+            coverages.append(
+                CaseCoverage(index, test.test_param, collector.covered, error)
+            )
+
+    return coverages
+
+
+def minimize_suite(coverages: List[CaseCoverage]) -> MinimizationReport:
+    """Rank the test cases by greedily picking the one adding the most new coverage.
+
+    The gain of a case can only shrink as more cases are kept, so the greedy pick is
+    done lazily: a case is kept once its refreshed gain still beats every other
+    case's stale gain, with ties going to the earlier case. Unmeasured cases are
+    always kept at the end of the keep list.
+
+    :param coverages: The coverage of each test case.
+    """
+    report = MinimizationReport()
+    covered: Set[Hashable] = set()
+    heap = [
+        (-len(case.covered), case.index, case) for case in coverages if case.is_measured
+    ]
+    heapq.heapify(heap)
+
+    while heap:
+        _, index, case = heapq.heappop(heap)
+        gain = len(case.covered - covered)
+        if gain == 0:
+            report.redundant.append(case)
+        elif heap and (-gain, index) > heap[0][:2]:
+            heapq.heappush(heap, (-gain, index, case))
+        else:
+            report.keep.append(MinimizationEntry(case, gain))
+            covered |= case.covered
+
+    report.redundant.sort(key=lambda case: case.index)
+    report.keep.extend(
+        MinimizationEntry(case, 0) for case in coverages if not case.is_measured
+    )
+    report.total_coverage = len(covered)
+
+    return report
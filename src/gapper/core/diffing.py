@@ -0,0 +1,331 @@
+"""Bounded-cost descriptions of the differences between two mismatching values."""
+from __future__ import annotations
+
+import reprlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from itertools import islice
+from time import perf_counter
+from typing import Any, Iterator, List, Sequence, Tuple
+
+__all__ = ["DiffBudget", "DEFAULT_DIFF_BUDGET", "assert_equal", "render_diff"]
+
+_short = reprlib.Repr(
+    maxlevel=2,
+    maxtuple=4,
+    maxlist=4,
+    maxdict=4,
+    maxset=4,
+    maxfrozenset=4,
+    maxstring=60,
+    maxother=60,
+).repr
+
+
+@dataclass(frozen=True)
+class DiffBudget:
+    """The limits of the work and the output spent describing a mismatch.
+
+    Only the first difference is rendered. The differences after it are counted
+    until either limit is reached, and the values are never diffed as a whole.
+
+    :param seconds: The time spent counting the differences after the first one.
+    :param max_count: The number of differences after the first one to count.
+    :param context: The number of items shown on each side of the first difference.
+    :param max_length: The maximum length of the description.
+    """
+
+    seconds: float = 0.05
+    max_count: int = 10_000
+    context: int = 2
+    max_length: int = 2000
+
+
+DEFAULT_DIFF_BUDGET = DiffBudget()
+
+
+@dataclass(frozen=True)
+class _Difference:
+    path: Tuple[Any, ...]
+    expected: Any
+    actual: Any
+    kind: str = "value"
+
+
+def assert_equal(
+    expected: Any,
+    actual: Any,
+    msg: str | None = None,
+    budget: DiffBudget = DEFAULT_DIFF_BUDGET,
+) -> None:
+    """Assert that two values are equal, like assertEqual with a bounded-cost message.
+
+    Values that compare unequal are searched for their first difference, which is
+    only used to describe the mismatch. Values that cannot be compared with ==, such
+    as numpy arrays, are equal if no difference is found.
+
+    :param expected: The expected value.
+    :param actual: The actual value.
+    :param msg: The message to prefix the description with.
+    :param budget: The limits of the description.
+    :raises AssertionError: If the values differ.
+    """
+    if _safe_equal(expected, actual):
+        return
+
+    differences = _differences(expected, actual, ())
+    first = next(differences, None)
+    if first is None:
+        return
+
+    description = _render(expected, actual, first, differences, budget)
+    raise AssertionError(description if msg is None else f"{msg}\n{description}")
+
+
+def render_diff(
+    expected: Any, actual: Any, budget: DiffBudget = DEFAULT_DIFF_BUDGET
+) -> str | None:
+    """Describe the differences between two values within a budget.
+
+    :param expected: The expected value.
+    :param actual: The actual value.
+    :param budget: The limits of the description.
+    :return: The description, or None if the values are equal.
+    """
+    differences = _differences(expected, actual, ())
+    first = next(differences, None)
+    if first is None:
+        return None
+    return _render(expected, actual, first, differences, budget)
+
+
+def _safe_equal(expected: Any, actual: Any) -> bool | None:
+    """Compare two values with ==, or return None if the result is not a bool."""
+    try:
+        return bool(expected == actual)
+    except Exception:
+        return None
+
+
+def _is_text(value: Any) -> bool:
+    return isinstance(value, str) and "\n" in value
+
+
+def _is_array(value: Any) -> bool:
+    return type(value).__module__ == "numpy" and type(value).__name__ == "ndarray"
+
+
+def _children(value: Any) -> Sequence[Any] | Mapping[Any, Any]:
+    """Return the items a path indexes into, which are the lines of a text."""
+    return value.split("\n") if isinstance(value, str) else value
+
+
+def _differences(
+    expected: Any, actual: Any, path: Tuple[Any, ...]
+) -> Iterator[_Difference]:
+    """Yield the differences between two values in order, lazily.
+
+    Values that compare unequal without a difference among their items, such as
+    ordered dicts in another order, differ as a whole.
+    """
+    equal = _safe_equal(expected, actual)
+    if equal:
+        return
+
+    found = False
+    for difference in _structural_differences(expected, actual, path):
+        found = True
+        yield difference
+
+    if not found and equal is False:
+        yield _Difference(path, expected, actual)
+
+
+def _structural_differences(
+    expected: Any, actual: Any, path: Tuple[Any, ...]
+) -> Iterator[_Difference]:
+    if isinstance(expected, str) and isinstance(actual, str):
+        if _is_text(expected) or _is_text(actual):
+            yield from _sequence_differences(
+                expected.split("\n"), actual.split("\n"), path
+            )
+        else:
+            yield _Difference(path, expected, actual)
+    elif isinstance(expected, (list, tuple)) and type(expected) is type(actual):
+        yield from _sequence_differences(expected, actual, path)
+    elif isinstance(expected, Mapping) and isinstance(actual, Mapping):
+        yield from _mapping_differences(expected, actual, path)
+    elif _is_array(expected) and _is_array(actual):
+        yield from _array_differences(expected, actual, path)
+    else:
+        yield _Difference(path, expected, actual)
+
+
+def _sequence_differences(
+    expected: Sequence[Any], actual: Sequence[Any], path: Tuple[Any, ...]
+) -> Iterator[_Difference]:
+    for index, (e, a) in enumerate(zip(expected, actual)):
+        yield from _differences(e, a, (*path, index))
+    if len(expected) != len(actual):
+        yield _Difference(path, len(expected), len(actual), "length")
+
+
+def _mapping_differences(
+    expected: Mapping[Any, Any], actual: Mapping[Any, Any], path: Tuple[Any, ...]
+) -> Iterator[_Difference]:
+    for key, value in expected.items():
+        if key not in actual:
+            yield _Difference((*path, key), value, None, "missing")
+        else:
+            yield from _differences(value, actual[key], (*path, key))
+    for key, value in actual.items():
+        if key not in expected:
+            yield _Difference((*path, key), None, value, "unexpected")
+
+
+def _array_differences(
+    expected: Any, actual: Any, path: Tuple[Any, ...]
+) -> Iterator[_Difference]:
+    if expected.shape != actual.shape:
+        yield _Difference(path, expected.shape, actual.shape, "shape")
+        return
+
+    import numpy as np
+
+    for index in np.argwhere(expected != actual):
+        index = tuple(index.tolist())
+        yield _Difference((*path, *index), expected[index].item(), actual[index].item())
+
+
+def _render(
+    expected: Any,
+    actual: Any,
+    first: _Difference,
+    rest: Iterator[_Difference],
+    budget: DiffBudget,
+) -> str:
+    lines = [_describe(expected, first)]
+    lines.extend(_window(expected, actual, first, budget.context))
+
+    more, complete = _count(rest, budget)
+    if more:
+        plural = "difference" if more == 1 else "differences"
+        lines.append(
+            f"{more} more {plural}." if complete else f"At least {more} more {plural}."
+        )
+
+    description = "\n".join(lines)
+    if len(description) > budget.max_length:
+        description = description[: budget.max_length - 15] + "... (truncated)"
+    return description
+
+
+def _format_path(root: Any, path: Tuple[Any, ...]) -> str:
+    parts = []
+    for key in path:
+        if isinstance(root, str):
+            parts.append(f" line {key + 1}")
+        else:
+            parts.append(f"[{key!r}]")
+        root = _child(root, key)
+    return "".join(parts).strip()
+
+
+def _child(value: Any, key: Any) -> Any:
+    try:
+        return _children(value)[key]
+    except (IndexError, KeyError, TypeError):
+        return None
+
+
+def _describe(root: Any, difference: _Difference) -> str:
+    where = _format_path(root, difference.path)
+    where = f" at {where}" if where else ""
+    expected, actual = difference.expected, difference.actual
+
+    match difference.kind:
+        case "length":
+            return f"Length differs{where}: expected {expected} items, got {actual}."
+        case "shape":
+            return f"Shape differs{where}: expected {expected}, got {actual}."
+        case "missing":
+            return f"Missing{where}: expected {_short(expected)}."
+        case "unexpected":
+            return f"Unexpected{where}: got {_short(actual)}."
+
+    if isinstance(expected, str) and isinstance(actual, str):
+        index = next(
+            (i for i, (e, a) in enumerate(zip(expected, actual)) if e != a),
+            min(len(expected), len(actual)),
+        )
+        return (
+            f"First difference{where} at character {index}: "
+            f"expected {_excerpt(expected, index)}, got {_excerpt(actual, index)}."
+        )
+    return (
+        f"First difference{where}: expected {_short(expected)}, got {_short(actual)}."
+    )
+
+
+def _excerpt(text: str, index: int, radius: int = 20) -> str:
+    start, end = max(index - radius, 0), index + radius
+    return (
+        ("..." if start > 0 else "")
+        + repr(text[start:end])
+        + ("..." if end < len(text) else "")
+    )
+
+
+def _window(
+    expected: Any, actual: Any, difference: _Difference, context: int
+) -> List[str]:
+    """Render the items around the first difference in its parent sequences."""
+    if difference.kind in ("missing", "unexpected", "shape"):
+        return []
+    if difference.kind == "length":
+        parent_path, index = (
+            difference.path,
+            min(difference.expected, difference.actual),
+        )
+    elif difference.path:
+        parent_path, index = difference.path[:-1], difference.path[-1]
+    else:
+        return []
+
+    lines = []
+    for label, root in (("expected", expected), ("actual", actual)):
+        parent = root
+        for key in parent_path:
+            parent = _child(parent, key)
+        is_text = isinstance(parent, str)
+        parent = _children(parent)
+        if not (isinstance(parent, (list, tuple)) or _is_array(parent)):
+            return []
+
+        start, end = max(index - context, 0), index + context + 1
+        items = parent[start:end]
+        if _is_array(items):
+            items = items.tolist()
+        if is_text:
+            lines.append(
+                f"{label.capitalize()} lines {start + 1}-{start + len(items)}:"
+            )
+            lines.extend(f"  {_short(line)}" for line in items)
+        else:
+            rendered = ", ".join(_short(item) for item in items)
+            prefix = "..., " if start > 0 else ""
+            suffix = ", ..." if end < len(parent) else ""
+            lines.append(f"  {label + ':':9} [{prefix}{rendered}{suffix}]")
+    return lines
+
+
+def _count(differences: Iterator[_Difference], budget: DiffBudget) -> Tuple[int, bool]:
+    """Count the differences within the budget, and whether all are counted."""
+    deadline = perf_counter() + budget.seconds
+    count = 0
+    for count, _ in enumerate(islice(differences, budget.max_count), start=1):
+        if count % 64 == 0 and perf_counter() > deadline:
+            return count, False
+    if count == budget.max_count:
+        return count, next(differences, None) is None
+    return count, True
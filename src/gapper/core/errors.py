@@ -58,6 +58,61 @@ class StudentError(ErrorFormatter):
     pass
 
 
+class OutputLimitError(StudentError):
+    """Raised when a submission prints more than the stdout limit of the problem."""
+
+    def __init__(self, limit: int, preview: str) -> None:
+        super().__init__(limit, preview)
+
+    @property
+    def limit(self) -> int:
+        return self.args[0]
+
+    @property
+    def preview(self) -> str:
+        return self.args[1]
+
+    def format(self) -> str:
+        return (
+            f"The submission printed more than {self.limit} characters, "
+            f"so the test is stopped.\n"
+            f"Please remove debug prints, especially in loops. "
+            f"The output starts with:\n{indent(self.preview, '  ')}\n"
+        )
+
+
+class IsolatedProcessError(StudentError):
+    """Raised when the process running an isolated test ends without a result."""
+
+    def __init__(self, reason: str, stderr: str) -> None:
+        super().__init__(reason, stderr)
+
+    @property
+    def reason(self) -> str:
+        return self.args[0]
+
+    @property
+    def stderr(self) -> str:
+        return self.args[1]
+
+    def format(self) -> str:
+        return (
+            f"The test process {self.reason} before the test finished.\n"
+            f"Please make sure the submission does not exit, crash the interpreter, "
+            f"or run forever.\n"
+        )
+
+
+class ForwardedError(ErrorFormatter):
+    """An error formatted in the process it was raised in, such as an isolated test."""
+
+    def __init__(self, formatted: str) -> None:
+        super().__init__(formatted)
+
+    def format(self) -> str:
+        return self.args[0]
+
+
 class TestFailedError(ErrorFormatter):
     """Raised when a test fails."""
 
@@ -8,6 +8,7 @@ from zipfile import ZipFile
 
 import jinja2
 
+from gapper.core.interning import InternReport
 from gapper.core.tester import Tester
 from gapper.gradescope.vars import DEFAULT_TESTER_PICKLE_NAME
 
@@ -28,6 +29,7 @@ class AutograderZipper:
         }
         self.ignore_folder = {"__pycache__"}
         self.ignore_files = {".pyc", ".DS_Store", ".j2"}
+        self.intern_report: InternReport | None = None
 
     def generate_zip(self, zip_file_path: Path) -> None:
         """Generate the autograder zip file given a save path.
@@ -38,6 +40,7 @@ class AutograderZipper:
             self._copy_gap_package(zip_file)
             self._copy_gs_setup(zip_file)
             self._copy_tester_pickle(zip_file)
+            self._copy_packed_files(zip_file)
 
         _zip_logger.debug(
             f"Completed autograder zip file at {zip_file_path.absolute()}."
@@ -66,11 +69,19 @@ class AutograderZipper:
     def _copy_tester_pickle(self, zip_file: ZipFile) -> None:
         with TemporaryDirectory() as temp_dir:
             path = Path(temp_dir) / DEFAULT_TESTER_PICKLE_NAME
-            self._tester.dump_to(path)
+            self.intern_report = self._tester.dump_to(path)
             zip_file.write(path, arcname=DEFAULT_TESTER_PICKLE_NAME)
 
         _zip_logger.debug("Copied tester pickle into zip file.")
 
+    def _copy_packed_files(self, zip_file: ZipFile) -> None:
+        if self._tester.problem is None:
+            return
+
+        for archive_name, path in self._tester.problem.packed_files.items():
+            zip_file.write(path, arcname=archive_name)
+            _zip_logger.debug(f"Copied {path.absolute()} into zip file.")
+
     def zip_file_path(self, path: Path, zip_file: ZipFile, root: Path) -> None:
         """Zip a file or folder.
 
@@ -0,0 +1,106 @@
+"""Fixtures created by scoped hooks and shared by the tests of their scope."""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, Literal, Tuple
+
+if TYPE_CHECKING:
+    from gapper.core.hook import HookBase
+    from gapper.core.types import HookDataBase
+
+__all__ = ["FixtureScope", "FIXTURE_SCOPES", "FixtureStore", "ScopedHook"]
+
+FixtureScope = Literal["session", "bundle", "test"]
+FIXTURE_SCOPES: Tuple[FixtureScope, ...] = ("session", "bundle", "test")
+
+_fixture_logger = logging.getLogger("gapper.fixtures")
+
+
+class FixtureStore:
+    """The fixtures of the scoped hooks during a run of the tests.
+
+    A session fixture lives until the store is closed at the end of the run. A
+    bundle fixture lives while consecutive tests, such as those of a bundle, use its
+    hook, and is torn down before the first test that does not.
+
+    :ivar values: The values of the fixtures, keyed by the names of their hooks.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty fixture store."""
+        self.values: Dict[str, Any] = {}
+        # keyed by the id of the declared hook, since hooks compare by their gap keywords
+        self._active: Dict[int, Tuple[HookBase, HookBase]] = {}
+
+    def start_test(self, declared: Collection[HookBase]) -> None:
+        """Tear down the bundle fixtures a test does not use, before it runs.
+
+        :param declared: The scoped hooks of the test.
+        """
+        used = {id(hook) for hook in declared}
+        for key, (hook, _) in list(self._active.items()):
+            if hook.scope == "bundle" and key not in used:
+                self._tear_down(key)
+
+    def run(
+        self,
+        declared: HookBase,
+        create: Callable[[], HookBase],
+        data: HookDataBase,
+    ) -> None:
+        """Create the fixture of a scoped hook, unless it is alive already.
+
+        :param declared: The hook declared on the test.
+        :param create: The function creating the hook to run, with context applied.
+        :param data: The data of the test creating the fixture.
+        """
+        if id(declared) in self._active:
+            return
+
+        _fixture_logger.debug("Creating %s fixture %s", declared.scope, declared.name)
+        hook = create()
+        hook.run(data)
+        self._active[id(declared)] = (declared, hook)
+        self.values[declared.name] = hook.value
+
+    def close(self) -> None:
+        """Tear down all the fixtures, the most recent first."""
+        for key in reversed(list(self._active)):
+            self._tear_down(key)
+
+    def _tear_down(self, key: int) -> None:
+        declared, hook = self._active.pop(key)
+        _fixture_logger.debug(
+            "Tearing down %s fixture %s", declared.scope, declared.name
+        )
+        self.values.pop(declared.name, None)
+        hook.tear_down()
+
+
+class ScopedHook:
+    """The hook of a test standing for a fixture kept in a store."""
+
+    def __init__(
+        self, declared: HookBase, create: Callable[[], HookBase], store: FixtureStore
+    ) -> None:
+        """Create a scoped hook.
+
+        :param declared: The hook declared on the test.
+        :param create: The function creating the hook to run, with context applied.
+        :param store: The store keeping the fixture.
+        """
+        self.declared = declared
+        self._create = create
+        self._store = store
+
+    @property
+    def name(self) -> str:
+        """The name of the fixture."""
+        return self.declared.name
+
+    def run(self, data: HookDataBase) -> None:
+        """Create the fixture if it is not alive."""
+        self._store.run(self.declared, self._create, data)
+
+    def tear_down(self) -> None:
+        """Do nothing, since the store tears the fixture down at the end of its scope."""
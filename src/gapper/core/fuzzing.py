@@ -0,0 +1,703 @@
+"""Time-budgeted differential fuzzing of submissions against the solution."""
+from __future__ import annotations
+
+import inspect
+import logging
+import math
+import string
+import types
+import typing
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from random import Random
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+)
+
+from gapper.core.errors import InternalError
+
+if TYPE_CHECKING:
+    from gapper.core.problem import Problem
+
+__all__ = [
+    "Strategy",
+    "Fuzzer",
+    "FuzzReport",
+    "ShrinkResult",
+    "fuzz",
+    "from_type",
+    "infer_strategies",
+    "shrink_failure",
+    "as_strategy",
+    "integers",
+    "floats",
+    "booleans",
+    "text",
+    "lists",
+    "sets",
+    "tuples",
+    "dicts",
+    "sampled_from",
+    "none_or",
+]
+
+_fuzzing_logger = logging.getLogger("gapper.fuzzing")
+
+FuzzInput = Tuple[Tuple[Any, ...], Dict[str, Any]]
+DivergenceCheckFn = Callable[[Tuple[Any, ...], Dict[str, Any]], str | None]
+
+
+class Strategy[T](ABC):
+    """A strategy generating random values of a kind and shrinking them."""
+
+    @abstractmethod
+    def generate(self, rng: Random) -> T:
+        """Generate a random value.
+
+        :param rng: The random number generator to draw from.
+        """
+        ...
+
+    def shrink(self, value: T) -> Iterator[T]:
+        """Yield simpler variants of the value, simplest first.
+
+        :param value: The value to be shrunk.
+        """
+        yield from ()
+
+
+@dataclass(frozen=True)
+class _Integers(Strategy[int]):
+    min_value: int
+    max_value: int
+
+    def generate(self, rng: Random) -> int:
+        if rng.random() < 0.2:
+            return rng.choice(self._edges())
+        return rng.randint(self.min_value, self.max_value)
+
+    def _edges(self) -> List[int]:
+        return [
+            v
+            for v in (self.min_value, self.max_value, 0, 1, -1)
+            if self.min_value <= v <= self.max_value
+        ]
+
+    def _target(self) -> int:
+        return min(max(0, self.min_value), self.max_value)
+
+    def shrink(self, value: int) -> Iterator[int]:
+        target = self._target()
+        if value == target:
+            return
+
+        yield target
+        step = value - target
+        while abs(step) > 1:
+            step //= 2
+            yield value - step
+
+
+@dataclass(frozen=True)
+class _Floats(Strategy[float]):
+    min_value: float
+    max_value: float
+
+    def generate(self, rng: Random) -> float:
+        if rng.random() < 0.2:
+            return rng.choice(
+                [
+                    v
+                    for v in (self.min_value, self.max_value, 0.0, 1.0, -1.0)
+                    if self.min_value <= v <= self.max_value
+                ]
+            )
+        return rng.uniform(self.min_value, self.max_value)
+
+    def shrink(self, value: float) -> Iterator[float]:
+        target = min(max(0.0, self.min_value), self.max_value)
+        for candidate in (target, float(math.trunc(value)), value / 2):
+            if candidate != value and self.min_value <= candidate <= self.max_value:
+                yield candidate
+
+
+@dataclass(frozen=True)
+class _Booleans(Strategy[bool]):
+    def generate(self, rng: Random) -> bool:
+        return rng.random() < 0.5
+
+    def shrink(self, value: bool) -> Iterator[bool]:
+        if value:
+            yield False
+
+
+@dataclass(frozen=True)
+class _SampledFrom[T](Strategy[T]):
+    values: Tuple[T, ...]
+
+    def generate(self, rng: Random) -> T:
+        return rng.choice(self.values)
+
+    def shrink(self, value: T) -> Iterator[T]:
+        for candidate in self.values:
+            if candidate == value:
+                return
+            yield candidate
+
+
+@dataclass(frozen=True)
+class _NoneOr[T](Strategy[T | None]):
+    inner: Strategy[T]
+
+    def generate(self, rng: Random) -> T | None:
+        if rng.random() < 0.2:
+            return None
+        return self.inner.generate(rng)
+
+    def shrink(self, value: T | None) -> Iterator[T | None]:
+        if value is not None:
+            yield None
+            yield from self.inner.shrink(value)
+
+
+def _draw_size(rng: Random, min_size: int, max_size: int) -> int:
+    """Draw a collection size, favoring small sizes."""
+    if rng.random() < 0.1:
+        return min_size
+    return min(min_size + int(rng.expovariate(0.2)), max_size)
+
+
+def _shrink_sequence[T](
+    value: Sequence[T], min_size: int, elements: Strategy[T]
+) -> Iterator[List[T]]:
+    """Shrink a sequence by dropping chunks of it, then by shrinking its elements."""
+    items = list(value)
+    chunk = len(items) - min_size
+    while chunk > 0:
+        for start in range(0, len(items) - chunk + 1, chunk):
+            yield items[:start] + items[start + chunk :]
+        chunk //= 2
+
+    for index, item in enumerate(items):
+        for candidate in elements.shrink(item):
+            yield items[:index] + [candidate] + items[index + 1 :]
+
+
+@dataclass(frozen=True)
+class _Text(Strategy[str]):
+    alphabet: str
+    min_size: int
+    max_size: int
+
+    def generate(self, rng: Random) -> str:
+        size = _draw_size(rng, self.min_size, self.max_size)
+        return "".join(rng.choice(self.alphabet) for _ in range(size))
+
+    def shrink(self, value: str) -> Iterator[str]:
+        for candidate in _shrink_sequence(
+            value, self.min_size, _SampledFrom(tuple(self.alphabet))
+        ):
+            yield "".join(candidate)
+
+
+@dataclass(frozen=True)
+class _Lists[T](Strategy[List[T]]):
+    elements: Strategy[T]
+    min_size: int
+    max_size: int
+
+    def generate(self, rng: Random) -> List[T]:
+        size = _draw_size(rng, self.min_size, self.max_size)
+        return [self.elements.generate(rng) for _ in range(size)]
+
+    def shrink(self, value: List[T]) -> Iterator[List[T]]:
+        yield from _shrink_sequence(value, self.min_size, self.elements)
+
+
+@dataclass(frozen=True)
+class _Sets[T: Hashable](Strategy[set[T]]):
+    elements: Strategy[T]
+    max_size: int
+
+    def generate(self, rng: Random) -> set[T]:
+        size = _draw_size(rng, 0, self.max_size)
+        return {self.elements.generate(rng) for _ in range(size)}
+
+    def shrink(self, value: set[T]) -> Iterator[set[T]]:
+        for candidate in _shrink_sequence(sorted(value, key=repr), 0, _Nothing()):
+            yield set(candidate)
+
+
+@dataclass(frozen=True)
+class _Tuples(Strategy[Tuple[Any, ...]]):
+    elements: Tuple[Strategy[Any], ...]
+
+    def generate(self, rng: Random) -> Tuple[Any, ...]:
+        return tuple(element.generate(rng) for element in self.elements)
+
+    def shrink(self, value: Tuple[Any, ...]) -> Iterator[Tuple[Any, ...]]:
+        for index, element in enumerate(self.elements):
+            for candidate in element.shrink(value[index]):
+                yield value[:index] + (candidate,) + value[index + 1 :]
+
+
+@dataclass(frozen=True)
+class _TupleOf(Strategy[Tuple[Any, ...]]):
+    items: Strategy[List[Any]]
+
+    def generate(self, rng: Random) -> Tuple[Any, ...]:
+        return tuple(self.items.generate(rng))
+
+    def shrink(self, value: Tuple[Any, ...]) -> Iterator[Tuple[Any, ...]]:
+        for candidate in self.items.shrink(list(value)):
+            yield tuple(candidate)
+
+
+@dataclass(frozen=True)
+class _Dicts[K: Hashable, V](Strategy[Dict[K, V]]):
+    keys: Strategy[K]
+    values: Strategy[V]
+    max_size: int
+
+    def generate(self, rng: Random) -> Dict[K, V]:
+        size = _draw_size(rng, 0, self.max_size)
+        return {self.keys.generate(rng): self.values.generate(rng) for _ in range(size)}
+
+    def shrink(self, value: Dict[K, V]) -> Iterator[Dict[K, V]]:
+        for candidate in _shrink_sequence(list(value.items()), 0, _Nothing()):
+            yield dict(candidate)
+        for key, item in value.items():
+            for candidate in self.values.shrink(item):
+                yield {**value, key: candidate}
+
+
+@dataclass(frozen=True)
+class _Nothing(Strategy[Any]):
+    """A placeholder strategy for elements that are not shrunk in place."""
+
+    def generate(self, rng: Random) -> Any:
+        raise InternalError("The placeholder strategy cannot generate values.")
+
+
+@dataclass(frozen=True)
+class _Custom[T](Strategy[T]):
+    fn: Callable[[Random], T]
+
+    def generate(self, rng: Random) -> T:
+        return self.fn(rng)
+
+    def __repr__(self) -> str:
+        return f"_Custom({getattr(self.fn, '__qualname__', type(self.fn).__name__)})"
+
+
+def integers(min_value: int = -1000, max_value: int = 1000) -> Strategy[int]:
+    """Generate integers in the closed range, shrinking towards 0.
+
+    :param min_value: The smallest integer generated.
+    :param max_value: The largest integer generated.
+    """
+    if min_value > max_value:
+        raise ValueError("min_value cannot be greater than max_value.")
+    return _Integers(min_value, max_value)
+
+
+def floats(min_value: float = -1e6, max_value: float = 1e6) -> Strategy[float]:
+    """Generate finite floats in the closed range, shrinking towards 0.
+
+    :param min_value: The smallest float generated.
+    :param max_value: The largest float generated.
+    """
+    if min_value > max_value:
+        raise ValueError("min_value cannot be greater than max_value.")
+    return _Floats(min_value, max_value)
+
+
+def booleans() -> Strategy[bool]:
+    """Generate booleans, shrinking towards False."""
+    return _Booleans()
+
+
+def text(
+    alphabet: str = string.ascii_letters + string.digits + " ",
+    min_size: int = 0,
+    max_size: int = 20,
+) -> Strategy[str]:
+    """Generate strings from the alphabet, shrinking towards shorter strings.
+
+    :param alphabet: The characters to draw from.
+    :param min_size: The minimum length of the strings.
+    :param max_size: The maximum length of the strings.
+    """
+    if not alphabet:
+        raise ValueError("alphabet cannot be empty.")
+    return _Text(alphabet, min_size, max_size)
+
+
+def lists[T](
+    elements: Strategy[T], min_size: int = 0, max_size: int = 20
+) -> Strategy[List[T]]:
+    """Generate lists of elements, shrinking towards shorter lists.
+
+    :param elements: The strategy of the elements.
+    :param min_size: The minimum length of the lists.
+    :param max_size: The maximum length of the lists.
+    """
+    return _Lists(as_strategy(elements), min_size, max_size)
+
+
+def sets[T: Hashable](elements: Strategy[T], max_size: int = 20) -> Strategy[set[T]]:
+    """Generate sets of elements, shrinking towards smaller sets.
+
+    :param elements: The strategy of the elements.
+    :param max_size: The maximum number of elements drawn.
+    """
+    return _Sets(as_strategy(elements), max_size)
+
+
+def tuples(*elements: Strategy[Any]) -> Strategy[Tuple[Any, ...]]:
+    """Generate fixed-length tuples with one strategy per position.
+
+    :param elements: The strategies of the positions.
+    """
+    return _Tuples(tuple(as_strategy(element) for element in elements))
+
+
+def dicts[K: Hashable, V](
+    keys: Strategy[K], values: Strategy[V], max_size: int = 10
+) -> Strategy[Dict[K, V]]:
+    """Generate dicts, shrinking towards smaller dicts.
+
+    :param keys: The strategy of the keys.
+    :param values: The strategy of the values.
+    :param max_size: The maximum number of entries drawn.
+    """
+    return _Dicts(as_strategy(keys), as_strategy(values), max_size)
+
+
+def sampled_from[T](values: Sequence[T]) -> Strategy[T]:
+    """Pick one of the values, shrinking towards the earlier ones.
+
+    :param values: The values to pick from.
+    """
+    if not values:
+        raise ValueError("values cannot be empty.")
+    return _SampledFrom(tuple(values))
+
+
+def none_or[T](inner: Strategy[T]) -> Strategy[T | None]:
+    """Generate None or a value of the inner strategy, shrinking towards None.
+
+    :param inner: The strategy of the values that are not None.
+    """
+    return _NoneOr(as_strategy(inner))
+
+
+def as_strategy(strategy: Strategy[Any] | Callable[[Random], Any]) -> Strategy[Any]:
+    """Wrap a custom generating function into a strategy that does not shrink.
+
+    :param strategy: A strategy, or a function taking a random.Random and returning
+        a value.
+    """
+    if isinstance(strategy, Strategy):
+        return strategy
+    if callable(strategy):
+        return _Custom(strategy)
+    raise TypeError(f"{strategy} is neither a strategy nor a generating function.")
+
+
+def from_type(tp: Any) -> Strategy[Any]:
+    """Create a strategy from a type annotation.
+
+    Supported are int, float, bool, str, list, set, tuple, dict, Literal, and
+    optional (``X | None``) annotations, nested arbitrarily.
+
+    :param tp: The type annotation.
+    :raises TypeError: If the annotation is not supported.
+    """
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+
+    if tp is int:
+        return integers()
+    elif tp is float:
+        return floats()
+    elif tp is bool:
+        return booleans()
+    elif tp is str:
+        return text()
+    elif origin is typing.Literal:
+        return sampled_from(args)
+    elif origin in (types.UnionType, typing.Union):
+        non_none = [arg for arg in args if arg is not type(None)]
+        if len(non_none) == 1 and len(args) == 2:
+            return none_or(from_type(non_none[0]))
+    elif origin is list or tp is list:
+        return lists(from_type(args[0]) if args else integers())
+    elif origin is set or tp is set:
+        return sets(from_type(args[0]) if args else integers())
+    elif origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return _TupleOf(lists(from_type(args[0])))
+        return tuples(*(from_type(arg) for arg in args))
+    elif origin is dict or tp is dict:
+        if args:
+            return dicts(from_type(args[0]), from_type(args[1]))
+        return dicts(text(), integers())
+
+    raise TypeError(f"Cannot create a fuzzing strategy for the type {tp}.")
+
+
+def infer_strategies(problem: Problem) -> Tuple[Strategy[Any], ...]:
+    """Infer the strategies of the required positional arguments of the solution.
+
+    :param problem: The problem whose solution is inspected.
+    :raises InternalError: If the strategies cannot be inferred.
+    """
+    if problem.config.mock_input or problem.config.is_script:
+        raise InternalError(
+            "Cannot infer fuzzing strategies for input-mocking problems or scripts."
+        )
+
+    try:
+        signature = inspect.signature(problem.solution)
+        hints = typing.get_type_hints(
+            problem.solution.__init__
+            if isinstance(problem.solution, type)
+            else problem.solution
+        )
+        return tuple(
+            from_type(hints[name])
+            for name, parameter in signature.parameters.items()
+            if parameter.kind
+            in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+            and parameter.default is parameter.empty
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        raise InternalError(
+            f"Cannot infer fuzzing strategies from the solution: {e}"
+        ) from e
+
+
+@dataclass
+class ShrinkResult:
+    """The result of minimizing a failing input.
+
+    :param failure: The minimized input the submission still diverges on.
+    :param message: The reason of the divergence on the minimized input.
+    :param shrinks: The number of successful shrinking steps.
+    :param tries: The number of candidates tried.
+    """
+
+    failure: FuzzInput
+    message: str
+    shrinks: int = 0
+    tries: int = 0
+
+
+def shrink_failure(
+    failure: FuzzInput,
+    message: str,
+    arg_strategies: Tuple[Strategy[Any], ...],
+    kwarg_strategies: Dict[str, Strategy[Any]],
+    diverges: DivergenceCheckFn,
+    max_tries: int,
+    deadline: float | None = None,
+) -> ShrinkResult:
+    """Greedily replace each argument with a simpler one that still diverges.
+
+    Shrinking stops at the deadline, keeping the simplest input found so far.
+
+    :param failure: The input the submission diverges on.
+    :param message: The reason of the divergence.
+    :param arg_strategies: The strategies the positional arguments are drawn from.
+    :param kwarg_strategies: The strategies the keyword arguments are drawn from.
+    :param diverges: The function comparing the submission with the solution.
+    :param max_tries: The maximum number of candidates tried.
+    :param deadline: The perf_counter() time to stop shrinking at, if any.
+    """
+    result = ShrinkResult(failure, message)
+    improved = True
+
+    while improved and result.tries < max_tries:
+        improved = False
+        for candidate in _input_candidates(
+            result.failure, arg_strategies, kwarg_strategies
+        ):
+            if deadline is not None and perf_counter() >= deadline:
+                return result
+
+            result.tries += 1
+            if (new_message := diverges(*candidate)) is not None:
+                result.failure, result.message = candidate, new_message
+                result.shrinks += 1
+                improved = True
+                break
+            if result.tries >= max_tries:
+                break
+
+    return result
+
+
+def _input_candidates(
+    failure: FuzzInput,
+    arg_strategies: Tuple[Strategy[Any], ...],
+    kwarg_strategies: Dict[str, Strategy[Any]],
+) -> Iterator[FuzzInput]:
+    """Yield the inputs with exactly one argument shrunk."""
+    args, kwargs = failure
+    for index, strategy in enumerate(arg_strategies):
+        for candidate in strategy.shrink(args[index]):
+            yield args[:index] + (candidate,) + args[index + 1 :], kwargs
+
+    for name, strategy in kwarg_strategies.items():
+        for candidate in strategy.shrink(kwargs[name]):
+            yield args, {**kwargs, name: candidate}
+
+
+@dataclass
+class FuzzReport:
+    """The result of fuzzing a submission.
+
+    :param examples: The number of inputs tried before stopping.
+    :param elapsed: The seconds spent generating and trying inputs.
+    :param failure: The minimized input the submission diverges on, if any.
+    :param message: The reason of the divergence on the minimized input.
+    :param shrinks: The number of successful shrinking steps.
+    """
+
+    examples: int = 0
+    elapsed: float = 0.0
+    failure: FuzzInput | None = None
+    message: str | None = None
+    shrinks: int = 0
+
+
+@dataclass(frozen=True)
+class Fuzzer:
+    """The fuzzing specification of a test case.
+
+    :param arg_strategies: The strategies of the positional arguments. None means
+        inferring them from the annotations of the solution.
+    :param kwarg_strategies: The strategies of the keyword arguments.
+    :param budget: The seconds spent trying inputs.
+    :param max_examples: The maximum number of inputs tried, if any.
+    :param seed: The seed of the random inputs. None means a fresh seed every run.
+    :param max_shrinks: The maximum number of candidates tried when minimizing.
+    """
+
+    arg_strategies: Tuple[Strategy[Any], ...] | None = None
+    kwarg_strategies: Dict[str, Strategy[Any]] = field(default_factory=dict)
+    budget: float = 1.0
+    max_examples: int | None = None
+    seed: int | None = 0
+    max_shrinks: int = 500
+
+    def resolve_strategies(
+        self, problem: Problem
+    ) -> Tuple[Tuple[Strategy[Any], ...], Dict[str, Strategy[Any]]]:
+        """Return the argument strategies, inferring them from the solution if needed.
+
+        :param problem: The problem whose solution is fuzzed.
+        :raises InternalError: If the strategies cannot be inferred.
+        """
+        if self.arg_strategies is not None:
+            return self.arg_strategies, self.kwarg_strategies
+
+        return infer_strategies(problem), self.kwarg_strategies
+
+    def run(self, problem: Problem, diverges: DivergenceCheckFn) -> FuzzReport:
+        """Try random inputs until the budget runs out or the check finds a divergence.
+
+        :param problem: The problem whose solution is fuzzed.
+        :param diverges: The function comparing the submission with the solution on an
+            input. It returns the reason of the divergence, or None if they agree.
+        """
+        arg_strategies, kwarg_strategies = self.resolve_strategies(problem)
+        rng = Random(self.seed)
+        report = FuzzReport()
+
+        start = perf_counter()
+        while perf_counter() - start < self.budget and (
+            self.max_examples is None or report.examples < self.max_examples
+        ):
+            args = tuple(strategy.generate(rng) for strategy in arg_strategies)
+            kwargs = {
+                name: strategy.generate(rng)
+                for name, strategy in kwarg_strategies.items()
+            }
+            report.examples += 1
+
+            if (message := diverges(args, kwargs)) is not None:
+                _fuzzing_logger.debug(f"Divergence found on {args}, {kwargs}")
+                shrunk = shrink_failure(
+                    (args, kwargs),
+                    message,
+                    arg_strategies,
+                    kwarg_strategies,
+                    diverges,
+                    self.max_shrinks,
+                    start + self.budget,
+                )
+                report.failure, report.message = shrunk.failure, shrunk.message
+                report.shrinks = shrunk.shrinks
+                break
+
+        report.elapsed = perf_counter() - start
+        _fuzzing_logger.debug(f"Fuzzing finished: {report}")
+        return report
+
+
+def fuzz(
+    *strategies: Strategy[Any] | Callable[[Random], Any],
+    budget: float = 1.0,
+    max_examples: int | None = None,
+    seed: int | None = 0,
+    max_shrinks: int = 500,
+    **kw_strategies: Strategy[Any] | Callable[[Random], Any],
+) -> Fuzzer:
+    """Create the fuzzing specification used by the gap_fuzz keyword.
+
+    The test case compares the submission with the solution on random inputs for a
+    fixed time budget, stopping at the first input they disagree on. That input is
+    minimized before being reported.
+
+        @test_case(gap_fuzz=fuzz(integers(0, 100), lists(integers()), budget=2))
+        @test_case(gap_fuzz=fuzz())  # infer the strategies from the annotations
+        @problem()
+        def solve(n: int, xs: list[int]) -> int: ...
+
+    :param strategies: The strategies of the positional arguments. A function taking
+        a random.Random and returning a value can be used as a custom strategy. When
+        no strategy is given, they are inferred from the annotations of the solution.
+    :param budget: The seconds spent trying inputs.
+    :param max_examples: The maximum number of inputs tried, if any.
+    :param seed: The seed of the random inputs. None means a fresh seed every run.
+    :param max_shrinks: The maximum number of candidates tried when minimizing.
+    :param kw_strategies: The strategies of the keyword arguments.
+    """
+    if budget <= 0:
+        raise ValueError("budget must be positive.")
+
+    return Fuzzer(
+        arg_strategies=(
+            tuple(as_strategy(strategy) for strategy in strategies)
+            if strategies or kw_strategies
+            else None
+        ),
+        kwarg_strategies={
+            name: as_strategy(strategy) for name, strategy in kw_strategies.items()
+        },
+        budget=budget,
+        max_examples=max_examples,
+        seed=seed,
+        max_shrinks=max_shrinks,
+    )
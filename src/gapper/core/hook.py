@@ -4,9 +4,10 @@ import abc
 import enum
 import inspect
 from collections import defaultdict
-from typing import TYPE_CHECKING, Callable, ClassVar, Dict, Generator, List
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Generator, List, Tuple
 
 from gapper.core.errors import InternalError, TestFailedError
+from gapper.core.fixtures import FixtureScope
 from gapper.core.test_parameter import ParamExtractor
 from gapper.core.test_result import TestResult
 from gapper.core.types import HookDataBase
@@ -29,11 +30,13 @@ HookFnReturnType = Generator | None
 
 class HookBase[**P, FnType: Callable[P, HookFnReturnType]](ParamExtractor):
     _hook_type: ClassVar[HookTypes]
+    _allowed_scopes: ClassVar[Tuple[FixtureScope, ...]] = ()
 
     def __init__(
         self,
         hook_fn: FnType,
         as_test_case: bool = True,
+        scope: FixtureScope | None = None,
         **kwargs,
     ) -> None:
         """
@@ -45,13 +48,30 @@ class HookBase[**P, FnType: Callable[P, HookFnReturnType]](ParamExtractor):
 
             If this is set to False, it will only have side effects and will not be seen
             as an entry in gradescope.
+        :param scope: The scope of the fixture the hook creates, or None if it is not
+            a fixture. The fixture is the value the hook function returns or yields
+            first, and it is passed to the tests of its scope by the name of the
+            hook function.
         :param kwargs: gap keyword parameters.
         """
         super().__init__(kwargs)
 
+        if scope is not None and scope not in self._allowed_scopes:
+            raise ValueError(
+                f"The scope of a {self._hook_type.value} hook must be one of "
+                f"{', '.join(map(repr, self._allowed_scopes))}, not {scope!r}."
+            )
+
         self.hook_fn = hook_fn
         self.as_test_case = as_test_case
+        self.scope = scope
         self.hook_fn_res: HookFnReturnType | None = None
+        self.value: Any = None
+
+    @property
+    def name(self) -> str:
+        """The name of the hook function, which also names its fixture."""
+        return self.hook_fn.__name__
 
     def __call__(self, problem: Problem) -> Problem:
         """Add the post test to the problem.
@@ -106,16 +126,18 @@ class HookBase[**P, FnType: Callable[P, HookFnReturnType]](ParamExtractor):
 
     def _run(self, *args: P.args, **kwargs: P.kwargs) -> None:
         self.hook_fn_res = self.hook_fn(*args, **kwargs)
+        if not inspect.isgenerator(self.hook_fn_res):
+            self.value = self.hook_fn_res
         self.process_generator()
 
     def __repr__(self) -> str:
-        return f"{type(self)}(hook_fn={self.hook_fn}, as_test_case={self.as_test_case}, **{self.param_info})"
+        return f"{type(self)}(hook_fn={self.hook_fn}, as_test_case={self.as_test_case}, scope={self.scope}, **{self.param_info})"
 
     def process_generator(self) -> None:
         """Process the generator if the hook function returns a generator."""
         if inspect.isgenerator(self.hook_fn_res):
             try:
-                next(self.hook_fn_res)
+                self.value = next(self.hook_fn_res)
             except Exception as e:
                 raise InternalError(
                     f"Facing error running {self._hook_type} hook"
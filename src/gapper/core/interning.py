@@ -0,0 +1,138 @@
+"""Content-addressed interning of equal test arguments before the tester is pickled."""
+from __future__ import annotations
+
+import hashlib
+import pickle
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple
+
+if TYPE_CHECKING:
+    from gapper.core.problem import Problem
+
+__all__ = ["InternReport", "intern_test_arguments"]
+
+
+@dataclass
+class InternReport:
+    """The savings of interning the test arguments of a problem.
+
+    The savings are measured by pickling and loading the duplicates that are
+    replaced, so they are close to, but not exactly, the savings of the tester pickle.
+
+    :param interned_values: The number of argument values replaced by an equal one.
+    :param pickle_bytes_saved: The pickle size of the replaced values.
+    :param load_seconds_saved: The time to load the replaced values from the pickle.
+    :param memory_bytes_saved: The memory taken by the replaced values once loaded.
+    """
+
+    interned_values: int = 0
+    pickle_bytes_saved: int = 0
+    load_seconds_saved: float = 0.0
+    memory_bytes_saved: int = 0
+
+    def format(self) -> str:
+        """Format the savings."""
+        return (
+            f"Interned {self.interned_values} duplicate test arguments, saving "
+            f"{self.pickle_bytes_saved / 1024:.1f} KiB of pickle, "
+            f"{self.load_seconds_saved * 1000:.1f} ms of load time, and "
+            f"{self.memory_bytes_saved / 1024:.1f} KiB of memory."
+        )
+
+
+def intern_test_arguments(problem: Problem, min_size: int = 1024) -> InternReport:
+    """Make the test cases of a problem share one object for each distinct large argument.
+
+    Pickle only stores an object once if it is referenced many times, but equal
+    objects created separately are stored separately. Arguments, keyword arguments,
+    and gap_expect values whose pickle is at least min_size bytes are hashed, and
+    the ones with the same content are replaced by the first one seen in another test
+    case. Sharing them is safe because the arguments are deep-copied before every
+    run, but an object is never shared within one test case, since the copy would
+    keep the aliasing of its arguments and gap_expect. Pipeline, gap_override_test,
+    and hooked cases are skipped since they use their arguments directly.
+
+    :param problem: The problem whose test cases are interned.
+    :param min_size: The minimum pickle size of the values to intern.
+    """
+    # the equal objects of a content, since one test case may need several of them
+    canonical: Dict[bytes, List[Any]] = {}
+    duplicates: Counter[bytes] = Counter()
+    blobs: Dict[bytes, bytes] = {}
+
+    def intern(value: Any, used: Set[int]) -> Any:
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return value
+        if len(blob) < min_size:
+            return value
+
+        key = hashlib.blake2b(blob, digest_size=16).digest()
+        candidates = canonical.setdefault(key, [])
+        original = next((obj for obj in candidates if id(obj) not in used), None)
+        if original is None:
+            if all(obj is not value for obj in candidates):
+                candidates.append(value)
+            original = value
+        elif original is not value:
+            duplicates[key] += 1
+            blobs[key] = blob
+        used.add(id(original))
+        return original
+
+    for test_param in problem.stored_test_params:
+        param_info = test_param.param_info
+        if (
+            param_info.gap_is_pipeline
+            or param_info.gap_override_test is not None
+            or param_info.gap_pre_hooks is not None
+            or param_info.gap_post_hooks is not None
+        ):
+            continue
+
+        used: Set[int] = set()
+        args = tuple(intern(arg, used) for arg in test_param.args)
+        if any(new is not old for new, old in zip(args, test_param.args)):
+            test_param.args = args
+
+        kwargs = {key: intern(value, used) for key, value in test_param.kwargs.items()}
+        if any(kwargs[key] is not value for key, value in test_param.kwargs.items()):
+            test_param.kwargs = kwargs
+
+        if param_info.gap_expect is not None:
+            expect = intern(param_info.gap_expect, used)
+            if expect is not param_info.gap_expect:
+                test_param.update_gap_kwargs(gap_expect=expect)
+
+    report = InternReport()
+    for key, count in duplicates.items():
+        seconds, memory = _measure_load(blobs[key])
+        report.interned_values += count
+        report.pickle_bytes_saved += len(blobs[key]) * count
+        report.load_seconds_saved += seconds * count
+        report.memory_bytes_saved += memory * count
+
+    return report
+
+
+def _measure_load(blob: bytes) -> Tuple[float, int]:
+    """Measure the time and the memory taken to load a pickled value."""
+    start = perf_counter()
+    pickle.loads(blob)
+    seconds = perf_counter() - start
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    value = pickle.loads(blob)
+    memory = tracemalloc.get_traced_memory()[0] - before
+    del value
+    if not was_tracing:
+        tracemalloc.stop()
+
+    return seconds, max(memory, 0)
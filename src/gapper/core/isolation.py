@@ -0,0 +1,163 @@
+"""Running tests in forked processes whose output is captured through pipes."""
+from __future__ import annotations
+
+import os
+import select
+import signal
+import sys
+import traceback
+from time import monotonic
+from typing import Callable, List, Tuple
+
+import dill
+
+from gapper.core.errors import InternalError, IsolatedProcessError
+from gapper.core.utils import PIPE_DRAIN_TIMEOUT, PipeDrain, SpillingTextIO
+
+__all__ = ["STDERR_LIMIT", "ISOLATED_TEST_TIMEOUT", "run_forked"]
+
+STDERR_LIMIT = 64 * 1024
+"""The number of characters of the stderr of an isolated test that are kept."""
+
+ISOLATED_TEST_TIMEOUT = 300.0
+"""The seconds an isolated test can run before its process is killed."""
+
+_lingering_drains: List[PipeDrain] = []
+"""The drains still reading pipes that a grandchild of an earlier test kept open."""
+
+
+def run_forked[T](
+    fn: Callable[[], T],
+    stderr_limit: int = STDERR_LIMIT,
+    timeout: float = ISOLATED_TEST_TIMEOUT,
+) -> Tuple[T, str]:
+    """Run a function in a forked child process and return its result.
+
+    The file descriptors 1 and 2 of the child are redirected into pipes, which are
+    drained by threads of the parent into bounded buffers while the child runs.
+    What the child prints to stdout outside the captures of the tests is discarded.
+
+    The drains of earlier calls are joined before forking, so the child does not
+    inherit them. Threads the parent started elsewhere, such as those of post_tests
+    hooks, are still alive in the parent at fork time, and only the forking thread
+    exists in the child. A lock they hold stays locked in the child, which then
+    hangs until the timeout kills it.
+
+    :param fn: The function to run. Its result is sent back pickled with dill.
+    :param stderr_limit: The number of characters of the stderr to keep.
+    :param timeout: The seconds the child can run before it is killed.
+    :return: The result of the function and the stderr of the child.
+    :raises IsolatedProcessError: If the child ends without sending a result, or is
+        killed at the timeout.
+    :raises InternalError: If processes cannot be forked on this platform.
+    """
+    if not hasattr(os, "fork"):
+        raise InternalError("Isolated tests need os.fork, which is not available.")
+
+    _join_lingering_drains()
+    stdout_r, stdout_w = os.pipe()
+    stderr_r, stderr_w = os.pipe()
+    result_r, result_w = os.pipe()
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            for fd in (stdout_r, stderr_r, result_r):
+                os.close(fd)
+            status = _run_child(fn, stdout_w, stderr_w, result_w)
+        finally:
+            os._exit(status)
+
+    for fd in (stdout_w, stderr_w, result_w):
+        os.close(fd)
+
+    stderr = SpillingTextIO(hard_limit=stderr_limit)
+    drains = [
+        # the stray stdout fails the zero limit at once and is discarded
+        PipeDrain(stdout_r, SpillingTextIO(hard_limit=0)),
+        PipeDrain(stderr_r, stderr),
+    ]
+    for drain in drains:
+        drain.start()
+
+    payload = _read_until(result_r, monotonic() + timeout)
+    if payload is None:
+        os.kill(pid, signal.SIGKILL)
+    _, status = os.waitpid(pid, 0)
+    for drain in drains:
+        drain.join(PIPE_DRAIN_TIMEOUT)
+        if drain.is_alive():
+            _lingering_drains.append(drain)
+
+    stderr_text = stderr.getvalue()
+    if drains[1].error is not None:
+        stderr_text += "\n... (truncated)"
+    stderr.close()
+
+    if payload is None:
+        raise IsolatedProcessError(
+            f"was killed after running for {timeout:g} seconds", stderr_text
+        )
+    if not payload:
+        raise IsolatedProcessError(_describe_status(status), stderr_text)
+    return dill.loads(payload), stderr_text
+
+
+def _read_until(fd: int, deadline: float) -> bytes | None:
+    """Read a pipe to its end, or return None if the deadline passes first.
+
+    The pipe is closed either way.
+    """
+    chunks = []
+    try:
+        while True:
+            remaining = deadline - monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                return None
+            if not (chunk := os.read(fd, 1 << 16)):
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def _join_lingering_drains() -> None:
+    """Wait for the drains of earlier calls, so the next child does not inherit them."""
+    for drain in _lingering_drains:
+        drain.join(PIPE_DRAIN_TIMEOUT)
+    _lingering_drains[:] = [drain for drain in _lingering_drains if drain.is_alive()]
+
+
+def _run_child[T](
+    fn: Callable[[], T], stdout_fd: int, stderr_fd: int, result_fd: int
+) -> int:
+    """Run the function in the child with its output redirected, and send its result."""
+    os.dup2(stdout_fd, 1)
+    os.dup2(stderr_fd, 2)
+    os.close(stdout_fd)
+    os.close(stderr_fd)
+    sys.stdout = open(1, "w", encoding="utf-8", buffering=1, closefd=False)
+    sys.stderr = open(2, "w", encoding="utf-8", buffering=1, closefd=False)
+
+    try:
+        payload = dill.dumps(fn())
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+    with open(result_fd, "wb") as pipe:
+        pipe.write(payload)
+    return 0
+
+
+def _describe_status(status: int) -> str:
+    code = os.waitstatus_to_exitcode(status)
+    if code < 0:
+        return f"was killed by {signal.Signals(-code).name}"
+    return f"exited with code {code}"
@@ -0,0 +1,143 @@
+"""Files read by the tests at grading time, packed into the autograder zip."""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import mmap
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Tuple
+
+from gapper.core.errors import InternalError
+from gapper.gradescope.vars import AUTOGRADER_SRC, DEFAULT_TEST_DATA_FOLDER
+
+if TYPE_CHECKING:
+    from gapper.core.problem import Problem
+
+__all__ = [
+    "PackedFile",
+    "BinaryInput",
+    "binary_input",
+    "collect_packed_files",
+    "load_binary_inputs",
+]
+
+
+class PackedFile:
+    """A file referenced by the problem, packed into the autograder zip.
+
+    Only the path is pickled with the problem. At grading time, the packed copy in
+    the autograder is used when it exists, and the original path otherwise.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Create a packed file reference.
+
+        :param path: The path to the file. Relative paths are resolved against the
+            folder of the problem file when the test cases are registered.
+        """
+        self.path = Path(path)
+
+    def locate(self, problem: Problem) -> None:
+        """Resolve a relative path against the folder of the problem file.
+
+        :param problem: The problem the file is used in.
+        """
+        if not self.path.is_absolute():
+            self.path = Path(inspect.getfile(problem.solution)).parent / self.path
+
+        if not self.path.is_file():
+            raise FileNotFoundError(f"Test data file {self.path} does not exist.")
+
+    @property
+    def archive_name(self) -> str:
+        """The name of the file in the autograder zip."""
+        digest = hashlib.blake2b(
+            str(self.path.absolute()).encode(), digest_size=4
+        ).hexdigest()
+        return f"{DEFAULT_TEST_DATA_FOLDER}/{digest}_{self.path.name}"
+
+    def resolve_path(self) -> Path:
+        """Return the packed file in the autograder, or the original one."""
+        packed_path = AUTOGRADER_SRC / self.archive_name
+        return packed_path if packed_path.is_file() else self.path
+
+
+class BinaryInput(PackedFile):
+    """A test argument stored in a binary file and memory-mapped read-only when used.
+
+    The file is not read until the test runs, and then only the pages the
+    submission touches are loaded.
+    """
+
+    def __init__(self, path: str | Path, cast: str | None = None) -> None:
+        """Create a binary input.
+
+        :param path: The path to the binary file.
+        :param cast: The struct format to cast the raw bytes to, such as "d" for
+            floats or "q" for integers. Not used for .npy files.
+        """
+        super().__init__(path)
+        self.cast = cast
+
+    def load(self) -> Any:
+        """Memory-map the file read-only.
+
+        A .npy file is loaded as a read-only numpy memmap, which requires numpy.
+        Other files are loaded as a read-only memoryview of their bytes, cast to the
+        cast format if given.
+        """
+        path = self.resolve_path()
+        if path.suffix == ".npy":
+            try:
+                import numpy as np
+            except ImportError as e:
+                raise InternalError(
+                    f"numpy is required to load {path.name}. "
+                    "Please add it to the requirements of the autograder."
+                ) from e
+
+            return np.load(path, mmap_mode="r")
+
+        with open(path, "rb") as f:
+            if path.stat().st_size == 0:
+                view = memoryview(b"")
+            else:
+                view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+        return view.cast(self.cast) if self.cast is not None else view
+
+    def __repr__(self) -> str:
+        """Return the representation of the binary input."""
+        return f"binary_input({self.path.name})"
+
+
+binary_input = BinaryInput
+
+
+def collect_packed_files(values: Iterable[Any]) -> Dict[str, Path]:
+    """Collect the packed files among some test arguments.
+
+    :param values: The arguments to search.
+    """
+    return {
+        value.archive_name: value.path
+        for value in values
+        if isinstance(value, PackedFile)
+    }
+
+
+def load_binary_inputs(
+    args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    """Replace the binary inputs among test arguments with their loaded data.
+
+    :param args: The positional arguments.
+    :param kwargs: The keyword arguments.
+    """
+    return (
+        tuple(arg.load() if isinstance(arg, BinaryInput) else arg for arg in args),
+        {
+            key: value.load() if isinstance(value, BinaryInput) else value
+            for key, value in kwargs.items()
+        },
+    )
@@ -1,5 +1,5 @@
 """The problem module."""
-from .extras import gs_connect
+from .extras import gs_connect, leaderboard
 from .problem_def import Problem, problem
 
-__all__ = ["gs_connect", "problem", "Problem"]
+__all__ = ["gs_connect", "leaderboard", "problem", "Problem"]
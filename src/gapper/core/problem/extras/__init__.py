@@ -3,5 +3,6 @@
 This module contains helpers and decorators for extra problem configuration.
 """
 from .gradescope_connect import gs_connect
+from .leaderboard import leaderboard
 
-__all__ = ["gs_connect"]
+__all__ = ["gs_connect", "leaderboard"]
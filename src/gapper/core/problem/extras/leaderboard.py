@@ -0,0 +1,258 @@
+"""The leaderboard decorator and the benchmarks filling the Gradescope leaderboard."""
+from __future__ import annotations
+
+import logging
+import statistics
+import sys
+import tracemalloc
+from contextlib import redirect_stdout
+from copy import deepcopy
+from dataclasses import dataclass, field
+from io import TextIOBase
+from time import perf_counter
+from types import CodeType
+from typing import TYPE_CHECKING, Any, Callable, List, Literal
+
+from gapper.core.packed_files import BinaryInput
+from gapper.core.profiler import submission_source_files
+from gapper.core.test_parameter import TestParam
+from gapper.core.utils import mock_stdin
+from gapper.gradescope.datatypes.gradescope_output import GradescopeLeaderboardEntry
+
+if TYPE_CHECKING:
+    from gapper.core.problem import Problem
+
+__all__ = [
+    "LeaderboardMetric",
+    "MetricType",
+    "leaderboard",
+    "run_leaderboard",
+]
+
+_leaderboard_logger = logging.getLogger("gapper.core.problem.extras.leaderboard")
+
+MetricType = Literal["runtime", "memory", "operations"]
+OrderType = Literal["asc", "desc"]
+
+
+class _NullWriter(TextIOBase):
+    """A text sink swallowing everything printed during benchmarks."""
+
+    def write(self, s: str) -> int:
+        return len(s)
+
+
+@dataclass(frozen=True)
+class LeaderboardMetric:
+    """A leaderboard column measured on the submission.
+
+    :param name: The name of the leaderboard column.
+    :param bench_input: The parameter the submission is benchmarked with.
+    :param metric: What to measure. "runtime" is the wall time in seconds, "memory" is
+        the peak memory allocated in bytes, and "operations" is the number of Python
+        lines executed in the files of the submission. A callable receiving the submission can be used for custom
+        metrics.
+    :param order: The order of the leaderboard column. By default, the built-in
+        metrics rank lower values higher, and custom metrics rank higher values higher.
+    :param repeat: The number of measured runs. The median is reported.
+    :param warmup: The number of unmeasured runs before the measured ones.
+    """
+
+    name: str
+    bench_input: TestParam = field(default_factory=TestParam)
+    metric: MetricType | Callable[[Any], float] = "runtime"
+    order: OrderType | None = None
+    repeat: int = 5
+    warmup: int = 1
+
+    @property
+    def resolved_order(self) -> OrderType:
+        """The order of the leaderboard column, with the default filled in."""
+        if self.order is not None:
+            return self.order
+        return "desc" if callable(self.metric) else "asc"
+
+    def measure(self, problem: Problem, submission: Any) -> float:
+        """Measure the submission and return the median of the measured runs.
+
+        :param problem: The problem the submission is solving.
+        :param submission: The submission to be measured.
+        """
+        for _ in range(self.warmup):
+            self._measure_once(problem, submission)
+
+        return statistics.median(
+            self._measure_once(problem, submission) for _ in range(self.repeat)
+        )
+
+    def _measure_once(self, problem: Problem, submission: Any) -> float:
+        if callable(self.metric):
+            return self.metric(submission)
+
+        args = deepcopy(self.bench_input.args)
+        kwargs = deepcopy(self.bench_input.kwargs)
+
+        match self.metric:
+            case "runtime":
+                start = perf_counter()
+                _call_submission(problem, submission, args, kwargs)
+                return perf_counter() - start
+            case "memory":
+                return _measure_peak_memory(problem, submission, args, kwargs)
+            case "operations":
+                return _count_operations(problem, submission, args, kwargs)
+            case _:
+                raise ValueError(f"Unknown leaderboard metric {self.metric}")
+
+
+def _call_submission(
+    problem: Problem, submission: Any, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Any:
+    """Call the submission with the inputs, discarding what it prints."""
+    with redirect_stdout(_NullWriter()):
+        if problem.config.mock_input:
+            with mock_stdin(args):
+                return submission()
+        else:
+            return submission(*args, **kwargs)
+
+
+def _measure_peak_memory(
+    problem: Problem, submission: Any, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> int:
+    was_tracing = tracemalloc.is_tracing()
+    if was_tracing:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+    else:
+        tracemalloc.start()
+        baseline = 0
+
+    try:
+        _call_submission(problem, submission, args, kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    return peak - baseline
+
+
+def _count_operations(
+    problem: Problem, submission: Any, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> int:
+    source_files = set(submission_source_files(submission))
+    if not source_files:
+        raise ValueError("Cannot find the source of the submission to count its lines.")
+
+    monitoring = sys.monitoring
+    tool_id = monitoring.PROFILER_ID
+    count = 0
+
+    def _on_line(code: CodeType, _: int) -> Any:
+        nonlocal count
+        if code.co_filename not in source_files:
+            return monitoring.DISABLE
+        count += 1
+
+    monitoring.use_tool_id(tool_id, "gapper-leaderboard")
+    try:
+        monitoring.register_callback(tool_id, monitoring.events.LINE, _on_line)
+        monitoring.set_events(tool_id, monitoring.events.LINE)
+        try:
+            _call_submission(problem, submission, args, kwargs)
+        finally:
+            monitoring.set_events(tool_id, monitoring.events.NO_EVENTS)
+            monitoring.register_callback(tool_id, monitoring.events.LINE, None)
+            # re-enable the lines outside the submission disabled by the callback
+            monitoring.restart_events()
+    finally:
+        monitoring.free_tool_id(tool_id)
+
+    return count
+
+
+def leaderboard[T: Problem](
+    name: str,
+    bench_input: TestParam | None = None,
+    *,
+    metric: MetricType | Callable[[Any], float] = "runtime",
+    order: OrderType | None = None,
+    repeat: int = 5,
+    warmup: int = 1,
+) -> Callable[[T], T]:
+    """Add a leaderboard column measured on the submission.
+
+    The measurements run in a dedicated benchmarking phase after all the test cases
+    pass, and are reported in the leaderboard of the Gradescope results.
+
+        @leaderboard("Runtime", param(10_000), metric="runtime", repeat=7)
+        @leaderboard("Peak Memory", param(10_000), metric="memory")
+        @problem()
+        def solve(n: int) -> int: ...
+
+    :param name: The name of the leaderboard column.
+    :param bench_input: The parameter the submission is benchmarked with.
+    :param metric: What to measure. See :class:`LeaderboardMetric`.
+    :param order: The order of the leaderboard column, "asc" or "desc".
+    :param repeat: The number of measured runs. The median is reported.
+    :param warmup: The number of unmeasured runs before the measured ones.
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1.")
+
+    if bench_input is not None and bench_input.param_info.gap_is_pipeline:
+        raise ValueError("Pipeline parameters cannot be used as leaderboard inputs.")
+
+    if bench_input is not None and any(
+        isinstance(value, BinaryInput)
+        for value in (*bench_input.args, *bench_input.kwargs.values())
+    ):
+        raise ValueError(
+            "binary_input cannot be used in leaderboard inputs, "
+            "since their files are not packed into the autograder."
+        )
+
+    leaderboard_metric = LeaderboardMetric(
+        name=name,
+        bench_input=bench_input or TestParam(),
+        metric=metric,
+        order=order,
+        repeat=repeat,
+        warmup=warmup,
+    )
+
+    def _wrapper(prob: T) -> T:
+        prob.config.extras.setdefault("leaderboard", []).append(leaderboard_metric)
+        return prob
+
+    return _wrapper
+
+
+def run_leaderboard(
+    problem: Problem, submission: Any
+) -> List[GradescopeLeaderboardEntry]:
+    """Measure the submission for every leaderboard column of the problem.
+
+    :param problem: The problem whose leaderboard is filled.
+    :param submission: The submission to be measured.
+    """
+    entries: List[GradescopeLeaderboardEntry] = []
+
+    for metric in problem.config.extras.get("leaderboard") or []:
+        try:
+            value = metric.measure(problem, submission)
+        except Exception as e:
+            _leaderboard_logger.warning(
+                f"Cannot measure leaderboard metric {metric.name}: {e}"
+            )
+            continue
+
+        _leaderboard_logger.debug(f"Measured leaderboard metric {metric.name}: {value}")
+        entries.append(
+            GradescopeLeaderboardEntry(
+                name=metric.name, value=value, order=metric.resolved_order
+            )
+        )
+
+    return entries
@@ -3,32 +3,51 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Iterable, Optional, TypedDict
+from typing import TYPE_CHECKING, Iterable, List, Literal, Optional, TypedDict
 
 from gapper.core.problem.extras.gradescope_connect import GSConnectConfig
 
+if TYPE_CHECKING:
+    from gapper.core.problem.extras.leaderboard import LeaderboardMetric
+    from gapper.core.stdout_check import StdoutCheck
+
 
 class ProblemConfigExtra(TypedDict):
     """Extra problem configuration dictionary."""
 
     gs_connect: Optional[GSConnectConfig]
+    leaderboard: Optional[List[LeaderboardMetric]]
 
 
 @dataclass
 class ProblemConfig:
     """Problem configuration.
 
-    :param check_stdout: Whether to check the stdout of the solution.
+    :param check_stdout: Whether to check the stdout of the solution, or a StdoutCheck
+        to compare it line by line while the submission prints.
     :param mock_input: Whether to mock the input of the solution.
     :param captured_context: The context to capture from the submission.
     :param easy_context: Whether to use context directly in gap override tests.
     :param is_script: Whether this problem is a script.
+    :param deduplicate: How to handle test cases with the same input. "report" warns
+        about them, "merge" also merges them into the first one, and None skips
+        the check.
+    :param max_stdout: The number of characters a test can print when the stdout is
+        captured before the test is stopped, or None for no limit, the default.
+    :param isolate: Whether to run each test in a forked process, capturing its
+        output on the file descriptor level.
+    :param post_tests_timeout: The number of seconds the independent post tests hooks
+        can take together, or None for no limit.
     :param extras: Extra problem configuration dictionary.
     """
 
-    check_stdout: bool = False
+    check_stdout: bool | StdoutCheck = False
     mock_input: bool = False
     captured_context: Iterable[str] = ()
     easy_context: bool = True
     is_script: bool = False
+    deduplicate: Literal["report", "merge"] | None = None
+    max_stdout: int | None = None
+    isolate: bool = False
+    post_tests_timeout: float | None = None
     extras: ProblemConfigExtra = field(default_factory=lambda: defaultdict(None))
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import logging
+import os
+import warnings
 from collections import defaultdict
 from pathlib import Path
 from typing import (
@@ -12,6 +14,7 @@ from typing import (
     Generic,
     Iterable,
     List,
+    Literal,
     Optional,
     ParamSpec,
     TypeVar,
@@ -24,6 +27,8 @@ from gapper.core.errors import (
     NoProblemDefinedError,
 )
 from gapper.core.problem.problem_config import ProblemConfig
+from gapper.core.stdout_check import StdoutCheck
+from gapper.core.test_parameter import LazyTestParams
 from gapper.core.tester import HookTypes, PostTests, PreTests
 from gapper.core.unittest_wrapper import TestCaseWrapper
 from gapper.core.utils import ModuleLoader
@@ -38,6 +43,8 @@ ProbOutputType = TypeVar("ProbOutputType")
 
 _problem_logger = logging.getLogger("gapper.problem")
 
+_GAPPER_PACKAGE_DIR = str(Path(__file__).parent.parent.parent) + os.sep
+
 
 class Problem(ModuleLoader, Generic[ProbInputType, ProbOutputType]):
     """An abstract representation of a assignment problem."""
@@ -55,8 +62,10 @@ class Problem(ModuleLoader, Generic[ProbInputType, ProbOutputType]):
         """
         self._config: ProblemConfig = config
         self._solution = solution
-        self._test_params: List[TestParam] = []
+        self._test_params: List[TestParam | LazyTestParams] = []
         self._hooks: Dict[HookTypes, List[HookBase]] = defaultdict(list)
+        self._fingerprints: Dict[bytes, TestParam] = {}
+        self._duplicate_test_params: List[TestParam] = []
         self._logger = _problem_logger.getChild(self.expected_submission_name)
 
         self._logger.debug(f"Problem created with config: {self._config}")
@@ -67,10 +76,36 @@ class Problem(ModuleLoader, Generic[ProbInputType, ProbOutputType]):
         return self._config
 
     @property
-    def test_cases(self) -> List[TestParam]:
-        """The test cases of the problem."""
+    def test_cases(self) -> List[TestParam | LazyTestParams]:
+        """The test parameters stored in the problem.
+
+        Lazy test parameters are stored as they are. Use :meth:`iter_test_params` to
+        draw them.
+        """
         return self._test_params
 
+    @property
+    def stored_test_params(self) -> List[TestParam]:
+        """The test parameters stored in the problem, without the lazy ones."""
+        return [
+            test_param
+            for test_param in self._test_params
+            if not isinstance(test_param, LazyTestParams)
+        ]
+
+    @property
+    def duplicate_test_params(self) -> List[TestParam]:
+        """The registered test parameters with the same input as an earlier one."""
+        return self._duplicate_test_params
+
+    @property
+    def packed_files(self) -> Dict[str, Path]:
+        """The files the test cases need in the autograder zip, keyed by archive names."""
+        files: Dict[str, Path] = {}
+        for test_param in self._test_params:
+            files.update(test_param.packed_files())
+        return files
+
     @property
     def solution(self) -> Callable[ProbInputType, ProbOutputType]:
         """The solution to the problem."""
@@ -91,14 +126,59 @@ class Problem(ModuleLoader, Generic[ProbInputType, ProbOutputType]):
         """The expected name of the submission."""
         return getattr(self.solution, "__name__", None) or "<unnamed_submission>"
 
-    def add_test_parameter(self, test_param: TestParam) -> None:
+    def add_test_parameter(self, test_param: TestParam | LazyTestParams) -> None:
         """Add a test parameter to the problem.
 
-        :param test_param: The test parameter to add.
+        :param test_param: The test parameter, or the lazy test parameters, to add.
         """
-        self._logger.debug(f"Adding test parameter {test_param.format()}")
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(f"Adding test parameter {test_param.format()}")
+
+        if (
+            self.config.deduplicate is not None
+            and not isinstance(test_param, LazyTestParams)
+            and self._merge_duplicate(test_param)
+        ):
+            return
+
         self._test_params.append(test_param)
 
+    def _merge_duplicate(self, test_param: TestParam) -> bool:
+        """Check if the test parameter has the same input as a registered one.
+
+        :param test_param: The test parameter to check.
+        :return: Whether the test parameter is merged into the registered one.
+        """
+        fingerprint = test_param.fingerprint()
+        if fingerprint is None:
+            return False
+
+        original = self._fingerprints.setdefault(fingerprint, test_param)
+        if original is test_param:
+            return False
+
+        if self.config.deduplicate == "merge" and original.merge_duplicate(test_param):
+            _warn_duplicate(
+                f"Test case {test_param.format()} is registered more than once, "
+                f"and is merged into the first one to save the extra run of the "
+                f"solution and the submission it costs."
+            )
+            return True
+
+        self._duplicate_test_params.append(test_param)
+        _warn_duplicate(
+            f"Test case {test_param.format()} is registered more than once, "
+            f"and costs an extra run of the solution and the submission."
+            + (
+                " It is not merged because its gap keywords differ from the first "
+                "one beyond scoring."
+                if self.config.deduplicate == "merge"
+                else ""
+            )
+            + " Run gap check to measure the grading time the duplicates waste."
+        )
+        return False
+
     def add_hook(self, hook: HookBase, hook_type: HookTypes) -> None:
         """Add a post test to the problem.
 
@@ -114,9 +194,17 @@ class Problem(ModuleLoader, Generic[ProbInputType, ProbOutputType]):
         """Run the solution in the problem."""
         return self._solution(*args, **kwargs)
 
+    def iter_test_params(self) -> Generator[TestParam, None, None]:
+        """Iterate over the test parameters, drawing the lazy ones on demand."""
+        for test_param in self._test_params:
+            if isinstance(test_param, LazyTestParams):
+                yield from test_param.generate(self)
+            else:
+                yield test_param
+
     def generate_tests(self) -> Generator[TestCaseWrapper, None, None]:
         """Generate the test cases."""
-        yield from (TestCaseWrapper(param, self) for param in self._test_params)
+        yield from (TestCaseWrapper(param, self) for param in self.iter_test_params())
 
     @classmethod
     def _search_problem(cls, path: Path) -> Generator[Problem, None, None]:
@@ -162,12 +250,25 @@ class Problem(ModuleLoader, Generic[ProbInputType, ProbOutputType]):
         return problems[0]
 
 
+def _warn_duplicate(message: str) -> None:
+    """Warn about a duplicate test case at the line registering it.
+
+    The frames inside gapper are skipped, since the test case can be registered
+    through any number of bundles and bound decorators.
+    """
+    warnings.warn(message, skip_file_prefixes=(_GAPPER_PACKAGE_DIR,))
+
+
 @overload
 def problem(
     *,
     is_script: bool = False,
     context: Iterable[str] = (),
     easy_context: bool = True,
+    deduplicate: Literal["report", "merge"] | None = None,
+    max_stdout: int | None = None,
+    isolate: bool = False,
+    post_tests_timeout: float | None = None,
 ) -> Callable[
     [Callable[ProbInputType, ProbOutputType]],
     Problem[ProbInputType, ProbOutputType],
@@ -179,10 +280,14 @@ def problem(
 @overload
 def problem(
     *,
-    check_stdout: bool = False,
+    check_stdout: bool | StdoutCheck = False,
     mock_input: bool = False,
     context: Iterable[str] = (),
     easy_context: bool = True,
+    deduplicate: Literal["report", "merge"] | None = None,
+    max_stdout: int | None = None,
+    isolate: bool = False,
+    post_tests_timeout: float | None = None,
 ) -> Callable[
     [Callable[ProbInputType, ProbOutputType]],
     Problem[ProbInputType, ProbOutputType],
@@ -194,10 +299,14 @@ def problem(
 def problem(
     *,
     is_script: bool = False,
-    check_stdout: Optional[bool] = None,
+    check_stdout: Optional[bool | StdoutCheck] = None,
     mock_input: Optional[bool] = None,
     context: Iterable[str] = (),
     easy_context: bool = True,
+    deduplicate: Literal["report", "merge"] | None = None,
+    max_stdout: int | None = None,
+    isolate: bool = False,
+    post_tests_timeout: float | None = None,
 ) -> Callable[
     [Callable[ProbInputType, ProbOutputType]],
     Problem[ProbInputType, ProbOutputType],
@@ -205,11 +314,30 @@ def problem(
     """Create a problem object.
 
     :param is_script: Whether this problem is a script. This cannot coexist with check_stdout or mock_input.
-    :param check_stdout: Whether to check the stdout of the solution.
+    :param check_stdout: Whether to check the stdout of the solution, or a StdoutCheck
+        to compare it line by line while the submission prints.
     :param mock_input: Whether to mock the input of the solution.
     :param context: The context to capture from the submission.
     :param easy_context: Whether to use context directly in gap override tests.
+    :param deduplicate: How to handle test cases with the same input. "report" warns
+        about them, and "merge" merges them into the first one, adding up their
+        scores. Test cases whose gap keywords differ beyond scoring are only reported.
+    :param max_stdout: The number of characters a test can print when the stdout is
+        captured before the test is stopped and reported as a student error, or None
+        for no limit, the default.
+    :param isolate: Whether to run each test in a forked process whose stdout and
+        stderr are captured on the file descriptor level, including the output of C
+        extensions and subprocesses. The stderr is attached to the test results.
+    :param post_tests_timeout: The number of seconds the post tests hooks declared
+        independent can take together while they run concurrently, or None for no
+        limit. The hooks still running after it fail their results.
     """
+    if deduplicate not in (None, "report", "merge"):
+        raise ValueError('deduplicate must be None, "report", or "merge".')
+
+    if post_tests_timeout is not None and post_tests_timeout <= 0:
+        raise ValueError("post_tests_timeout must be positive.")
+
     if is_script:
         if check_stdout is not None or mock_input is not None:
             raise ValueError("Cannot specify check_stdout or mock_input for a script.")
@@ -217,7 +345,8 @@ def problem(
         check_stdout, mock_input = True, True
 
     else:
-        check_stdout = bool(check_stdout) or False
+        if not isinstance(check_stdout, StdoutCheck):
+            check_stdout = bool(check_stdout) or False
         mock_input = bool(mock_input) or False
 
     config = ProblemConfig(
@@ -226,6 +355,10 @@ def problem(
         captured_context=context,
         is_script=is_script,
         easy_context=easy_context,
+        deduplicate=deduplicate,
+        max_stdout=max_stdout,
+        isolate=isolate,
+        post_tests_timeout=post_tests_timeout,
     )
 
     def _wrapper(
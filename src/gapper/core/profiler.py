@@ -0,0 +1,192 @@
+"""A low-overhead sampling profiler reporting the hottest lines of a submission."""
+from __future__ import annotations
+
+import linecache
+import logging
+import os
+import sys
+import sysconfig
+import threading
+from collections import Counter
+from pathlib import Path
+from time import perf_counter
+from types import FrameType
+from typing import Any, Iterable, List, Self, Tuple
+
+__all__ = ["HotLineSampler", "submission_source_files"]
+
+_profiler_logger = logging.getLogger("gapper.profiler")
+
+_GAPPER_PACKAGE_DIR = str(Path(__file__).parent.parent) + os.sep
+_LIBRARY_DIRS = tuple(
+    {
+        path
+        for key in ("stdlib", "platstdlib", "purelib", "platlib")
+        if (path := sysconfig.get_paths().get(key))
+    }
+)
+
+
+def submission_source_files(submission: Any) -> List[str]:
+    """Find the source files a submission object is defined in.
+
+    :param submission: The submission function or class, or the runner of a script
+        submission, which names the file of the script in its submission_file.
+    :return: The file names of the code objects found in the submission. It's empty
+        if nothing can be found.
+    """
+    if (script_file := getattr(submission, "submission_file", None)) is not None:
+        files = [script_file]
+    elif (code := getattr(submission, "__code__", None)) is not None:
+        files = [code.co_filename]
+    elif isinstance(submission, type):
+        files = [
+            attr.__code__.co_filename
+            for attr in vars(submission).values()
+            if hasattr(attr, "__code__")
+        ]
+    else:
+        files = []
+
+    return [f for f in dict.fromkeys(files) if not f.startswith(_GAPPER_PACKAGE_DIR)]
+
+
+class HotLineSampler:
+    """Sample the stack of the running thread and tally the hottest user lines.
+
+    The sampler runs in a background thread and peeks at the stack of the thread
+    that entered it. Each sample is attributed to the innermost frame that belongs to
+    the user, so time spent in library code is charged to the student's line calling
+    it. Frames inside gapper are filtered out, the same way
+    :meth:`gapper.core.errors.ErrorFormatter.extract_user_traceback` does.
+
+    The sampler caps its own overhead by backing off the sampling interval whenever
+    taking a sample costs more than ``max_overhead`` of the interval.
+    """
+
+    def __init__(
+        self,
+        target_files: Iterable[str] | None = None,
+        *,
+        interval: float = 0.001,
+        max_overhead: float = 0.05,
+        max_samples: int = 10_000,
+    ) -> None:
+        """Create a sampler.
+
+        :param target_files: The files whose lines are tallied. If not given, any file
+            outside gapper and the installed libraries counts as user code.
+        :param interval: The shortest time in seconds between two samples.
+        :param max_overhead: The largest fraction of the wall time the sampler may use.
+        :param max_samples: The number of samples after which the sampler stops.
+        """
+        self._target_files = frozenset(target_files or ())
+        self._interval = interval
+        self._max_overhead = max_overhead
+        self._max_samples = max_samples
+        self._counts: Counter[Tuple[str, int]] = Counter()
+        self._samples = 0
+        self._overhead = 0.0
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._target_thread_id: int | None = None
+
+    @property
+    def sample_count(self) -> int:
+        """The number of samples taken."""
+        return self._samples
+
+    @property
+    def overhead(self) -> float:
+        """The time in seconds spent taking samples."""
+        return self._overhead
+
+    def __enter__(self) -> Self:
+        """Start sampling the current thread."""
+        self._target_thread_id = threading.get_ident()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._sample_loop, name="gapper-hot-line-sampler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop sampling."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        _profiler_logger.debug(
+            f"Sampler took {self._samples} samples with {self._overhead:.4f}s overhead"
+        )
+
+    def _is_user_file(self, filename: str) -> bool:
+        if self._target_files:
+            return filename in self._target_files
+
+        return not (
+            filename.startswith(_GAPPER_PACKAGE_DIR)
+            or filename.startswith(_LIBRARY_DIRS)
+            or filename.startswith("<")
+        )
+
+    def _attribute(self, frame: FrameType | None) -> Tuple[str, int] | None:
+        while frame is not None:
+            if self._is_user_file(frame.f_code.co_filename):
+                return frame.f_code.co_filename, frame.f_lineno
+            frame = frame.f_back
+
+        return None
+
+    def _sample_loop(self) -> None:
+        interval = self._interval
+
+        while not self._stop_event.wait(interval):
+            start = perf_counter()
+
+            frame = sys._current_frames().get(self._target_thread_id)
+            location = self._attribute(frame)
+            del frame
+
+            if location is not None:
+                self._counts[location] += 1
+            self._samples += 1
+
+            cost = perf_counter() - start
+            self._overhead += cost
+            interval = max(self._interval, cost / self._max_overhead)
+
+            if self._samples >= self._max_samples:
+                break
+
+    def top_lines(self, n: int) -> List[Tuple[str, int, int]]:
+        """The n hottest lines.
+
+        :param n: The number of lines to return.
+        :return: A list of (file name, line number, sample count), hottest first.
+        """
+        return [
+            (filename, lineno, count)
+            for (filename, lineno), count in self._counts.most_common(n)
+        ]
+
+    def format_report(self, n: int) -> List[str]:
+        """Format the n hottest lines as human-readable descriptions.
+
+        :param n: The number of lines to report.
+        """
+        attributed = sum(self._counts.values())
+        if attributed == 0:
+            return []
+
+        report = [f"Hottest lines in your submission ({attributed} samples):"]
+        for filename, lineno, count in self.top_lines(n):
+            source = linecache.getline(filename, lineno).strip()
+            report.append(
+                f"  {Path(filename).name}:{lineno} "
+                f"({count / attributed:.0%}) {source}".rstrip()
+            )
+
+        return report
@@ -0,0 +1,189 @@
+"""Line-by-line comparison of the stdout of submissions, streamed as it is printed."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Sequence
+
+from gapper.core.utils import STDOUT_MEMORY_LIMIT, SpillingTextIO
+
+__all__ = ["StdoutCheck", "StdoutComparer", "StdoutDivergence", "stdout_check"]
+
+_FLOAT = re.compile(r"[-+]?(?:\d+\.\d*|\.\d+)(?:[eE][-+]?\d+)?|[-+]?\d+[eE][-+]?\d+")
+
+
+class StdoutDivergence(AssertionError):
+    """Raised when the stdout of the submission diverges from the solution's."""
+
+
+@dataclass(frozen=True)
+class StdoutCheck:
+    """How the stdout of the submission is compared with the solution's.
+
+    The lines of both are normalized before they are compared, and the submission
+    is checked line by line while it prints. Pass it as check_stdout to problem().
+
+    :param normalize_whitespace: Whether to strip the lines and collapse the runs
+        of whitespace in them.
+    :param ignore_trailing_newlines: Whether to ignore the blank lines at the end.
+    :param ignore_case: Whether to compare the lines case-insensitively.
+    :param float_digits: The number of decimal digits to round the floats in the
+        lines to, or None to compare them as printed.
+    :param normalizers: Extra functions normalizing a line, applied in order after
+        the ones above.
+    :param stop_early: Whether to stop the submission at the first diverging line.
+    """
+
+    normalize_whitespace: bool = False
+    ignore_trailing_newlines: bool = False
+    ignore_case: bool = False
+    float_digits: int | None = None
+    normalizers: Sequence[Callable[[str], str]] = ()
+    stop_early: bool = True
+
+    def normalize(self, line: str) -> str:
+        """Normalize a line.
+
+        :param line: The line without its newline.
+        """
+        if self.normalize_whitespace:
+            line = " ".join(line.split())
+        if self.ignore_case:
+            line = line.casefold()
+        if self.float_digits is not None:
+            line = _FLOAT.sub(
+                lambda match: f"{float(match.group()):.{self.float_digits}f}", line
+            )
+        for normalizer in self.normalizers:
+            line = normalizer(line)
+        return line
+
+    def compare(self, expected: str, actual: str) -> None:
+        """Compare two complete outputs.
+
+        :param expected: The stdout of the solution.
+        :param actual: The stdout of the submission.
+        :raises StdoutDivergence: If the outputs diverge.
+        """
+        comparer = StdoutComparer(expected, self, memory_limit=len(actual))
+        try:
+            comparer.write(actual)
+            comparer.finish()
+        finally:
+            comparer.close()
+
+
+stdout_check = StdoutCheck
+
+
+class StdoutComparer(SpillingTextIO):
+    """A stdout capture comparing each complete line with the expected output.
+
+    The newline at the end of the output is not compared, and the text is also
+    kept like in SpillingTextIO. When the check stops early, the
+    first diverging line raises a StdoutDivergence out of the print call that
+    completes it.
+    """
+
+    def __init__(
+        self,
+        expected: str,
+        check: StdoutCheck,
+        memory_limit: int = STDOUT_MEMORY_LIMIT,
+        hard_limit: int | None = None,
+    ) -> None:
+        """Create a streaming stdout comparer.
+
+        :param expected: The stdout of the solution.
+        :param check: How the lines are compared.
+        :param memory_limit: The number of characters kept in memory.
+        :param hard_limit: The number of characters that can be written, or None
+            for no limit.
+        """
+        super().__init__(memory_limit, hard_limit)
+        self._check = check
+        self._expected_lines = expected.split("\n")
+        if not self._expected_lines[-1]:
+            self._expected_lines.pop()
+        if check.ignore_trailing_newlines:
+            while self._expected_lines and not check.normalize(
+                self._expected_lines[-1]
+            ):
+                self._expected_lines.pop()
+        self._line_number = 0
+        self._partial = ""
+        self._blank_lines: List[str] = []
+        self.divergence: StdoutDivergence | None = None
+
+    def write(self, s: str) -> int:
+        """Capture the text and compare the lines it completes.
+
+        :param s: The text to write.
+        :raises StdoutDivergence: If a line diverges and the check stops early.
+        """
+        written = super().write(s)
+        if self.divergence is not None:
+            if self._check.stop_early:
+                raise self.divergence
+            return written
+
+        *lines, self._partial = (self._partial + s).split("\n")
+        for line in lines:
+            self._receive(line)
+        return written
+
+    def finish(self) -> None:
+        """Compare the last line and check for missing lines.
+
+        :raises StdoutDivergence: If the output diverged anywhere.
+        """
+        if self.divergence is None:
+            self._receive(self._partial, last=True)
+        if self.divergence is None and self._line_number < len(self._expected_lines):
+            self._diverge(
+                f"The stdout ends after line {self._line_number}, but more lines "
+                f"are expected, starting with "
+                f"{self._expected_lines[self._line_number]!r}."
+            )
+        if self.divergence is not None:
+            raise self.divergence
+
+    def _receive(self, line: str, last: bool = False) -> None:
+        """Compare a complete line, holding back blank lines that may be trailing."""
+        if last and not line:
+            return
+
+        normalized = self._check.normalize(line)
+        if self._check.ignore_trailing_newlines:
+            if not normalized:
+                if not last:
+                    self._blank_lines.append(line)
+                return
+            blank_lines, self._blank_lines = self._blank_lines, []
+            for blank_line in blank_lines:
+                self._compare(blank_line, "")
+
+        self._compare(line, normalized)
+
+    def _compare(self, line: str, normalized: str) -> None:
+        if self.divergence is not None:
+            return
+        if self._line_number >= len(self._expected_lines):
+            self._diverge(
+                f"The stdout has more lines than expected, starting at line "
+                f"{self._line_number + 1}: {line!r}."
+            )
+            return
+
+        expected = self._expected_lines[self._line_number]
+        self._line_number += 1
+        if self._check.normalize(expected) != normalized:
+            self._diverge(
+                f"The stdout differs at line {self._line_number}: "
+                f"expected {expected!r}, got {line!r}."
+            )
+
+    def _diverge(self, message: str) -> None:
+        self.divergence = StdoutDivergence(message)
+        if self._check.stop_early:
+            raise self.divergence
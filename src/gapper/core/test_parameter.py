@@ -1,18 +1,30 @@
 """The module contains the test case (parameter) support classes and functions."""
 from __future__ import annotations
 
+import ast
+import csv
+import hashlib
+import json
+import math
+import pickle
 import warnings
-from dataclasses import asdict, dataclass
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, fields, replace
 from enum import Enum
 from functools import partial
 from itertools import product
+from pathlib import Path
+from random import Random
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
     Iterable,
+    Iterator,
     List,
+    Self,
     Sequence,
     overload,
 )
@@ -32,14 +44,27 @@ __all__ = [
     "test_cases_product",
     "test_cases_singular_params",
     "test_cases_singular_param_iter",
+    "test_cases_generated",
+    "TestParamGenerator",
+    "GeneratedTestParam",
+    "LazyTestParams",
+    "CombinedTestParams",
+    "TestParamRecipe",
+    "RecipeTestParam",
+    "TestParamFile",
+    "test_cases_from_file",
 ]
 
 from gapper.core.errors import InternalError
+from gapper.core.fuzzing import Fuzzer, Strategy, as_strategy, infer_strategies
+from gapper.core.packed_files import BinaryInput, PackedFile, collect_packed_files
+from gapper.core.pipeline_support import PipelineBase
 
 if TYPE_CHECKING:
     from gapper.core.problem import Problem
     from gapper.core.problem.problem_def import ProbInputType, ProbOutputType
     from gapper.core.types import (
+        BatchCheckFn,
         CustomEqualityCheckFn,
         CustomTestFn,
         PostHookFn,
@@ -64,10 +89,23 @@ class GapReservedKeywords(Enum):
     gap_post_hooks = "gap_post_hooks"
     gap_description = "gap_description"
     gap_is_pipeline = "gap_is_pipeline"
+    gap_profile = "gap_profile"
+    gap_fuzz = "gap_fuzz"
+    gap_batch = "gap_batch"
 
 
-@dataclass
+_GAP_KEYWORDS = frozenset(keyword.value for keyword in GapReservedKeywords)
+
+
+@dataclass(frozen=True, slots=True)
 class ParamInfo:
+    """The gap keywords of a test case.
+
+    It is immutable, so that test cases with the same gap keywords, such as the
+    members of a bundle, can share one instance. Use :meth:`updated` to derive a
+    modified copy, or TestParam.update_gap_kwargs to change a test case.
+    """
+
     gap_expect: Any | None = None
     gap_expect_stdout: str | None = None
     gap_hidden: bool = False
@@ -82,16 +120,56 @@ class ParamInfo:
     gap_is_pipeline: bool = False
     gap_max_score: float | None = None
     gap_weight: int | None = None
+    gap_profile: int | None = None
+    gap_fuzz: Fuzzer | None = None
+    gap_batch: bool | BatchCheckFn = False
+
+    def updated(self, new_info: Dict[str, Any]) -> ParamInfo:
+        """Return a copy with the gap keywords in new_info replaced.
+
+        Keys that are not gap keywords are ignored. The instance itself is returned
+        if nothing is replaced.
+
+        :param new_info: The gap keywords to replace.
+        """
+        changes = {
+            key: value for key, value in new_info.items() if key in _PARAM_INFO_FIELDS
+        }
+        return replace(self, **changes) if changes else self
 
     def update(self, new_info: Dict[str, Any]) -> None:
-        for key, value in new_info.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        """Replace gap keywords in place, which is no longer supported.
+
+        .. deprecated::
+            ParamInfo is shared by the test cases with the same gap keywords, so it
+            cannot be changed in place. Use TestParam.update_gap_kwargs instead.
+
+        :raises TypeError: Always, naming the replacement.
+        """
+        warnings.warn(
+            "ParamInfo.update is deprecated.", DeprecationWarning, stacklevel=2
+        )
+        raise TypeError(
+            "ParamInfo is immutable, since test cases with the same gap keywords "
+            "share it. Use param.update_gap_kwargs(**new_info) to change the gap "
+            "keywords of a test case, or param_info.updated(new_info) for a copy."
+        )
+
+
+_PARAM_INFO_FIELDS = frozenset(info_field.name for info_field in fields(ParamInfo))
+_SCORING_GAP_KEYWORDS = (
+    GapReservedKeywords.gap_max_score.value,
+    GapReservedKeywords.gap_weight.value,
+    GapReservedKeywords.gap_extra_points.value,
+)
+_DEFAULT_PARAM_INFO = ParamInfo()
 
 
 class ParamExtractor:
     """A class to extract the gap test parameter."""
 
+    __slots__ = ("_param_info",)
+
     def __init__(self, kwargs: Dict[str, Any]) -> None:
         """Initialize the gap test parameter."""
         gap_params = type(self).extra_gap_info(kwargs)
@@ -107,9 +185,8 @@ class ParamExtractor:
         cls, kwargs: Dict[str, Any], check_residue: bool = True
     ) -> Dict[str, Any]:
         gap_kwargs = {
-            k.value: kwargs.pop(k.value)
-            for k in GapReservedKeywords
-            if k.value in kwargs
+            key: kwargs.pop(key)
+            for key in [key for key in kwargs if key in _GAP_KEYWORDS]
         }
 
         if check_residue:
@@ -121,11 +198,31 @@ class ParamExtractor:
     @staticmethod
     def _select_param_info(kwargs: Dict[str, Any]) -> ParamInfo:
         """Select the parameter information to fill in."""
-        if (
+        if not kwargs:
+            return _DEFAULT_PARAM_INFO
+        elif (
             kwargs.get(GapReservedKeywords.gap_max_score.value, None) is not None
             and kwargs.get(GapReservedKeywords.gap_weight.value, None) is not None
         ):
             raise ValueError("Cannot specify both gap_max_score and gap_weight.")
+        elif kwargs.get(GapReservedKeywords.gap_fuzz.value, None) is not None and (
+            kwargs.get(GapReservedKeywords.gap_override_test.value, None) is not None
+            or kwargs.get(GapReservedKeywords.gap_is_pipeline.value, False)
+        ):
+            raise ValueError(
+                "Cannot specify gap_fuzz with gap_override_test or gap_is_pipeline."
+            )
+        elif kwargs.get(GapReservedKeywords.gap_batch.value, False) and (
+            kwargs.get(GapReservedKeywords.gap_fuzz.value, None) is not None
+            or kwargs.get(GapReservedKeywords.gap_override_test.value, None) is not None
+            or kwargs.get(GapReservedKeywords.gap_override_check.value, None)
+            is not None
+            or kwargs.get(GapReservedKeywords.gap_is_pipeline.value, False)
+        ):
+            raise ValueError(
+                "Cannot specify gap_batch with gap_fuzz, gap_override_test, "
+                "gap_override_check, or gap_is_pipeline."
+            )
         else:
             return ParamInfo(**kwargs)
 
@@ -148,7 +245,7 @@ class ParamExtractor:
 
         :param kwargs: The keyword arguments to be pushed into the param_info.
         """
-        self._param_info.update(kwargs)
+        self._param_info = self._param_info.updated(kwargs)
 
     def __eq__(self, other: ParamExtractor) -> bool:
         """Check if the test parameter is equal to another test parameter."""
@@ -186,6 +283,9 @@ class _BoundTestParam(partial):
         gap_is_pipeline: bool | Sequence[bool] = False,
         gap_max_score: float | Sequence[float] | None = None,
         gap_weight: float | Sequence[float] | None = None,
+        gap_profile: int | Sequence[int] | None = None,
+        gap_fuzz: Fuzzer | Sequence[Fuzzer] | None = None,
+        gap_batch: bool | BatchCheckFn | Sequence[bool | BatchCheckFn] = False,
         **kwargs: Any,
     ) -> None:
         ...
@@ -198,9 +298,17 @@ class TestParam(ParamExtractor):
     """A class to represent a test case (parameter). Will be used as @test_case() decorator.
 
     :cvar pipeline: specify test case using pipeline actions.
+    :cvar recipe: specify test case regenerated from a seeded recipe function.
+    :cvar format_max_length: the maximum length of the formatted test parameter.
+        Longer ones are truncated and end with a hash of the full format. None
+        disables the truncation.
     """
 
+    __slots__ = ("_args", "_kwargs", "_formatted")
+
     pipeline: ClassVar[partial[TestParam]]
+    recipe: ClassVar[type[TestParamRecipe]]
+    format_max_length: ClassVar[int | None] = 200
     bind = _BoundTestParam
 
     @overload
@@ -220,6 +328,9 @@ class TestParam(ParamExtractor):
         gap_description: str | Iterable[str] | None = None,
         gap_is_pipeline: bool = False,
         gap_max_score: float | None = None,
+        gap_profile: int | None = None,
+        gap_fuzz: Fuzzer | None = None,
+        gap_batch: bool | BatchCheckFn = False,
         **kwargs,
     ) -> None:
         """Initialize the gap test parameter (test_case).
@@ -238,6 +349,10 @@ class TestParam(ParamExtractor):
         :param gap_description: The description of the test case.
         :param gap_is_pipeline: Whether the test case is a pipeline.
         :param gap_max_score: The max score of the test case. This and gap_weight cannot be specified as the same ti
+        :param gap_profile: The number of the hottest submission lines to report when the test fails.
+        :param gap_fuzz: The fuzzing specification comparing the submission with the solution on random inputs.
+        :param gap_batch: Whether the arguments are stacked batches of inputs evaluated in one call, or the
+            vectorized function checking the batch of results element-wise.
         :param kwargs: The keyword arguments for the test parameter, including kwargs.
         """
 
@@ -258,6 +373,9 @@ class TestParam(ParamExtractor):
         gap_description: str | Iterable[str] | None = None,
         gap_is_pipeline: bool = False,
         gap_weight: float | None = None,
+        gap_profile: int | None = None,
+        gap_fuzz: Fuzzer | None = None,
+        gap_batch: bool | BatchCheckFn = False,
         **kwargs: Any,
     ) -> None:
         """Initialize the gap test parameter (test_case).
@@ -276,6 +394,10 @@ class TestParam(ParamExtractor):
         :param gap_description: The description of the test case.
         :param gap_is_pipeline: Whether the test case is a pipeline.
         :param gap_weight: The weight of the test case. This and gap_max_score cannot be specified as the same time.
+        :param gap_profile: The number of the hottest submission lines to report when the test fails.
+        :param gap_fuzz: The fuzzing specification comparing the submission with the solution on random inputs.
+        :param gap_batch: Whether the arguments are stacked batches of inputs evaluated in one call, or the
+            vectorized function checking the batch of results element-wise.
         :param kwargs: The keyword arguments for the test parameter, including kwargs.
         """
 
@@ -286,8 +408,33 @@ class TestParam(ParamExtractor):
         :param kwargs: The keyword arguments for the test parameter, including kwargs.
         """
         super().__init__(kwargs)
+        if self.param_info.gap_fuzz is not None and (args or kwargs):
+            raise ValueError("Fuzzed test cases cannot take arguments.")
         self._args = args
         self._kwargs = kwargs
+        self._formatted: str | None = None
+
+    @classmethod
+    def _from_parts(
+        cls,
+        args: tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        param_info: ParamInfo = _DEFAULT_PARAM_INFO,
+    ) -> Self:
+        """Create a test parameter whose gap keywords are already split from kwargs.
+
+        Bundles use this to skip scanning the keywords of every member again.
+
+        :param args: The arguments for the test parameter.
+        :param kwargs: The keyword arguments for the test parameter, without gap keywords.
+        :param param_info: The parameter information, possibly shared with other cases.
+        """
+        test_param = cls.__new__(cls)
+        test_param._args = args
+        test_param._kwargs = kwargs
+        test_param._param_info = param_info
+        test_param._formatted = None
+        return test_param
 
     def __call__[T: Problem[ProbInputType, ProbOutputType]](self, prob: T) -> T:
         """Make itself to be a decorator."""
@@ -297,9 +444,69 @@ class TestParam(ParamExtractor):
         self, prob: T
     ) -> T:
         """Register the test parameter to the problem."""
+        for value in (*self.args, *self.kwargs.values()):
+            if isinstance(value, PackedFile):
+                value.locate(prob)
+
+        _check_binary_inputs(
+            (*self.args, *self.kwargs.values()),
+            prob,
+            self.param_info.gap_is_pipeline,
+            self.param_info.gap_override_test is not None,
+        )
         prob.add_test_parameter(self)
         return prob
 
+    def packed_files(self) -> Dict[str, Path]:
+        """The files among the arguments, keyed by their names in the autograder zip."""
+        return collect_packed_files((*self.args, *self.kwargs.values()))
+
+    def fingerprint(self) -> bytes | None:
+        """Return a digest of the args and kwargs, or None if they cannot be pickled.
+
+        Test parameters with the same fingerprint run the solution on the same input.
+        """
+        try:
+            dumped = pickle.dumps((self.args, sorted(self.kwargs.items())))
+        except Exception:
+            return None
+        return hashlib.blake2b(dumped, digest_size=16).digest()
+
+    def merge_duplicate(self, other: TestParam) -> bool:
+        """Absorb a test parameter with the same input, adding its score to this one.
+
+        The max scores, the weights, and the extra points are summed, where a test
+        without a max score or a weight counts as weight 1, so the total score of
+        the problem does not change.
+
+        :param other: The duplicate test parameter.
+        :return: Whether the duplicate is merged. It is not if their gap keywords
+            differ in anything other than scoring, or if one uses gap_max_score and
+            the other gap_weight.
+        """
+        mine, theirs = self.param_info, other.param_info
+        unscored = dict.fromkeys(_SCORING_GAP_KEYWORDS)
+        if replace(mine, **unscored) != replace(theirs, **unscored):
+            return False
+        if (mine.gap_max_score is None) != (theirs.gap_max_score is None):
+            return False
+
+        if mine.gap_extra_points is None and theirs.gap_extra_points is None:
+            extra_points = None
+        else:
+            extra_points = (mine.gap_extra_points or 0) + (theirs.gap_extra_points or 0)
+
+        if mine.gap_max_score is not None:
+            scores = {"gap_max_score": mine.gap_max_score + theirs.gap_max_score}
+        else:
+            scores = {
+                "gap_weight": (1 if mine.gap_weight is None else mine.gap_weight)
+                + (1 if theirs.gap_weight is None else theirs.gap_weight)
+            }
+
+        self.update_gap_kwargs(**scores, gap_extra_points=extra_points)
+        return True
+
     @property
     def args(self) -> tuple[Any, ...]:
         """Return the arguments of the test parameter."""
@@ -309,6 +516,7 @@ class TestParam(ParamExtractor):
     def args(self, args: tuple[Any, ...]) -> None:
         """Set the arguments of the test parameter."""
         self._args = args
+        self._formatted = None
 
     @property
     def kwargs(self) -> dict[str, Any]:
@@ -319,15 +527,31 @@ class TestParam(ParamExtractor):
     def kwargs(self, kwargs: dict[str, Any]) -> None:
         """Set the keyword arguments of the test parameter."""
         self._kwargs = kwargs
+        self._formatted = None
 
     def format(self, with_gap_kwargs: bool = False) -> str:
-        """Format the test parameter."""
-        args = self.args
+        """Format the test parameter.
+
+        The format without gap kwargs is computed once and cached, since it names the
+        test in the results and the logs. Set the args or kwargs again, instead of
+        mutating them in place, to refresh it.
 
+        :param with_gap_kwargs: Whether to include the gap keywords in the format.
+        """
         if with_gap_kwargs:
-            kwargs = {**self.kwargs, **asdict(self.param_info)}
-        else:
-            kwargs = self.kwargs
+            return _truncate_format(
+                self._format_args({**self.kwargs, **asdict(self.param_info)}),
+                type(self).format_max_length,
+            )
+
+        if self._formatted is None:
+            self._formatted = _truncate_format(
+                self._format_args(self.kwargs), type(self).format_max_length
+            )
+        return self._formatted
+
+    def _format_args(self, kwargs: Dict[str, Any]) -> str:
+        args = self.args
 
         args_format = ", ".join(str(arg) for arg in args)
         kwargs_format = ", ".join(f"{kwarg}={value}" for kwarg, value in kwargs.items())
@@ -361,9 +585,224 @@ class TestParam(ParamExtractor):
         return f"param{self.format(with_gap_kwargs=True)}"
 
 
+def _check_binary_inputs(
+    values: Iterable[Any], prob: Problem, is_pipeline: bool, overrides_test: bool
+) -> None:
+    """Reject binary inputs on the test paths that get the arguments unresolved.
+
+    Binary inputs are only loaded when the arguments are passed to the solution and
+    the submission as they are.
+
+    :param values: The arguments of the test case.
+    :param prob: The problem the test case is registered to.
+    :param is_pipeline: Whether the test case is a pipeline.
+    :param overrides_test: Whether the test case has a gap_override_test.
+    :raises ValueError: If a binary input is used on such a path.
+    """
+    values = list(values)
+    if is_pipeline:
+        values.extend(
+            nested
+            for value in values
+            if isinstance(value, PipelineBase)
+            for nested in (*value._args, *value._kwargs.values())
+        )
+
+    if not any(isinstance(value, BinaryInput) for value in values):
+        return
+
+    if prob.config.mock_input:
+        raise ValueError("binary_input cannot be used with mock_input.")
+    if is_pipeline:
+        raise ValueError("binary_input cannot be used in pipeline test cases.")
+    if overrides_test:
+        raise ValueError("binary_input cannot be used with gap_override_test.")
+
+
+def _reject_drawn_binary_inputs(args: Iterable[Any], kwargs: Dict[str, Any]) -> None:
+    """Reject binary inputs drawn at grading time, which are never packed.
+
+    :raises ValueError: If a binary input is among the drawn arguments.
+    """
+    if any(isinstance(value, BinaryInput) for value in (*args, *kwargs.values())):
+        raise ValueError(
+            "binary_input cannot be drawn by generated test cases or recipes, "
+            "since their files are not packed into the autograder. "
+            "Use test_case or test_cases instead."
+        )
+
+
+def _truncate_format(formatted: str, max_length: int | None) -> str:
+    """Truncate a format longer than max_length, keeping it unique with a hash suffix.
+
+    :param formatted: The format to truncate.
+    :param max_length: The maximum length of the result. None disables the truncation.
+    """
+    if max_length is None or len(formatted) <= max_length:
+        return formatted
+
+    digest = hashlib.blake2b(formatted.encode(), digest_size=4).hexdigest()
+    suffix = f"...#{digest}"
+    return f"{formatted[:max(max_length - len(suffix), 0)]}{suffix}"
+
+
 tc = TestParam
 test_case = TestParam
 param = TestParam
+
+
+class LazyTestParams(ABC):
+    """Test parameters drawn on demand when the tests of a problem are generated.
+
+    The problem stores the object itself instead of the test parameters it draws.
+    """
+
+    @abstractmethod
+    def generate(self, problem: Problem) -> Iterator[TestParam]:
+        """Draw the test parameters.
+
+        :param problem: The problem the test parameters are drawn for.
+        """
+        ...
+
+    @abstractmethod
+    def format(self, with_gap_kwargs: bool = False) -> str:
+        """Format the lazy test parameters."""
+        ...
+
+    def packed_files(self) -> Dict[str, Path]:
+        """The files to pack into the autograder zip, keyed by their archive names."""
+        return {}
+
+    def __repr__(self) -> str:
+        """Return the representation of the lazy test parameters."""
+        return self.format()
+
+
+class CombinedTestParams(LazyTestParams):
+    """Test parameters combined lazily from iterables with product or zip.
+
+    Only the iterables are stored, so the number of objects kept alive does not
+    grow with the number of combinations.
+    """
+
+    def __init__(
+        self,
+        *args: Iterable[Any],
+        gap_product: bool = False,
+        gap_zip: bool = False,
+        **kwargs: Iterable[Any],
+    ) -> None:
+        """Initialize the combined test parameters.
+
+        :param args: The iterables of the positional arguments.
+        :param gap_product: Whether to take the cartesian product of the iterables.
+        :param gap_zip: Whether to zip the iterables.
+        :param kwargs: The iterables of the keyword arguments.
+        """
+        if not gap_zip ^ gap_product:
+            raise ValueError("exactly one of gap_zip or gap_product must be True")
+
+        self._args = tuple(_as_sequence(arg) for arg in args)
+        self._kwargs = {key: _as_sequence(value) for key, value in kwargs.items()}
+        self._is_product = gap_product
+        self.shared_gap_kwargs: Dict[str, Any] = {}
+        self.per_case_gap_kwargs: Dict[str, List[Any]] = {}
+
+        # validate the lengths of the iterables
+        len(self)
+
+    def __len__(self) -> int:
+        """The number of test parameters, computed without combining anything."""
+        if self._is_product:
+            return math.prod(map(len, self._args)) * math.prod(
+                map(len, self._kwargs.values())
+            )
+
+        args_len = min(map(len, self._args)) if self._args else None
+        kwargs_len = min(map(len, self._kwargs.values())) if self._kwargs else None
+        if args_len is not None and kwargs_len is not None and args_len != kwargs_len:
+            raise ValueError('length of "args" and "kwargs" must match in zip mode')
+
+        return next((n for n in (args_len, kwargs_len) if n is not None), 0)
+
+    def _values(self) -> Iterator[Any]:
+        for values in (*self._args, *self._kwargs.values()):
+            yield from values
+
+    def locate_packed_files(self, prob: Problem) -> None:
+        """Locate the packed files among the iterables, and check the binary inputs.
+
+        :param prob: The problem the test parameters are registered to.
+        """
+        for value in self._values():
+            if isinstance(value, PackedFile):
+                value.locate(prob)
+
+        pipeline_key = GapReservedKeywords.gap_is_pipeline.value
+        override_key = GapReservedKeywords.gap_override_test.value
+        pipelines = [
+            self.shared_gap_kwargs.get(pipeline_key, False),
+            *self.per_case_gap_kwargs.get(pipeline_key, ()),
+        ]
+        overrides = [
+            self.shared_gap_kwargs.get(override_key),
+            *self.per_case_gap_kwargs.get(override_key, ()),
+        ]
+        _check_binary_inputs(
+            self._values(),
+            prob,
+            any(pipelines),
+            any(override is not None for override in overrides),
+        )
+
+    def packed_files(self) -> Dict[str, Path]:
+        """The files among the iterables, keyed by their names in the autograder zip."""
+        return collect_packed_files(self._values())
+
+    def _combinations(self) -> Iterator[tuple[tuple[Any, ...], tuple[Any, ...]]]:
+        if self._is_product:
+            for args in product(*self._args):
+                for kwargs in product(*self._kwargs.values()):
+                    yield args, kwargs
+        elif self._args and self._kwargs:
+            yield from zip(zip(*self._args), zip(*self._kwargs.values()))
+        elif self._args:
+            yield from ((args, ()) for args in zip(*self._args))
+        elif self._kwargs:
+            yield from (((), kwargs) for kwargs in zip(*self._kwargs.values()))
+
+    def generate(self, problem: Problem) -> Iterator[TestParam]:
+        """Draw the test parameters in the order of the combinator.
+
+        :param problem: The problem the test parameters are drawn for.
+        """
+        keys = tuple(self._kwargs)
+        shared_info = ParamExtractor._select_param_info(self.shared_gap_kwargs)
+        for index, (args, kwargs) in enumerate(self._combinations()):
+            param_info = shared_info
+            if self.per_case_gap_kwargs:
+                param_info = ParamExtractor._select_param_info(
+                    {
+                        **self.shared_gap_kwargs,
+                        **{
+                            key: value[index]
+                            for key, value in self.per_case_gap_kwargs.items()
+                        },
+                    }
+                )
+            yield param._from_parts(args, dict(zip(keys, kwargs)), param_info)
+
+    def format(self, with_gap_kwargs: bool = False) -> str:
+        """Format the combined test parameters."""
+        return f"{'product' if self._is_product else 'zip'}(count={len(self)})"
+
+
+def _as_sequence(values: Iterable[Any]) -> Sequence[Any]:
+    """Keep sequences as they are, and store other iterables as tuples."""
+    return values if isinstance(values, Sequence) else tuple(values)
+
+
 test_case.pipeline = partial(TestParam, gap_is_pipeline=True)
 
 
@@ -396,6 +835,9 @@ class _BoundTestParamBundle(partial):
         gap_is_pipeline: bool | Sequence[bool] = False,
         gap_max_score: float | Sequence[float] | None = None,
         gap_weight: float | Sequence[float] | None = None,
+        gap_profile: int | Sequence[int] | None = None,
+        gap_fuzz: Fuzzer | Sequence[Fuzzer] | None = None,
+        gap_batch: bool | BatchCheckFn | Sequence[bool | BatchCheckFn] = False,
         gap_params: bool = False,
         gap_param_iter: bool = False,
         gap_singular_params: bool = False,
@@ -423,6 +865,8 @@ class TestParamBundle:
     :cvar singular_param_iter: specify test cases using singular parameter iterators.
     :cvar zip: specify test cases using zip.
     :cvar product: specify test cases using product.
+    :cvar generated: specify test cases generated lazily from strategies.
+    :cvar from_file: specify test cases streamed from a JSON Lines or CSV file.
     """
 
     params: ClassVar[partial[TestParamBundle]]
@@ -431,6 +875,8 @@ class TestParamBundle:
     product: ClassVar[partial[TestParamBundle]]
     singular_params: ClassVar[partial[TestParamBundle]]
     singular_param_iter: ClassVar[partial[TestParamBundle]]
+    generated: ClassVar[type[TestParamGenerator]]
+    from_file: ClassVar[type[TestParamFile]]
 
     bind = _BoundTestParamBundle
 
@@ -459,6 +905,9 @@ class TestParamBundle:
         gap_description: str | Iterable[str] | Sequence[Iterable[str]] | None = None,
         gap_is_pipeline: bool | Sequence[bool] = False,
         gap_max_score: float | Sequence[float] | None = None,
+        gap_profile: int | Sequence[int] | None = None,
+        gap_fuzz: Fuzzer | Sequence[Fuzzer] | None = None,
+        gap_batch: bool | BatchCheckFn | Sequence[bool | BatchCheckFn] = False,
         gap_params: bool = False,
         gap_param_iter: bool = False,
         gap_singular_params: bool = False,
@@ -492,6 +941,9 @@ class TestParamBundle:
         gap_description: str | Iterable[str] | Sequence[Iterable[str]] | None = None,
         gap_is_pipeline: bool | Sequence[bool] = False,
         gap_weight: float | Sequence[float] | None = None,
+        gap_profile: int | Sequence[int] | None = None,
+        gap_fuzz: Fuzzer | Sequence[Fuzzer] | None = None,
+        gap_batch: bool | BatchCheckFn | Sequence[bool | BatchCheckFn] = False,
         gap_params: bool = False,
         gap_param_iter: bool = False,
         gap_singular_params: bool = False,
@@ -509,6 +961,7 @@ class TestParamBundle:
         gap_param_iter: bool = False,
         gap_singular_params: bool = False,
         gap_singular_param_iter: bool = False,
+        gap_lazy: bool = False,
         **kwargs: Any,
     ) -> None:
         """Initialize the test parameter bundle (test_cases).
@@ -516,14 +969,18 @@ class TestParamBundle:
         :param args: The arguments for the test parameter bundle.
         :param gap_product: Whether to take the cartesian product of the arguments.
             .. deprecated::
-                Use params, param_iter, singular_params, singular_param_iter instead.
+                Use params, param_iter, singular_params, singular_param_iter, or
+                gap_lazy instead.
         :param gap_zip: Whether to zip the arguments.
             .. deprecated::
-                Use params, param_iter, singular_params, singular_param_iter instead.
+                Use params, param_iter, singular_params, singular_param_iter, or
+                gap_lazy instead.
         :param gap_params: Whether to parse the arguments as parameters.
         :param gap_param_iter: Whether to parse the argument as parameter iterators.
         :param gap_singular_params: Whether to parse the arguments as singular parameters.
         :param gap_singular_param_iter: Whether to parse the arguments as singular parameter iterators.
+        :param gap_lazy: Whether to combine the arguments of gap_product or gap_zip lazily
+            when the tests are generated, instead of creating every test parameter now.
         :param kwargs: The keyword arguments for the test parameter bundle.
             .. seealso::
                 :class:`gapper.core.test_parameter.TestParam`
@@ -546,18 +1003,25 @@ class TestParamBundle:
                 f"gap_params={gap_params}, gap_singular_params={gap_singular_params}"
             )
 
-        if gap_product:
-            raise warnings.warn("gap_product is deprecated.")
-        if gap_zip:
-            raise warnings.warn("gap_zip is deprecated.")
+        if gap_lazy and not (gap_product or gap_zip):
+            raise ValueError("gap_lazy can only be used with gap_product or gap_zip.")
+        if gap_product and not gap_lazy:
+            warnings.warn(
+                "gap_product is deprecated.", DeprecationWarning, stacklevel=2
+            )
+        if gap_zip and not gap_lazy:
+            warnings.warn("gap_zip is deprecated.", DeprecationWarning, stacklevel=2)
 
         # pop gap keywords out
         gap_kwargs_dict = ParamExtractor.extra_gap_info(kwargs)
 
-        if gap_params:
-            self.final_params: List[TestParam] = type(self).parse_params(
-                *args, **kwargs
+        self.final_params: List[TestParam] | CombinedTestParams
+        if gap_lazy:
+            self.final_params = CombinedTestParams(
+                *args, gap_product=gap_product, gap_zip=gap_zip, **kwargs
             )
+        elif gap_params:
+            self.final_params = type(self).parse_params(*args, **kwargs)
         elif gap_param_iter:
             self.final_params = type(self).parse_param_iter(*args, **kwargs)
         elif gap_singular_params:
@@ -588,7 +1052,8 @@ class TestParamBundle:
         arg_iter = args[0]
 
         return list(
-            arg if isinstance(arg, TestParam) else param(*arg) for arg in arg_iter
+            arg if isinstance(arg, TestParam) else param._from_parts(tuple(arg), {})
+            for arg in arg_iter
         )
 
     @staticmethod
@@ -600,7 +1065,10 @@ class TestParamBundle:
                 "Please use `param()` directive to assist specifying kwargs."
             )
 
-        return list(arg if isinstance(arg, TestParam) else param(*arg) for arg in args)
+        return list(
+            arg if isinstance(arg, TestParam) else param._from_parts(tuple(arg), {})
+            for arg in args
+        )
 
     @staticmethod
     def parse_singular_params(*args: Iterable[Any], **kwargs: Any) -> List[TestParam]:
@@ -611,7 +1079,10 @@ class TestParamBundle:
                 "Please use `param()` directive to assist specifying kwargs."
             )
 
-        return list(arg if isinstance(arg, TestParam) else param(arg) for arg in args)
+        return list(
+            arg if isinstance(arg, TestParam) else param._from_parts((arg,), {})
+            for arg in args
+        )
 
     @staticmethod
     def parse_singular_param_iter(
@@ -632,7 +1103,8 @@ class TestParamBundle:
         arg_iter = args[0]
 
         return list(
-            arg if isinstance(arg, TestParam) else param(arg) for arg in arg_iter
+            arg if isinstance(arg, TestParam) else param._from_parts((arg,), {})
+            for arg in arg_iter
         )
 
     @staticmethod
@@ -673,60 +1145,471 @@ class TestParamBundle:
         all_args_and_kwargs = list(combinator(combined_args, combined_kwargs))
 
         # ======= zipping all the args together =======
+        # the gap keywords are popped by the bundle, so the scan in param() is skipped
         return list(
-            param(*curr_args, **dict(zip(kwargs.keys(), curr_kwargs)))
+            param._from_parts(tuple(curr_args), dict(zip(kwargs.keys(), curr_kwargs)))
             for (curr_args, curr_kwargs) in all_args_and_kwargs
         )
 
     @staticmethod
     def add_gap_kwargs(
-        gap_kwargs: Dict[str, Any], final_params: List[TestParam]
+        gap_kwargs: Dict[str, Any], final_params: List[TestParam] | CombinedTestParams
     ) -> None:
         """Add gap_kwargs to the finalized parameters."""
-        # process gap input type
+        shared_gap_kwargs, per_case_gap_kwargs = TestParamBundle._split_gap_kwargs(
+            gap_kwargs, len(final_params)
+        )
+
+        if isinstance(final_params, CombinedTestParams):
+            final_params.shared_gap_kwargs = shared_gap_kwargs
+            final_params.per_case_gap_kwargs = per_case_gap_kwargs
+            return
+
+        # members without their own gap keywords share one parameter information,
+        # and only the ones with per-case gap keywords get a copy of their own
+        shared_info = _DEFAULT_PARAM_INFO.updated(shared_gap_kwargs)
+        for index, final_param in enumerate(final_params):
+            per_case_kwargs = {
+                key: values[index] for key, values in per_case_gap_kwargs.items()
+            }
+            if final_param.param_info is _DEFAULT_PARAM_INFO:
+                final_param._param_info = shared_info.updated(per_case_kwargs)
+            else:
+                final_param.update_gap_kwargs(**shared_gap_kwargs, **per_case_kwargs)
+
+    @staticmethod
+    def _split_gap_kwargs(
+        gap_kwargs: Dict[str, Any], count: int
+    ) -> tuple[Dict[str, Any], Dict[str, List[Any]]]:
+        """Split gap_kwargs into the ones shared by all cases and the per-case ones.
+
+        :param gap_kwargs: The gap keywords of the bundle.
+        :param count: The number of test cases in the bundle.
+        """
+        shared_gap_kwargs: Dict[str, Any] = {}
+        per_case_gap_kwargs: Dict[str, List[Any]] = {}
         for gap_kwarg_key, gap_kwarg_value in gap_kwargs.items():
             if isinstance(gap_kwarg_value, Iterable) and not isinstance(
                 gap_kwarg_value, str
             ):
-                gap_kwargs[gap_kwarg_key] = list(gap_kwarg_value)
+                gap_kwarg_value = list(gap_kwarg_value)
+                if len(gap_kwarg_value) != count:
+                    # the length of the kwargs should be equal to the number of test cases
+                    # i.e. the length of the combined args
+                    raise ValueError(
+                        f"all gap_ keyword args must have the same length as the test cases, "
+                        f"which is {count}"
+                    )
+                per_case_gap_kwargs[gap_kwarg_key] = gap_kwarg_value
             else:
-                gap_kwargs[gap_kwarg_key] = [gap_kwarg_value] * len(final_params)
-
-        # validate gap input type
-        if not all(
-            len(gap_kwarg_value) == len(final_params)
-            for gap_kwarg_value in gap_kwargs.values()
-        ):
-            # the length of the kwargs should be equal to the number of test cases
-            # i.e. the length of the combined args
-            raise ValueError(
-                f"all gap_ keyword args must have the same length as the test cases, "
-                f"which is {len(final_params)}"
-            )
-
-        # the gap kwargs list we want
-        gap_kwargs_list: List[Dict[str, Any]] = [
-            dict(zip(gap_kwargs.keys(), gap_kwarg_value))
-            for gap_kwarg_value in zip(*gap_kwargs.values())
-        ]
-
-        if not gap_kwargs_list:
-            # generate default gap kwargs dict if there are no gap kwargs
-            gap_kwargs_list = [{} for _ in final_params]
+                shared_gap_kwargs[gap_kwarg_key] = gap_kwarg_value
 
-        for final_param, kwargs in zip(final_params, gap_kwargs_list):
-            final_param.update_gap_kwargs(**kwargs)
+        return shared_gap_kwargs, per_case_gap_kwargs
 
     def __call__(
         self, prob: Problem[ProbInputType, ProbOutputType]
     ) -> Problem[ProbInputType, ProbOutputType]:
         """Generate the test cases as a decorator."""
+        if isinstance(self.final_params, CombinedTestParams):
+            self.final_params.locate_packed_files(prob)
+            prob.add_test_parameter(self.final_params)
+            return prob
+
         for final_param in self.final_params:
             prob = final_param.register_test_param(prob)
 
         return prob
 
 
+class GeneratedTestParam(TestParam):
+    """A test parameter drawn by a TestParamGenerator.
+
+    It keeps the generator it is drawn from, so that a failing input can be shrunk
+    to a simpler counterexample with the same strategies.
+    """
+
+    __slots__ = ("_generator",)
+
+    def __init__(
+        self, generator: TestParamGenerator, *args: Any, **kwargs: Any
+    ) -> None:
+        """Initialize the generated test parameter.
+
+        :param generator: The generator the test parameter is drawn from.
+        :param args: The generated arguments.
+        :param kwargs: The generated keyword arguments and the gap keywords.
+        """
+        super().__init__(*args, **kwargs)
+        self._generator = generator
+
+    @property
+    def generator(self) -> TestParamGenerator:
+        """The generator the test parameter is drawn from."""
+        return self._generator
+
+
+class TestParamGenerator(ParamExtractor, LazyTestParams):
+    """A bundle of test cases generated lazily from strategies (test_cases.generated).
+
+    Only the strategies are stored in the problem, so the generated parameters are
+    not part of the tester pickle. They are drawn every time the tests are generated.
+    """
+
+    def __init__(
+        self,
+        *strategies: Strategy[Any] | Callable[[Random], Any],
+        count: int,
+        seed: int | str | None = None,
+        max_shrinks: int = 100,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the test parameter generator.
+
+            @test_cases.generated(lists(integers()), count=50, gap_name="random lists")
+            @problem()
+            def my_sort(xs: list[int]) -> list[int]: ...
+
+        :param strategies: The strategies of the positional arguments. They are
+            inferred from the annotations of the solution if no strategy is given.
+        :param count: The number of test cases to generate.
+        :param seed: The seed of the generated inputs. By default, it is derived from
+            the gap_name of the bundle, or the name of the solution, and the count,
+            so the same test cases are generated in every run. The strategies are
+            left out, since their representations can differ between runs.
+        :param max_shrinks: The maximum number of extra runs spent shrinking a failing
+            input to a minimal counterexample.
+        :param kwargs: The strategies of the keyword arguments, and the gap keywords
+            applied to every generated test case.
+        """
+        if count < 1:
+            raise ValueError("count must be at least 1.")
+
+        self._gap_kwargs = type(self).extra_gap_info(kwargs)
+        super().__init__(dict(self._gap_kwargs))
+        if self.param_info.gap_fuzz is not None:
+            raise ValueError("Generated test cases cannot be fuzzed.")
+
+        self._arg_strategies = (
+            tuple(as_strategy(strategy) for strategy in strategies)
+            if strategies or kwargs
+            else None
+        )
+        self._kwarg_strategies = {
+            name: as_strategy(strategy) for name, strategy in kwargs.items()
+        }
+        self.count = count
+        self.seed = seed
+        self.max_shrinks = max_shrinks
+
+    def __call__[T: Problem[ProbInputType, ProbOutputType]](self, prob: T) -> T:
+        """Make itself to be a decorator."""
+        prob.add_test_parameter(self)
+        return prob
+
+    def resolve_strategies(
+        self, problem: Problem
+    ) -> tuple[tuple[Strategy[Any], ...], Dict[str, Strategy[Any]]]:
+        """Return the argument strategies, inferring them from the solution if needed.
+
+        :param problem: The problem the test cases are generated for.
+        """
+        if self._arg_strategies is not None:
+            return self._arg_strategies, self._kwarg_strategies
+
+        return infer_strategies(problem), self._kwarg_strategies
+
+    def generate(self, problem: Problem) -> Iterator[GeneratedTestParam]:
+        """Draw the test parameters.
+
+        :param problem: The problem the test cases are generated for.
+        """
+        arg_strategies, kwarg_strategies = self.resolve_strategies(problem)
+        name = self.param_info.gap_name
+        rng = Random(
+            self.seed
+            if self.seed is not None
+            else f"{name or problem.expected_submission_name}:{self.count}"
+        )
+
+        for index in range(self.count):
+            args = tuple(strategy.generate(rng) for strategy in arg_strategies)
+            kwargs = {
+                key: strategy.generate(rng)
+                for key, strategy in kwarg_strategies.items()
+            }
+            _reject_drawn_binary_inputs(args, kwargs)
+            gap_kwargs = dict(self._gap_kwargs)
+            if name is not None:
+                gap_kwargs[GapReservedKeywords.gap_name.value] = f"{name} #{index + 1}"
+
+            yield GeneratedTestParam(self, *args, **kwargs, **gap_kwargs)
+
+    def format(self, with_gap_kwargs: bool = False) -> str:
+        """Format the test parameter generator."""
+        return f"generated(count={self.count})"
+
+
+class RecipeTestParam(TestParam):
+    """A test parameter whose arguments are regenerated from a TestParamRecipe.
+
+    It is formatted as the recipe instead of its arguments, which can be large.
+    """
+
+    __slots__ = ("_recipe",)
+
+    def __init__(self, recipe: TestParamRecipe, *args: Any, **kwargs: Any) -> None:
+        """Initialize the regenerated test parameter.
+
+        :param recipe: The recipe the arguments are regenerated from.
+        :param args: The regenerated arguments.
+        :param kwargs: The regenerated keyword arguments and the gap keywords.
+        """
+        super().__init__(*args, **kwargs)
+        self._recipe = recipe
+
+    @property
+    def source_recipe(self) -> TestParamRecipe:
+        """The recipe the arguments are regenerated from."""
+        return self._recipe
+
+    def format(self, with_gap_kwargs: bool = False) -> str:
+        """Format the test parameter as its recipe."""
+        return self._recipe.format()
+
+
+class TestParamRecipe(ParamExtractor, LazyTestParams):
+    """A test case whose arguments are regenerated from a seeded function (test_case.recipe).
+
+    Only the function and the seed are stored in the problem, so large inputs do not
+    end up in the tester pickle. The arguments are regenerated when the test runs,
+    and dropped with the test case afterwards.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[Random], Iterable[Any] | TestParam],
+        seed: int | str = 0,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the test parameter recipe.
+
+            def big_input(rng: Random) -> TestParam:
+                return param([rng.randint(0, 100) for _ in range(10**6)], k=5)
+
+            @test_case.recipe(big_input, seed=1, gap_max_score=2)
+            @problem()
+            def top_k(xs: list[int], k: int) -> list[int]: ...
+
+        :param fn: The function generating the input from a random.Random seeded with
+            the seed. It returns the positional arguments, or a param() carrying both
+            positional and keyword arguments.
+        :param seed: The seed of the random.Random passed to the function.
+        :param kwargs: The gap keywords of the test case.
+        """
+        self._gap_kwargs = type(self).extra_gap_info(kwargs)
+        if kwargs:
+            raise ValueError(
+                "Recipes only take gap keywords. "
+                "Please return the other arguments from the recipe function."
+            )
+
+        super().__init__(dict(self._gap_kwargs))
+        if self.param_info.gap_fuzz is not None:
+            raise ValueError("Recipe test cases cannot be fuzzed.")
+
+        self.fn = fn
+        self.seed = seed
+
+    def __call__[T: Problem[ProbInputType, ProbOutputType]](self, prob: T) -> T:
+        """Make itself to be a decorator."""
+        prob.add_test_parameter(self)
+        return prob
+
+    def generate(self, problem: Problem) -> Iterator[RecipeTestParam]:
+        """Regenerate the test parameter.
+
+        :param problem: The problem the test parameter is regenerated for.
+        """
+        generated = self.fn(Random(self.seed))
+        if isinstance(generated, TestParam):
+            args, kwargs = generated.args, generated.kwargs
+        else:
+            args, kwargs = tuple(generated), {}
+
+        _reject_drawn_binary_inputs(args, kwargs)
+        yield RecipeTestParam(self, *args, **kwargs, **self._gap_kwargs)
+
+    def format(self, with_gap_kwargs: bool = False) -> str:
+        """Format the recipe as the function name and the seed."""
+        return f"{getattr(self.fn, '__name__', 'recipe')}(seed={self.seed!r})"
+
+
+class TestParamFile(ParamExtractor, LazyTestParams):
+    """A bundle of test cases streamed from a data file (test_cases.from_file).
+
+    Only the path of the file is stored in the problem. The file is packed into the
+    autograder zip, and its rows are read into test cases one at a time when the
+    tests run, so the rows are neither pickled nor kept in memory together.
+    """
+
+    file_formats: ClassVar[Dict[str, str]] = {".jsonl": "jsonl", ".csv": "csv"}
+
+    def __init__(
+        self,
+        path: str | Path,
+        format: str | None = None,
+        converters: Dict[str, Callable[[str], Any]] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the test cases from a data file.
+
+            @test_cases.from_file("data/pairs.csv", gap_max_score=1)
+            @problem()
+            def add(a: int, b: int) -> int: ...
+
+        Each line of a jsonl file is a JSON array of the positional arguments, or a
+        JSON object of the keyword arguments. Each row of a csv file maps the header
+        to the keyword arguments, and the cells are parsed as Python literals when
+        possible, or kept as strings otherwise. So "12345" is an int, while "01234",
+        which is not a valid Python literal, stays a string. Pass converters to pin
+        the type of a column. Empty cells are left out. In both formats, gap keywords
+        can be given per row like the other keyword arguments.
+
+        :param path: The path to the data file. Relative paths are resolved against
+            the folder of the problem file.
+        :param format: The format of the file, either "jsonl" or "csv". It is
+            inferred from the suffix of the path if not given.
+        :param converters: The functions parsing the cells of the csv columns they
+            are keyed by, such as str to keep a column as text, instead of parsing
+            them as Python literals.
+        :param kwargs: The gap keywords applied to every test case in the file.
+        """
+        self._gap_kwargs = type(self).extra_gap_info(kwargs)
+        if kwargs:
+            raise ValueError(
+                "Data files only take gap keywords. "
+                "Please put the other arguments in the rows of the file."
+            )
+
+        super().__init__(dict(self._gap_kwargs))
+        if self.param_info.gap_fuzz is not None:
+            raise ValueError("Test cases from data files cannot be fuzzed.")
+
+        self._file = PackedFile(path)
+        self._converters = converters or {}
+        self.file_format = format or type(self).file_formats.get(
+            self.path.suffix.lower()
+        )
+        if self.file_format not in type(self).file_formats.values():
+            raise ValueError(
+                f"Cannot read test cases from {self.path.name} in format {format}. "
+                f"Please specify one of {', '.join(type(self).file_formats.values())}."
+            )
+
+    def __call__[T: Problem[ProbInputType, ProbOutputType]](self, prob: T) -> T:
+        """Make itself to be a decorator."""
+        self._file.locate(prob)
+        prob.add_test_parameter(self)
+        return prob
+
+    @property
+    def path(self) -> Path:
+        """The path to the data file."""
+        return self._file.path
+
+    def packed_files(self) -> Dict[str, Path]:
+        """The data file, keyed by its name in the autograder zip."""
+        return collect_packed_files([self._file])
+
+    def generate(self, problem: Problem) -> Iterator[TestParam]:
+        """Read the test parameters from the data file one row at a time.
+
+        :param problem: The problem the test parameters are read for.
+        :raises ValueError: If a row cannot be parsed, naming the file and the line.
+        """
+        path = self._file.resolve_path()
+        with open(path, "r", encoding="utf-8", newline="") as data_file:
+            if self.file_format == "csv":
+                rows = self._read_csv(data_file)
+            else:
+                rows = self._read_jsonl(data_file)
+
+            for index, (line, row) in enumerate(rows, start=1):
+                try:
+                    yield self._make_param(self._parse_row(row), index)
+                except (
+                    ValueError,
+                    TypeError,
+                    RecursionError,
+                    MemoryError,
+                ) as e:
+                    raise ValueError(
+                        f"Invalid row {index} at line {line} in {path}: "
+                        f"{type(e).__name__}: {e}"
+                    ) from e
+
+    @staticmethod
+    def _read_jsonl(data_file: Iterable[str]) -> Iterator[tuple[int, str]]:
+        for line, text in enumerate(data_file, start=1):
+            if text.strip():
+                yield line, text
+
+    @staticmethod
+    def _read_csv(
+        data_file: Iterable[str],
+    ) -> Iterator[tuple[int, Dict[str | None, Any]]]:
+        reader = csv.DictReader(data_file)
+        for row in reader:
+            yield reader.line_num, row
+
+    def _parse_row(self, row: str | Dict[str | None, Any]) -> Any:
+        if isinstance(row, str):
+            return json.loads(row)
+
+        if None in row:
+            raise ValueError("The row has more cells than the header.")
+        return {
+            key: self._converters.get(key, _parse_cell)(value)
+            for key, value in row.items()
+            if value
+        }
+
+    def _make_param(self, row: Any, index: int) -> TestParam:
+        if isinstance(row, list):
+            args, kwargs = tuple(row), {}
+        elif isinstance(row, dict):
+            args, kwargs = (), row
+        else:
+            raise ValueError("Rows must be arrays or objects.")
+
+        row_gap_kwargs = type(self).extra_gap_info(kwargs)
+        name = self.param_info.gap_name
+        if (
+            name is not None
+            and GapReservedKeywords.gap_name.value not in row_gap_kwargs
+        ):
+            row_gap_kwargs[GapReservedKeywords.gap_name.value] = f"{name} #{index}"
+
+        param_info = (
+            type(self)._select_param_info({**self._gap_kwargs, **row_gap_kwargs})
+            if row_gap_kwargs
+            else self.param_info
+        )
+        return param._from_parts(args, kwargs, param_info)
+
+    def format(self, with_gap_kwargs: bool = False) -> str:
+        """Format the test cases as the name of the data file."""
+        return f"from_file({self.path.name})"
+
+
+def _parse_cell(value: str) -> Any:
+    """Parse a csv cell as a Python literal, or keep it as a string."""
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return value
+
+
 tcs = TestParamBundle
 test_cases = TestParamBundle
 test_cases_params = partial(test_cases, gap_params=True)
@@ -735,9 +1618,14 @@ test_cases_zip = partial(test_cases, gap_zip=True)
 test_cases_product = partial(test_cases, gap_product=True)
 test_cases_singular_params = partial(test_cases, gap_singular_params=True)
 test_cases_singular_param_iter = partial(test_cases, gap_singular_param_iter=True)
+test_cases_generated = TestParamGenerator
+test_cases_from_file = TestParamFile
 test_cases.params = test_cases_params
 test_cases.param_iter = test_cases_param_iter
 test_cases.product = test_cases_product
 test_cases.zip = test_cases_zip
 test_cases.singular_params = test_cases_singular_params
 test_cases.singular_param_iter = test_cases_singular_param_iter
+test_cases.generated = test_cases_generated
+test_cases.from_file = test_cases_from_file
+test_case.recipe = TestParamRecipe
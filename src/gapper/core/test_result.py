@@ -24,6 +24,7 @@ class TestResult:
     :param pass_status: The pass status of the test.
     :param hidden: Whether the test is hidden.
     :param descriptions: The descriptions of the test.
+    :param stderr: The stderr of the test when it runs in an isolated process.
     """
 
     default_name: str
@@ -36,6 +37,7 @@ class TestResult:
     pass_status: PassStateType | None = field(default=None)
     hidden: bool = False
     descriptions: List[str] = field(default_factory=list)
+    stderr: str | None = None
 
     @property
     def rich_test_name(self) -> str:
@@ -91,6 +93,13 @@ class TestResult:
         """
         self.descriptions = list(detail)
 
+    def set_stderr(self, stderr: str | None) -> None:
+        """Set the stderr of the test, kept for debugging.
+
+        :param stderr: The stderr to set.
+        """
+        self.stderr = stderr
+
     def set_hidden(self, hidden: bool) -> None:
         """Set the hidden status of the test.
 
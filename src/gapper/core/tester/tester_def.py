@@ -2,10 +2,15 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from copy import deepcopy
+from dataclasses import replace
 from pathlib import Path
+from threading import Thread
+from time import monotonic
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Callable, Generator, List, Self
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, List, Self
 
 from dill import Unpickler, dump
 
@@ -16,17 +21,23 @@ from gapper.core.errors import (
     MultipleSubmissionError,
     NoSubmissionError,
 )
-from gapper.core.hook import HookHolder, HookTypes
+from gapper.core.fixtures import FixtureStore
+from gapper.core.hook import HookBase, HookHolder, HookTypes
+from gapper.core.interning import InternReport, intern_test_arguments
 from gapper.core.test_result import TestResult
+from gapper.core.tester.tester_hooks import PostTests
 from gapper.core.types import HookDataBase, PostTestsData, PreTestsData
 from gapper.core.unittest_wrapper.utils import ContextManager
-from gapper.core.utils import ModuleLoader
+from gapper.core.utils import ContextCache, ModuleLoader
 
 if TYPE_CHECKING:
     from gapper.core.problem import Problem
     from gapper.gradescope.datatypes.gradescope_meta import (
         GradescopeSubmissionMetadata,
     )
+    from gapper.gradescope.datatypes.gradescope_output import (
+        GradescopeLeaderboardEntry,
+    )
 
 
 _tester_logger = logging.getLogger("gapper.tester")
@@ -48,6 +59,28 @@ class ProblemUnpickler(Unpickler):
         return super().find_class(module, name)
 
 
+def _run_on_daemon_thread(
+    hook: PostTests, data: HookDataBase
+) -> Future[TestResult | None]:
+    """Run a hook on a daemon thread, which is not joined when the interpreter exits.
+
+    :param hook: The hook to run.
+    :param data: The data to be passed to the hook.
+    :return: The future of the result of the hook.
+    """
+    future: Future[TestResult | None] = Future()
+    future.set_running_or_notify_cancel()
+
+    def _run() -> None:
+        try:
+            future.set_result(hook.run(data))
+        except BaseException as e:
+            future.set_exception(e)
+
+    Thread(target=_run, name=f"gapper-post-tests-{hook.name}", daemon=True).start()
+    return future
+
+
 class Tester[ProbInputType, ProbOutputType](HookHolder, ModuleLoader):
     """The tester class, handling test cases' testing."""
 
@@ -63,6 +96,7 @@ class Tester[ProbInputType, ProbOutputType](HookHolder, ModuleLoader):
         self._problem: Problem[ProbInputType, ProbOutputType] = problem
         self._submission: Any | None = None
         self._submission_context: ContextManager = ContextManager()
+        self._leaderboard: List[GradescopeLeaderboardEntry] = []
         self._logger = _tester_logger.getChild(
             f"Tester_{problem and problem.expected_submission_name}"
         )
@@ -87,6 +121,11 @@ class Tester[ProbInputType, ProbOutputType](HookHolder, ModuleLoader):
         """The context of captured from the submission."""
         return self._submission_context
 
+    @property
+    def leaderboard(self) -> List[GradescopeLeaderboardEntry]:
+        """The leaderboard entries measured in the last run."""
+        return self._leaderboard
+
     def generate_hooks(self, hook_type: HookTypes) -> None:
         match hook_type:
             case HookTypes.PRE_TESTS:
@@ -97,16 +136,75 @@ class Tester[ProbInputType, ProbOutputType](HookHolder, ModuleLoader):
                 raise ValueError(f"Tester cannot use hook of type {hook_type}")
 
     def run_hooks(self, hook_type: HookTypes, data: HookDataBase) -> List[TestResult]:
-        results: List[TestResult] = []
         hooks = self.get_or_gen_hooks(hook_type)
-        for hook in hooks:
-            result = hook.run(data)
-            if result is not None:
-                results.append(result)
+        independent = [
+            hook for hook in hooks if isinstance(hook, PostTests) and hook.independent
+        ]
+        if independent:
+            hook_results = self._run_independent_hooks(hooks, independent, data)
+        else:
+            hook_results = [hook.run(data) for hook in hooks]
+        results = [result for result in hook_results if result is not None]
 
         self._logger.debug(f"Running hook {hook_type} finished")
         return results
 
+    def _run_independent_hooks(
+        self, hooks: List[HookBase], independent: List[PostTests], data: HookDataBase
+    ) -> List[TestResult | None]:
+        """Run the independent hooks on daemon threads while the others run in order.
+
+        Each independent hook gets a shallow copy of the data, so the test results
+        in it are shared with the other hooks and should only be read. The hooks
+        still running when the post_tests_timeout of the problem expires fail their
+        results and are abandoned, since daemon threads do not keep the autograder
+        from exiting.
+
+        :param hooks: All the hooks, in declaration order.
+        :param independent: The hooks that can run concurrently.
+        :param data: The data to be passed to the hooks.
+        :return: The results of the hooks, in declaration order.
+        """
+        timeout = self.problem.config.post_tests_timeout
+        futures: Dict[int, Future[TestResult | None]] = {}
+        for hook in independent:
+            hook.timed_out = False
+            futures[id(hook)] = _run_on_daemon_thread(hook, replace(data))
+        deadline = None if timeout is None else monotonic() + timeout
+
+        results: List[TestResult | None] = []
+        for hook in hooks:
+            if id(hook) not in futures:
+                results.append(hook.run(data))
+                continue
+
+            remaining = None if deadline is None else max(deadline - monotonic(), 0)
+            try:
+                results.append(futures[id(hook)].result(timeout=remaining))
+            except FutureTimeoutError:
+                results.append(self._time_out_hook(hook, timeout))
+
+        return results
+
+    def _time_out_hook(self, hook: PostTests, timeout: float) -> TestResult | None:
+        """Fail the result of a hook that did not finish within the timeout."""
+        hook.timed_out = True
+        self._logger.warning(
+            "The post tests hook %s did not finish in %s seconds", hook.name, timeout
+        )
+        if not hook.as_test_case:
+            return None
+
+        result = TestResult(hook.name)
+        hook._setup_result(result)
+        result.add_error(
+            InternalError(
+                f"The post tests hook {hook.name} did not finish in {timeout} seconds."
+            ),
+            set_failed=True,
+        )
+        return result
+
     def _load_script_submission_from_path(
         self, path: Path
     ) -> Generator[Callable[[], None], None, None]:
@@ -123,6 +221,7 @@ class Tester[ProbInputType, ProbOutputType](HookHolder, ModuleLoader):
                 assert spec.loader is not None
                 spec.loader.exec_module(md)
 
+            run_script.submission_file = md.__file__
             yield run_script
 
     def _load_object_submission_from_path(self, path: Path) -> Any:
@@ -217,33 +316,72 @@ class Tester[ProbInputType, ProbOutputType](HookHolder, ModuleLoader):
 
         self.check_context_completeness()
 
+        fixtures = FixtureStore()
         pre_results = self.run_hooks(
             HookTypes.PRE_TESTS, PreTestsData(metadata=metadata)
         )
-        test_results = self.run_tests(metadata=metadata)
+        fixtures.values.update(
+            (hook.name, hook.value)
+            for hook in self.get_or_gen_hooks(HookTypes.PRE_TESTS)
+            if hook.scope == "session"
+        )
+        test_results = self.run_tests(metadata=metadata, fixtures=fixtures)
         post_test_result = self.run_hooks(
             HookTypes.POST_TESTS,
             PostTestsData(test_results=test_results, metadata=metadata),
         )
+        fixtures.close()
         self.tear_down_hooks(HookTypes.PRE_TESTS)
-        self.tear_down_hooks(HookTypes.PRE_TESTS)
+        self.tear_down_hooks(HookTypes.POST_TESTS)
+
+        self._leaderboard = self.run_benchmarks(test_results)
 
         return [*pre_results, *test_results, *post_test_result]
 
+    def run_benchmarks(
+        self, test_results: List[TestResult]
+    ) -> List[GradescopeLeaderboardEntry]:
+        """Measure the submission for the leaderboard once all the tests pass.
+
+        :param test_results: The results of the test cases.
+        """
+        from gapper.core.problem.extras.leaderboard import run_leaderboard
+
+        if not self.problem.config.extras.get("leaderboard"):
+            return []
+
+        if not all(result.is_passed for result in test_results):
+            self._logger.debug("Benchmarks skipped because not all tests passed")
+            return []
+
+        self._logger.debug("Running benchmarks for the leaderboard")
+        return run_leaderboard(self.problem, deepcopy(self.submission))
+
     def run_tests(
-        self, metadata: GradescopeSubmissionMetadata | None
+        self,
+        metadata: GradescopeSubmissionMetadata | None,
+        fixtures: FixtureStore | None = None,
     ) -> List[TestResult]:
+        """Run the test cases of the problem on the submission.
+
+        :param metadata: The metadata of the submission, which could be None.
+        :param fixtures: The store of the fixtures shared by the tests.
+        """
         test_results: List[TestResult] = []
+        # the hooks of every test apply the same submission context
+        context_cache = ContextCache()
 
         for test in self.problem.generate_tests():
-            self._logger.debug(f"Running test {test.test_param.format()}")
+            default_name = test.test_param.format()
+            self._logger.debug("Running test %s", default_name)
 
             test_results.append(
                 test.load_metadata(metadata)
                 .load_context(self.submission_context)
+                .load_context_cache(context_cache)
+                .load_fixtures(fixtures)
                 .run_test(
-                    deepcopy(self.submission),
-                    TestResult(default_name=test.test_param.format()),
+                    deepcopy(self.submission), TestResult(default_name=default_name)
                 )
             )
 
@@ -262,12 +400,21 @@ class Tester[ProbInputType, ProbOutputType](HookHolder, ModuleLoader):
 
         return tester
 
-    def dump_to(self, path: Path | str) -> None:
+    def dump_to(self, path: Path | str, intern_args: bool = True) -> InternReport:
         """Dump the tester to a file.
 
         :param path: The path to dump the tester to.
+        :param intern_args: Whether to store equal large test arguments only once.
+            See :func:`gapper.core.interning.intern_test_arguments`.
+        :return: The savings of interning the test arguments.
         """
+        report = InternReport()
+        if intern_args and self.problem is not None:
+            report = intern_test_arguments(self.problem)
+            self._logger.debug(report.format())
+
         with open(path, "wb") as f:
             dump(self, f)
 
-        _tester_logger.debug(f"Tester dumped to path {path.absolute()}")
+        _tester_logger.debug(f"Tester dumped to path {Path(path).absolute()}")
+        return report
@@ -1,19 +1,64 @@
 from __future__ import annotations
 
+import logging
+
 from gapper.core.hook import HookBase, HookTypes
+from gapper.core.types import PostTestsFn
+
+_tester_hooks_logger = logging.getLogger("gapper.tester.hooks")
 
 
 class PostTests(HookBase):
-    """A decorator for post tests. Will be used as @post_tests() decorator."""
+    """A decorator for post tests. Will be used as @post_tests() decorator.
+
+    The hooks declared independent run concurrently on daemon threads, within the
+    post_tests_timeout of the problem.
+    """
 
     _hook_type = HookTypes.POST_TESTS
 
+    def __init__(
+        self,
+        hook_fn: PostTestsFn,
+        as_test_case: bool = True,
+        independent: bool = False,
+        **kwargs,
+    ) -> None:
+        """A decorator for post tests.
+
+        :param hook_fn: The function to run after the tests.
+        :param as_test_case: Whether to treat the hook as a test case.
+        :param independent: Whether the hook does not depend on the side effects of
+            the other post tests hooks, so that it can run concurrently with them.
+        :param kwargs: gap keyword parameters.
+        """
+        super().__init__(hook_fn, as_test_case=as_test_case, **kwargs)
+        self.independent = independent
+        self.timed_out = False
+
+    def tear_down(self) -> None:
+        """Tear down the generated generator, unless the hook is still running."""
+        if self.timed_out:
+            _tester_hooks_logger.warning(
+                "Skipping the teardown of the post tests hook %s, which timed out",
+                self.name,
+            )
+            return
+        super().tear_down()
+
 
 post_tests = PostTests
 
 
 class PreTests(HookBase):
+    """A decorator for pre tests. Will be used as @pre_tests() decorator.
+
+    With scope="session", the value the hook function returns or yields first is a
+    fixture passed to all the tests by the name of the function.
+    """
+
     _hook_type = HookTypes.PRE_TESTS
+    _allowed_scopes = ("session",)
 
 
 pre_tests = PreTests
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Protocol, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Protocol,
+    Sequence,
+    Tuple,
+)
 
 if TYPE_CHECKING:
     from gapper.core.test_parameter import TestParam
@@ -35,6 +45,11 @@ class _TCMixin(Protocol):
         """The keyword arguments of the test case."""
         return self.case.test_param.kwargs
 
+    @property
+    def fixtures(self) -> Mapping[str, Any]:
+        """The fixtures available to the test case, keyed by the names of their hooks."""
+        return self.case.fixtures
+
 
 class _SolSubMixin[T](Protocol):
     solution: T
@@ -150,6 +165,21 @@ class CustomEqualityCheckFn(Protocol):
         ...
 
 
+class BatchCheckFn(Protocol):
+    """The function type to be called for element-wise checks of gap_batch results."""
+
+    def __call__(self, expected: Any, actual: Any) -> Sequence[bool]:
+        """Implement.
+
+        :param expected: The batch of results of the solution.
+        :param actual: The batch of results of the submission.
+        :return: Whether each element of the batch of results matches, such as a
+            boolean numpy array.
+        :raises AssertionError: It can raise assertion error if the batches cannot be compared.
+        """
+        ...
+
+
 class PreHookFn(Protocol):
     """The function type to be called for post checks all the equality check of a test case."""
 
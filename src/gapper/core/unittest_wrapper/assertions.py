@@ -0,0 +1,258 @@
+"""Lightweight assertion methods compatible with unittest.TestCase."""
+
+from __future__ import annotations
+
+from functools import cache
+from types import NoneType
+from typing import Any, Callable, Container, Dict, Iterable
+from unittest import TestCase
+
+from gapper.core.diffing import assert_equal
+
+__all__ = ["Assertions"]
+
+EqualityFn = Callable[[Any, Any, str | None], None]
+
+_SCALAR_TYPES = frozenset({int, float, complex, bool, NoneType})
+
+
+def _assert_scalar_equal(first: Any, second: Any, msg: str | None = None) -> None:
+    """Assert that two scalars of the same type are equal."""
+    if first != second:
+        raise AssertionError(_message(msg, f"{first!r} != {second!r}"))
+
+
+@cache
+def _comparator(first_type: type, second_type: type) -> EqualityFn:
+    """Select the equality assertion for a pair of types.
+
+    Scalars of the same type are compared directly, and everything else gets a
+    bounded-cost description of its first difference.
+    """
+    if first_type is second_type and first_type in _SCALAR_TYPES:
+        return _assert_scalar_equal
+    return assert_equal
+
+
+@cache
+def _unittest_case() -> TestCase:
+    """The TestCase instance serving the assertion methods not implemented here."""
+    return TestCase()
+
+
+def _message(msg: str | None, standard: str) -> str:
+    return standard if msg is None else f"{standard} : {msg}"
+
+
+class Assertions:
+    """The assertion methods of unittest.TestCase, without a TestCase per test.
+
+    The common assertions are implemented directly, and assertEqual dispatches on
+    the types of its arguments through a cache. Other TestCase assertions, such as
+    assertRaisesRegex, and the other public TestCase members used by hooks, such as
+    subTest and skipTest, are served by one shared TestCase instance, or by a
+    TestCase of the instance once it registers equality assertions with
+    addTypeEqualityFunc. Setting attributes such as maxDiff on the instance does not
+    reach that TestCase.
+    """
+
+    failureException = AssertionError
+    _type_equality_funcs: Dict[type, EqualityFn] = {}
+
+    def addTypeEqualityFunc(self, typeobj: type, function: EqualityFn) -> None:
+        """Register an equality assertion for values that are both of a type.
+
+        :param typeobj: The type of the values.
+        :param function: The function asserting that two values are equal.
+        """
+        if "_type_equality_funcs" not in vars(self):
+            self._type_equality_funcs = dict(self._type_equality_funcs)
+        self._type_equality_funcs[typeobj] = function
+        vars(self).pop("_delegate_case", None)
+
+    def _unittest_delegate(self) -> TestCase:
+        """The TestCase serving the assertion methods not implemented here.
+
+        It is the shared instance, unless equality assertions are registered, which
+        are then forwarded to a TestCase of this instance.
+        """
+        if not self._type_equality_funcs:
+            return _unittest_case()
+        if (delegate := vars(self).get("_delegate_case")) is None:
+            delegate = TestCase()
+            for typeobj, function in self._type_equality_funcs.items():
+                delegate.addTypeEqualityFunc(typeobj, function)
+            self._delegate_case = delegate
+        return delegate
+
+    def id(self) -> str:
+        """The name of the test, as TestCase.id() returns it."""
+        return f"{type(self).__module__}.{type(self).__qualname__}.runTest"
+
+    def fail(self, msg: str | None = None) -> None:
+        """Fail immediately with the message."""
+        raise AssertionError(msg)
+
+    def assertEqual(self, first: Any, second: Any, msg: str | None = None) -> None:
+        """Assert that first == second."""
+        if self._type_equality_funcs and type(first) is type(second):
+            if (equality_fn := self._type_equality_funcs.get(type(first))) is not None:
+                equality_fn(first, second, msg)
+                return
+
+        _comparator(type(first), type(second))(first, second, msg)
+
+    assertListEqual = assertTupleEqual = assertDictEqual = assertEqual
+    assertSetEqual = assertSequenceEqual = assertMultiLineEqual = assertEqual
+
+    def assertNotEqual(self, first: Any, second: Any, msg: str | None = None) -> None:
+        """Assert that first != second."""
+        if not first != second:
+            raise AssertionError(_message(msg, f"{first!r} == {second!r}"))
+
+    def assertTrue(self, expr: Any, msg: str | None = None) -> None:
+        """Assert that expr is truthy."""
+        if not expr:
+            raise AssertionError(_message(msg, f"{expr!r} is not true"))
+
+    def assertFalse(self, expr: Any, msg: str | None = None) -> None:
+        """Assert that expr is falsy."""
+        if expr:
+            raise AssertionError(_message(msg, f"{expr!r} is not false"))
+
+    def assertIs(self, first: Any, second: Any, msg: str | None = None) -> None:
+        """Assert that first is second."""
+        if first is not second:
+            raise AssertionError(_message(msg, f"{first!r} is not {second!r}"))
+
+    def assertIsNot(self, first: Any, second: Any, msg: str | None = None) -> None:
+        """Assert that first is not second."""
+        if first is second:
+            raise AssertionError(_message(msg, f"unexpectedly identical: {first!r}"))
+
+    def assertIsNone(self, obj: Any, msg: str | None = None) -> None:
+        """Assert that obj is None."""
+        if obj is not None:
+            raise AssertionError(_message(msg, f"{obj!r} is not None"))
+
+    def assertIsNotNone(self, obj: Any, msg: str | None = None) -> None:
+        """Assert that obj is not None."""
+        if obj is None:
+            raise AssertionError(_message(msg, "unexpectedly None"))
+
+    def assertIn(
+        self, member: Any, container: Container, msg: str | None = None
+    ) -> None:
+        """Assert that member is in container."""
+        if member not in container:
+            raise AssertionError(_message(msg, f"{member!r} not found in container"))
+
+    def assertNotIn(
+        self, member: Any, container: Container, msg: str | None = None
+    ) -> None:
+        """Assert that member is not in container."""
+        if member in container:
+            raise AssertionError(
+                _message(msg, f"{member!r} unexpectedly found in container")
+            )
+
+    def assertIsInstance(
+        self, obj: Any, cls: type | tuple[type, ...], msg: str | None = None
+    ) -> None:
+        """Assert that obj is an instance of cls."""
+        if not isinstance(obj, cls):
+            raise AssertionError(
+                _message(msg, f"{obj!r} is not an instance of {cls!r}")
+            )
+
+    def assertNotIsInstance(
+        self, obj: Any, cls: type | tuple[type, ...], msg: str | None = None
+    ) -> None:
+        """Assert that obj is not an instance of cls."""
+        if isinstance(obj, cls):
+            raise AssertionError(_message(msg, f"{obj!r} is an instance of {cls!r}"))
+
+    def assertGreater(self, a: Any, b: Any, msg: str | None = None) -> None:
+        """Assert that a > b."""
+        if not a > b:
+            raise AssertionError(_message(msg, f"{a!r} not greater than {b!r}"))
+
+    def assertGreaterEqual(self, a: Any, b: Any, msg: str | None = None) -> None:
+        """Assert that a >= b."""
+        if not a >= b:
+            raise AssertionError(
+                _message(msg, f"{a!r} not greater than or equal to {b!r}")
+            )
+
+    def assertLess(self, a: Any, b: Any, msg: str | None = None) -> None:
+        """Assert that a < b."""
+        if not a < b:
+            raise AssertionError(_message(msg, f"{a!r} not less than {b!r}"))
+
+    def assertLessEqual(self, a: Any, b: Any, msg: str | None = None) -> None:
+        """Assert that a <= b."""
+        if not a <= b:
+            raise AssertionError(
+                _message(msg, f"{a!r} not less than or equal to {b!r}")
+            )
+
+    def assertAlmostEqual(
+        self,
+        first: Any,
+        second: Any,
+        places: int | None = None,
+        msg: str | None = None,
+        delta: float | None = None,
+    ) -> None:
+        """Assert that first and second are equal up to places or delta."""
+        if first == second:
+            return
+        if delta is not None and places is not None:
+            raise TypeError("specify delta or places not both")
+
+        diff = abs(first - second)
+        if delta is not None:
+            if diff <= delta:
+                return
+            standard = (
+                f"{first!r} != {second!r} within {delta!r} delta ({diff!r} difference)"
+            )
+        else:
+            places = 7 if places is None else places
+            if round(diff, places) == 0:
+                return
+            standard = f"{first!r} != {second!r} within {places!r} places ({diff!r} difference)"
+        raise AssertionError(_message(msg, standard))
+
+    def assertNotAlmostEqual(
+        self,
+        first: Any,
+        second: Any,
+        places: int | None = None,
+        msg: str | None = None,
+        delta: float | None = None,
+    ) -> None:
+        """Assert that first and second differ by more than places or delta."""
+        self._unittest_delegate().assertNotAlmostEqual(
+            first, second, places, msg, delta
+        )
+
+    def assertCountEqual(
+        self, first: Iterable[Any], second: Iterable[Any], msg: str | None = None
+    ) -> None:
+        """Assert that first and second have the same elements, regardless of order."""
+        self._unittest_delegate().assertCountEqual(first, second, msg)
+
+    def assertRaises(self, expected_exception: Any, *args: Any, **kwargs: Any) -> Any:
+        """Assert that the callable or the with block raises expected_exception."""
+        return self._unittest_delegate().assertRaises(
+            expected_exception, *args, **kwargs
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        """Serve the other public members of unittest.TestCase."""
+        if not name.startswith("_") and hasattr(TestCase, name):
+            return getattr(self._unittest_delegate(), name)
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
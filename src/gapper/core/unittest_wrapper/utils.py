@@ -30,7 +30,12 @@ def stdout_cm_adder[Output](
     fn: Callable[..., Output]
 ) -> Callable[..., ResultBundle[Output]]:
     def _wrapper(self, *args, **kwargs) -> Any:
-        with CaptureStdout(capture=self.problem.config.check_stdout) as cm:
+        with CaptureStdout(
+            capture=bool(self.problem.config.check_stdout),
+            max_length=self.problem.config.max_stdout,
+            device=self._stdout_device,
+            fd=self.problem.config.isolate,
+        ) as cm:
             res = fn(self, *args, **kwargs)
 
         return ResultBundle(res, cm.value)
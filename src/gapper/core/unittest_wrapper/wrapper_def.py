@@ -3,29 +3,52 @@
 from __future__ import annotations
 
 import logging
+from contextlib import nullcontext
 from copy import deepcopy
+from dataclasses import fields
+from functools import partial
 from types import FunctionType
 from typing import (
     TYPE_CHECKING,
     Any,
+    ChainMap,
+    Dict,
+    List,
+    Mapping,
     Self,
     Sequence,
     Tuple,
 )
-from unittest import TestCase
-from unittest.mock import patch
 
+from gapper.core.batch import (
+    MAX_REPORTED_MISMATCHES,
+    batch_element,
+    elementwise_equal,
+    find_mismatches,
+)
+from gapper.core.diffing import assert_equal
 from gapper.core.errors import (
+    ErrorFormatter,
+    ForwardedError,
     InternalError,
+    IsolatedProcessError,
     StudentError,
     SubmissionSyntaxError,
     TestFailedError,
 )
-from gapper.core.hook import HookHolder
+from gapper.core.fixtures import FixtureStore, ScopedHook
+from gapper.core.fuzzing import shrink_failure
+from gapper.core.hook import HookBase, HookHolder
+from gapper.core.isolation import run_forked
+from gapper.core.packed_files import load_binary_inputs
 from gapper.core.pipeline_support import PipelineBase
+from gapper.core.profiler import HotLineSampler, submission_source_files
+from gapper.core.stdout_check import StdoutCheck, StdoutComparer
+from gapper.core.test_parameter import GeneratedTestParam, TestParam
 from gapper.core.test_result import TestResult
 from gapper.core.tester import HookTypes
 from gapper.core.types import (
+    BatchCheckFn,
     CustomEqualityCheckFn,
     CustomTestData,
     CustomTestFn,
@@ -33,16 +56,18 @@ from gapper.core.types import (
     PreHookData,
     ResultBundle,
 )
+from gapper.core.unittest_wrapper.assertions import Assertions
 from gapper.core.unittest_wrapper.utils import ContextManager, EvalFn, stdout_cm_adder
 from gapper.core.unittest_wrapper.wrapper_hooks import PostHook, PreHook
 from gapper.core.utils import (
+    ContextCache,
+    SpillingTextIO,
     apply_context_on_fn,
-    generate_custom_input,
+    mock_stdin,
 )
 
 if TYPE_CHECKING:
     from gapper.core.problem import Problem
-    from gapper.core.test_parameter import TestParam
     from gapper.gradescope.datatypes.gradescope_meta import (
         GradescopeSubmissionMetadata,
     )
@@ -50,26 +75,46 @@ if TYPE_CHECKING:
 _test_wrapper_logger = logging.getLogger("gapper.test_wrapper")
 
 
-class TestCaseWrapper(TestCase, HookHolder):
-    """A wrapper for the unittest.TestCase class.
+def _format_error(error: ErrorFormatter) -> str:
+    """Format an error, falling back to its arguments if it has no format."""
+    try:
+        return error.format()
+    except NotImplementedError:
+        return f"{type(error).__name__}: {error.format_args()}\n"
+
+
+class TestCaseWrapper(Assertions, HookHolder):
+    """A test case of a problem, run against submissions.
 
     This serves as a proxy for the testing process to get useful
-    information about the test and functions for testing
+    information about the test and functions for testing. It provides the
+    assertion methods of unittest.TestCase without being one, so that creating a
+    test case for each test parameter stays cheap.
     """
 
+    __test__ = False
+
     def __init__(self, test_param: TestParam, problem: Problem) -> None:
         """Create a test case wrapper.
 
         :param test_param: The test parameter to be used in testing.
         :param problem: The problem definition to be used in testing.
         """
-        TestCase.__init__(self)
         HookHolder.__init__(self)
         self._test_param = test_param
         self._problem = problem
         self._context: ContextManager | None = None
         self._metadata: GradescopeSubmissionMetadata | None = None
-        self._logger = _test_wrapper_logger.getChild(self.test_param.format())
+        self._stdout_device: SpillingTextIO | None = None
+        self._context_cache: ContextCache | None = None
+        self._fixtures: FixtureStore | None = None
+        self._test_fixtures: Dict[str, Any] = {}
+        # only name the logger after the test parameter when it is going to be used
+        self._logger = (
+            _test_wrapper_logger.getChild(self.test_param.format())
+            if _test_wrapper_logger.isEnabledFor(logging.DEBUG)
+            else _test_wrapper_logger
+        )
 
     @property
     def test_param(self) -> TestParam:
@@ -81,6 +126,13 @@ class TestCaseWrapper(TestCase, HookHolder):
         """The problem definition to be used in testing."""
         return self._problem
 
+    @property
+    def fixtures(self) -> Mapping[str, Any]:
+        """The fixtures available to the test, keyed by the names of their hooks."""
+        return ChainMap(
+            self._test_fixtures, {} if self._fixtures is None else self._fixtures.values
+        )
+
     @property
     def context(self) -> ContextManager | None:
         """The context of the submission."""
@@ -93,12 +145,13 @@ class TestCaseWrapper(TestCase, HookHolder):
 
     @stdout_cm_adder
     def _eval_regular[Input](self, to_be_eval: Input, param: TestParam) -> Any:
-        return to_be_eval(*deepcopy(param.args), **deepcopy(param.kwargs))
+        args, kwargs = load_binary_inputs(deepcopy(param.args), deepcopy(param.kwargs))
+        return to_be_eval(*args, **kwargs)
 
     @stdout_cm_adder
     def _eval_mock_input[Input](self, to_be_eval: Input, param: TestParam) -> Any:
         """Evaluate the function with mock input."""
-        with patch("builtins.input", generate_custom_input(deepcopy(param.args))):
+        with mock_stdin(param.args):
             result = to_be_eval()
 
         return result
@@ -135,10 +188,57 @@ class TestCaseWrapper(TestCase, HookHolder):
         :param result: The result object to be used and written to.
         :return: The result object passed to this method.
         """
+        if self._fixtures is not None:
+            self._fixtures.start_test(self._scoped_hooks())
+
+        if self.problem.config.isolate:
+            return self._run_test_isolated(submission, result)
+        return self._run_test_in_process(submission, result)
+
+    def _run_test_isolated(self, submission: Any, result: TestResult) -> TestResult:
+        """Run the test in a forked process, and copy its result and stderr back.
+
+        The errors are formatted in the child, where their tracebacks are available.
+
+        :param submission: The submission to be tested.
+        :param result: The result object to be used and written to.
+        """
+
+        def _run_in_child() -> TestResult:
+            self._run_test_in_process(submission, result)
+            if self._fixtures is not None:
+                self._fixtures.close()
+            result.errors[:] = [ForwardedError(_format_error(e)) for e in result.errors]
+            return result
+
+        self._logger.debug("Running test in a forked process")
+        try:
+            child_result, stderr = run_forked(_run_in_child)
+        except IsolatedProcessError as e:
+            self._setup_test_result(result)
+            result.add_error(e)
+            stderr = e.stderr
+        else:
+            for result_field in fields(TestResult):
+                setattr(
+                    result, result_field.name, getattr(child_result, result_field.name)
+                )
+
+        result.set_stderr(stderr or None)
+        return result
+
+    def _run_test_in_process(self, submission: Any, result: TestResult) -> TestResult:
+        """Run the test on the submission in this process.
+
+        :param submission: The submission to be tested.
+        :param result: The result object to be used and written to.
+        """
         self._setup_test_result(result)
+        sampler = self._create_sampler(submission)
 
         try:
-            self._run_test(submission, result)
+            with sampler or nullcontext():
+                self._run_test(submission, result)
         except AssertionError as e:
             result.add_error(TestFailedError(e), set_failed=result.is_pass_status_unset)
         except SyntaxError as e:
@@ -147,14 +247,50 @@ class TestCaseWrapper(TestCase, HookHolder):
             )
         except InternalError as e:
             result.add_error(InternalError(e), set_failed=result.is_pass_status_unset)
+        except StudentError as e:
+            result.add_error(e, set_failed=result.is_pass_status_unset)
         except Exception as e:
             result.add_error(StudentError(e), set_failed=result.is_pass_status_unset)
         else:
             if result.is_pass_status_unset:
                 result.set_pass_status("passed")
 
+        if isinstance(self.test_param, GeneratedTestParam) and not result.is_passed:
+            try:
+                self._shrink_generated(submission, result)
+            except Exception as e:
+                self._logger.debug(f"Shrinking failed: {e!r}")
+                result.add_description(
+                    f"Shrinking the failing input failed: {type(e).__name__}: {e}"
+                )
+
+        if sampler is not None and not result.is_passed:
+            result.add_description(
+                *sampler.format_report(self.test_param.param_info.gap_profile)
+            )
+
         return result
 
+    def _create_sampler(self, submission: Any) -> HotLineSampler | None:
+        """Create a sampler profiling the submission if the test asks for it.
+
+        The submission is not profiled if its source files cannot be found, since
+        the hot lines of the problem would then be reported as the student's.
+
+        :param submission: The submission to be profiled.
+        """
+        if not self.test_param.param_info.gap_profile:
+            return None
+
+        if not (source_files := submission_source_files(submission)):
+            self._logger.debug(
+                "Source files of the submission not found, not profiling"
+            )
+            return None
+
+        self._logger.debug("Profiling the submission with a hot line sampler")
+        return HotLineSampler(source_files)
+
     def check_test(self) -> Tuple[bool, Any, str] | None:
         """Check if the test passes against the gap_expect and gap_expect_stdout.
 
@@ -175,8 +311,10 @@ class TestCaseWrapper(TestCase, HookHolder):
                 check_fn: CustomEqualityCheckFn = (
                     self.test_param.param_info.gap_override_check
                 )
+            elif self.test_param.param_info.gap_batch:
+                check_fn = self._assert_batch_equal  # type: ignore
             else:
-                check_fn = self.assertEqual  # type: ignore
+                check_fn = assert_equal  # type: ignore
 
             self._logger.debug(f"Checking test equality with fn {check_fn.__name__}")
 
@@ -199,7 +337,11 @@ class TestCaseWrapper(TestCase, HookHolder):
 
             if self.test_param.param_info.gap_expect_stdout is not None:
                 try:
-                    assert actual_out == self.test_param.param_info.gap_expect_stdout
+                    self._check_stdout(
+                        self.test_param.param_info.gap_expect_stdout,
+                        actual_out,
+                        assert_equal,
+                    )
                 except AssertionError:
                     self._logger.debug(
                         "Check failed because it does not meet gap_expect_stdout"
@@ -250,15 +392,50 @@ class TestCaseWrapper(TestCase, HookHolder):
                 hook_fns: Sequence = [hook_fns]
 
             self._hooks[hook_type] = [
-                hook_wrapper(self.apply_context(hook_fn)) for hook_fn in hook_fns
+                self._wrap_hook(hook_fn, hook_wrapper) for hook_fn in hook_fns
             ]
 
         self._logger.debug(f"Generated {hook_type} hooks")
 
+    def _wrap_hook(
+        self, hook_fn: Any, hook_wrapper: type[HookBase]
+    ) -> HookBase | ScopedHook:
+        """Wrap a hook function, or a hook declared with pre_hook or post_hook.
+
+        The hooks of a session or bundle scope stand for fixtures kept in the
+        fixture store of the run, if one is loaded.
+        """
+        if not isinstance(hook_fn, HookBase):
+            return hook_wrapper(self.apply_context(hook_fn))
+
+        def _create() -> HookBase:
+            hook = hook_wrapper(self.apply_context(hook_fn.hook_fn))
+            hook.scope = hook_fn.scope
+            return hook
+
+        if hook_fn.scope in ("session", "bundle") and self._fixtures is not None:
+            return ScopedHook(hook_fn, _create, self._fixtures)
+        return _create()
+
+    def _scoped_hooks(self) -> List[HookBase]:
+        """The pre hooks of the test declared with a session or bundle scope."""
+        hook_fns = self.test_param.param_info.gap_pre_hooks
+        if hook_fns is None:
+            return []
+        if not isinstance(hook_fns, Sequence):
+            hook_fns = [hook_fns]
+        return [
+            hook_fn
+            for hook_fn in hook_fns
+            if isinstance(hook_fn, HookBase) and hook_fn.scope in ("session", "bundle")
+        ]
+
     def run_hooks(self, hook_type: HookTypes, data) -> None:
         self._logger.debug(f"Start running {hook_type} hooks")
         for hook in self.get_or_gen_hooks(hook_type):
             hook.run(data)
+            if getattr(hook, "scope", None) == "test":
+                self._test_fixtures[hook.name] = hook.value
         self._logger.debug(f"Finished running {hook_type} hooks")
 
     def _run_test(self, submission: Any, result: TestResult) -> TestResult:
@@ -277,6 +454,9 @@ class TestCaseWrapper(TestCase, HookHolder):
             override_test(
                 CustomTestData(self, result, self.problem.solution, submission)
             )
+        elif self.test_param.param_info.gap_fuzz is not None:
+            self._logger.debug("Fuzzing the submission against the solution")
+            self._run_fuzz(submission, result)
         else:
             eval_fn: EvalFn = self._select_eval_fn()
             self._logger.debug(f"Selected evaluation fn {eval_fn.__name__}")
@@ -288,9 +468,17 @@ class TestCaseWrapper(TestCase, HookHolder):
 
             self._logger.debug(f"Running test evaluation")
             expected = eval_fn(self.problem.solution, self.test_param)
-            actual = eval_fn(submission, self.test_param)
+            if streaming := isinstance(self.problem.config.check_stdout, StdoutCheck):
+                actual = self._eval_streaming_stdout(eval_fn, submission, expected)
+            else:
+                actual = eval_fn(submission, self.test_param)
 
-            self.check_results(expected, actual)
+            if self.test_param.param_info.gap_batch:
+                self.check_batch_results(
+                    expected, actual, result, check_stdout=not streaming
+                )
+            else:
+                self.check_results(expected, actual, check_stdout=not streaming)
 
             self.run_hooks(
                 HookTypes.POST_HOOK,
@@ -311,27 +499,231 @@ class TestCaseWrapper(TestCase, HookHolder):
 
         return result
 
-    def check_results(self, expected: ResultBundle, actual: ResultBundle) -> None:
+    def _eval_streaming_stdout(
+        self, eval_fn: EvalFn, submission: Any, expected: ResultBundle
+    ) -> ResultBundle:
+        """Evaluate the submission, comparing its stdout with the solution's as it prints.
+
+        :param eval_fn: The evaluation function.
+        :param submission: The submission to be tested.
+        :param expected: The results of the solution.
+        :raises StdoutDivergence: If the stdout diverges. When the check stops early,
+            it is raised from the print call completing the first diverging line.
+        """
+        comparer = StdoutComparer(
+            expected.stdout,
+            self.problem.config.check_stdout,
+            hard_limit=self.problem.config.max_stdout,
+        )
+        self._stdout_device = comparer
+        try:
+            actual = eval_fn(submission, self.test_param)
+        except BaseException:
+            comparer.close()
+            raise
+        finally:
+            self._stdout_device = None
+
+        try:
+            # also catches a divergence the submission swallowed
+            comparer.finish()
+        finally:
+            # deletes the temporary file the output spilled to, if any
+            comparer.close()
+        return actual
+
+    def _find_divergence(
+        self, submission: Any, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> str | None:
+        """Compare the submission with the solution on an input.
+
+        Inputs the solution raises on are treated as invalid and never diverge.
+
+        :param submission: The submission to be tested.
+        :param args: The positional arguments of the input.
+        :param kwargs: The keyword arguments of the input.
+        :return: The reason of the divergence, or None if they agree.
+        """
+        eval_fn: EvalFn = self._select_eval_fn()
+        input_param = TestParam(*args, **kwargs)
+
+        try:
+            expected = eval_fn(self.problem.solution, input_param)
+        except Exception:
+            return None
+
+        try:
+            actual = eval_fn(submission, input_param)
+        except Exception as e:
+            return f"The submission raised {type(e).__name__}: {e}"
+
+        try:
+            self.check_results(expected, actual)
+        except AssertionError as e:
+            return str(e)
+
+        return None
+
+    def _run_fuzz(self, submission: Any, result: TestResult) -> None:
+        """Compare the submission with the solution on random inputs.
+
+        :param submission: The submission to be tested.
+        :param result: The result object to be used and written to.
+        :raises AssertionError: If the submission diverges from the solution.
+        """
+        report = self.test_param.param_info.gap_fuzz.run(
+            self.problem, partial(self._find_divergence, submission)
+        )
+        result.add_description(
+            f"Tried {report.examples} random inputs in {report.elapsed:.2f} seconds."
+        )
+
+        if report.failure is not None:
+            args, kwargs = report.failure
+            raise AssertionError(
+                f"The submission diverges from the solution on the input "
+                f"{TestParam(*args, **kwargs).format()}.\n{report.message}"
+            )
+
+    def _shrink_generated(self, submission: Any, result: TestResult) -> None:
+        """Shrink the failing input of a generated test to a minimal counterexample.
+
+        :param submission: The submission to be tested.
+        :param result: The result object to be used and written to.
+        """
+        generator = self.test_param.generator
+        diverges = partial(self._find_divergence, submission)
+        failure = (self.test_param.args, self.test_param.kwargs)
+
+        if (message := diverges(*failure)) is None:
+            self._logger.debug("Failure not reproduced by comparison, not shrinking")
+            return
+
+        arg_strategies, kwarg_strategies = generator.resolve_strategies(self.problem)
+        shrunk = shrink_failure(
+            failure,
+            message,
+            arg_strategies,
+            kwarg_strategies,
+            diverges,
+            generator.max_shrinks,
+        )
+        self._logger.debug(f"Shrinking finished: {shrunk}")
+
+        if shrunk.shrinks:
+            args, kwargs = shrunk.failure
+            result.add_description(
+                f"Minimal failing input found in {shrunk.tries + 1} extra runs: "
+                f"{TestParam(*args, **kwargs).format()}.\n{shrunk.message}"
+            )
+
+    def check_results(
+        self, expected: ResultBundle, actual: ResultBundle, check_stdout: bool = True
+    ) -> None:
+        """Check the results of the submission against the solution's.
+
+        :param expected: The results of the solution.
+        :param actual: The results of the submission.
+        :param check_stdout: Whether to check the stdout when the problem checks it,
+            which is skipped when it is already compared while streaming.
+        :raises AssertionError: If the results differ.
+        """
         if self.test_param.param_info.gap_override_check:
             check_fn: CustomEqualityCheckFn = (
                 self.test_param.param_info.gap_override_check
             )
         else:
-            check_fn = self.assertEqual  # type: ignore
+            check_fn = assert_equal  # type: ignore
         self._logger.debug(f"Checking test equality with fn {check_fn.__name__}")
 
         check_fn(expected.output, actual.output)
-        if self.problem.config.check_stdout:
-            check_fn(expected.stdout, actual.stdout)
+        if check_stdout and self.problem.config.check_stdout:
+            self._check_stdout(expected.stdout, actual.stdout, check_fn)
 
         self._logger.debug("Test checked")
 
+    def _check_stdout(
+        self, expected: str, actual: str, check_fn: CustomEqualityCheckFn
+    ) -> None:
+        """Check the stdout with the StdoutCheck of the problem, or else check_fn."""
+        if isinstance(self.problem.config.check_stdout, StdoutCheck):
+            self.problem.config.check_stdout.compare(expected, actual)
+        else:
+            check_fn(expected, actual)
+
+    def _select_batch_check_fn(self) -> BatchCheckFn:
+        """Select the element-wise check of a gap_batch test."""
+        if callable(self.test_param.param_info.gap_batch):
+            return self.test_param.param_info.gap_batch
+        else:
+            return elementwise_equal
+
+    def _assert_batch_equal(self, actual: Any, expected: Any) -> None:
+        """Assert that all elements of two batches of results match."""
+        matches = self._select_batch_check_fn()(expected, actual)
+        if mismatches := find_mismatches(matches):
+            raise AssertionError(
+                f"{len(mismatches)} of {len(matches)} batch elements do not match."
+            )
+
+    def check_batch_results(
+        self,
+        expected: ResultBundle,
+        actual: ResultBundle,
+        result: TestResult,
+        check_stdout: bool = True,
+    ) -> None:
+        """Check the results of a gap_batch test element-wise.
+
+        The first few mismatching elements are described in the result, with their
+        inputs and outputs.
+
+        :param expected: The results of the solution on the batch.
+        :param actual: The results of the submission on the batch.
+        :param result: The result object to be used and written to.
+        :param check_stdout: Whether to check the stdout when the problem checks it.
+        :raises AssertionError: If any element of the batch does not match.
+        """
+        check_fn = self._select_batch_check_fn()
+        self._logger.debug(f"Checking batch elements with fn {check_fn.__name__}")
+
+        matches = check_fn(expected.output, actual.output)
+        mismatches = find_mismatches(matches)
+        if mismatches:
+            args, kwargs = load_binary_inputs(
+                self.test_param.args, self.test_param.kwargs
+            )
+            for index in mismatches[:MAX_REPORTED_MISMATCHES]:
+                element_args, element_kwargs = batch_element(args, kwargs, index)
+                result.add_description(
+                    f"Element {index} on input "
+                    f"{TestParam(*element_args, **element_kwargs).format()}: "
+                    f"expected {expected.output[index]!r}, "
+                    f"got {actual.output[index]!r}."
+                )
+            if len(mismatches) > MAX_REPORTED_MISMATCHES:
+                result.add_description(
+                    f"{len(mismatches) - MAX_REPORTED_MISMATCHES} more mismatching "
+                    f"elements are not shown."
+                )
+            raise AssertionError(
+                f"The submission differs from the solution on {len(mismatches)} "
+                f"of {len(matches)} batch elements."
+            )
+
+        if check_stdout and self.problem.config.check_stdout:
+            self._check_stdout(expected.stdout, actual.stdout, assert_equal)
+
+        self._logger.debug("Batch checked")
+
     def apply_context[T: FunctionType](self, fn: T) -> T:
         if (
             self.problem.config.easy_context
             or self.test_param.param_info.gap_easy_context
         ):
             self._logger.debug("Using easy context")
+            if self._context_cache is not None:
+                return self._context_cache.apply(fn, self.context)
             return apply_context_on_fn(fn, self.context)
         else:
             return fn
@@ -345,6 +737,22 @@ class TestCaseWrapper(TestCase, HookHolder):
         self._logger.debug(f"Context loaded: {self._context}")
         return self
 
+    def load_context_cache(self, cache: ContextCache | None) -> Self:
+        """Load the cache of context-applied functions shared by a run of the tests.
+
+        :param cache: The cache to load, or None to apply the context anew each time.
+        """
+        self._context_cache = cache
+        return self
+
+    def load_fixtures(self, fixtures: FixtureStore | None) -> Self:
+        """Load the store of the fixtures shared by a run of the tests.
+
+        :param fixtures: The store to load, or None to create every fixture per test.
+        """
+        self._fixtures = fixtures
+        return self
+
     def load_metadata(self, metadata: GradescopeSubmissionMetadata | None) -> Self:
         """Load the submission metadata into the test case.
 
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+from gapper.core.fixtures import FIXTURE_SCOPES, FixtureScope
 from gapper.core.hook import HookBase, HookTypes
 from gapper.core.types import PostHookFn, PreHookFn
 
 
 class PreHook(HookBase):
+    """A hook run before a test, which can be passed to gap_pre_hooks.
+
+    With a scope, the hook creates a fixture shared by the tests of the scope: once
+    per run of the tests with "session", once per consecutive tests using it, such
+    as those of a bundle, with "bundle", and once per test with "test".
+    """
+
     _hook_type = HookTypes.PRE_HOOK
+    _allowed_scopes = FIXTURE_SCOPES
 
-    def __init__(self, hook_fn: PreHookFn, **kwargs) -> None:
-        super().__init__(hook_fn, as_test_case=False, **kwargs)
+    def __init__(
+        self, hook_fn: PreHookFn, scope: FixtureScope | None = None, **kwargs
+    ) -> None:
+        super().__init__(hook_fn, as_test_case=False, scope=scope, **kwargs)
 
 
 pre_hook = PreHook
@@ -1,13 +1,19 @@
 """Utility functions and classes for the core module."""
 from __future__ import annotations
 
+import codecs
+import hashlib
 import importlib.util
 import logging
-from contextlib import redirect_stdout
+import os
+import sys
+import tempfile
+import threading
+from contextlib import AbstractContextManager, contextmanager, redirect_stdout
 from copy import copy
 from functools import update_wrapper
 from importlib.machinery import ModuleSpec
-from io import StringIO
+from io import StringIO, TextIOBase
 from pathlib import Path
 from types import FunctionType, ModuleType
 from typing import (
@@ -15,10 +21,15 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Generator,
     Iterable,
     Self,
+    TextIO,
     Tuple,
 )
+from unittest.mock import patch
+
+from gapper.core.errors import OutputLimitError
 
 if TYPE_CHECKING:
     pass
@@ -27,13 +38,45 @@ if TYPE_CHECKING:
 _util_logger = logging.getLogger("gapper.core.utils")
 
 
-def generate_custom_input(input_list: Iterable[str]) -> Callable[[Any], str]:
+STDIN_MEMORY_LIMIT = 16 * 1024 * 1024
+"""The number of mocked stdin characters kept in memory before using a temporary file."""
+
+
+def make_stdin(
+    input_list: Iterable[str], memory_limit: int = STDIN_MEMORY_LIMIT
+) -> TextIO:
+    """Create a stdin replacement serving the inputs as lines.
+
+    The inputs are joined into one buffer, so that input(), sys.stdin.read(),
+    sys.stdin.readline() and iterating over sys.stdin are all served from it.
+    Inputs longer than the memory limit are served from a temporary file.
+
+    :param input_list: The inputs, one line each.
+    :param memory_limit: The number of characters kept in memory.
+    :return: The stdin replacement, positioned at the start.
+    """
+    lines = [line if line.endswith("\n") else f"{line}\n" for line in input_list]
+    if sum(map(len, lines)) <= memory_limit:
+        return StringIO("".join(lines))
+
+    stdin = tempfile.TemporaryFile("w+", encoding="utf-8", errors="surrogatepass")
+    stdin.writelines(lines)
+    stdin.seek(0)
+    return stdin
+
+
+def generate_custom_input(
+    input_list: Iterable[str], stdin: TextIO | None = None
+) -> Callable[[Any], str]:
     """Generate a custom input function for a test case.
 
     :param input_list: The list of inputs to be used.
+    :param stdin: The stdin replacement to read the inputs from instead, which is
+        shared with the submission in mock_stdin.
     :return: The custom input function.
     """
-    _iterator = iter(input_list)
+    if stdin is None:
+        stdin = make_stdin(input_list)
 
     def _custom_input(*args: Any) -> str:
         """Mimic `input`'s behavior.
@@ -47,28 +90,245 @@ def generate_custom_input(input_list: Iterable[str]) -> Callable[[Any], str]:
         On *nix systems, readline is used if available.
         """
         print(*(str(arg) for arg in args), end="")
-        return next(_iterator).rstrip("\n")
+        line = stdin.readline()
+        if not line:
+            raise EOFError("EOF when reading a line")
+        return line.removesuffix("\n")
 
     return _custom_input
 
 
+@contextmanager
+def mock_stdin(input_list: Iterable[str]) -> Generator[TextIO, None, None]:
+    """Serve the inputs to input() and sys.stdin.
+
+    The prompts of input() are printed to stdout, so they are captured with it.
+
+    :param input_list: The inputs, one line each.
+    :return: The stdin replacement.
+    """
+    with make_stdin(input_list) as stdin:
+        with (
+            patch("builtins.input", generate_custom_input((), stdin)),
+            patch("sys.stdin", stdin),
+        ):
+            yield stdin
+
+
+STDOUT_MEMORY_LIMIT = 1024 * 1024
+"""The number of captured stdout characters kept in memory before spilling to disk."""
+
+_STDOUT_PREVIEW_LENGTH = 500
+
+PIPE_DRAIN_TIMEOUT = 1.0
+"""The seconds to wait for the rest of a pipe once its writer in this process is done.
+
+Processes spawned by the submission can keep the pipe open, and the output they
+print later is not captured.
+"""
+
+_PIPE_CHUNK_SIZE = 64 * 1024
+
+
+class SpillingTextIO(TextIOBase):
+    """A text stream kept in memory up to a limit, and in a temporary file beyond it.
+
+    A digest of the text is updated as it is written, and writing past the hard
+    limit keeps the text up to it and raises an OutputLimitError.
+    """
+
+    def __init__(
+        self, memory_limit: int = STDOUT_MEMORY_LIMIT, hard_limit: int | None = None
+    ) -> None:
+        """Create a spilling text stream.
+
+        :param memory_limit: The number of characters kept in memory.
+        :param hard_limit: The number of characters that can be written, or None
+            for no limit.
+        """
+        super().__init__()
+        self._memory_limit = memory_limit
+        self._hard_limit = hard_limit
+        self._buffer = StringIO()
+        self._spill: TextIO | None = None
+        self._length = 0
+        self._head = ""
+        self._digest = hashlib.blake2b(digest_size=16)
+
+    def writable(self) -> bool:
+        """Return True, since the stream is writable."""
+        return True
+
+    def write(self, s: str) -> int:
+        """Write the text to memory, or to the temporary file once it is spilled.
+
+        :param s: The text to write.
+        :raises OutputLimitError: If the text goes past the hard limit, after the
+            part of it up to the limit is written.
+        """
+        if self._hard_limit is not None and self._length + len(s) > self._hard_limit:
+            if remaining := self._hard_limit - self._length:
+                self.write(s[:remaining])
+            raise OutputLimitError(self._hard_limit, self._head)
+
+        self._length += len(s)
+        self._digest.update(s.encode("utf-8", "surrogatepass"))
+        if len(self._head) < _STDOUT_PREVIEW_LENGTH:
+            self._head += s[: _STDOUT_PREVIEW_LENGTH - len(self._head)]
+
+        if self._spill is None and self._length > self._memory_limit:
+            self._spill = tempfile.TemporaryFile(
+                "w+", encoding="utf-8", errors="surrogatepass"
+            )
+            self._spill.write(self._buffer.getvalue())
+            self._buffer = StringIO()
+
+        (self._spill or self._buffer).write(s)
+        return len(s)
+
+    @property
+    def length(self) -> int:
+        """The number of characters written."""
+        return self._length
+
+    @property
+    def spilled(self) -> bool:
+        """Whether the text is spilled to a temporary file."""
+        return self._spill is not None
+
+    @property
+    def digest(self) -> str:
+        """The hex digest of the text written so far."""
+        return self._digest.hexdigest()
+
+    def getvalue(self) -> str:
+        """Return the text written so far."""
+        if self._spill is None:
+            return self._buffer.getvalue()
+
+        self._spill.flush()
+        self._spill.seek(0)
+        value = self._spill.read()
+        self._spill.seek(0, 2)
+        return value
+
+    def close(self) -> None:
+        """Close the stream and delete the temporary file."""
+        if self._spill is not None:
+            self._spill.close()
+        super().close()
+
+
+class PipeDrain(threading.Thread):
+    """A daemon thread reading a pipe to its end and writing the text to a stream.
+
+    The first error the stream raises, such as an OutputLimitError, is kept in
+    error, and the rest of the pipe is read and discarded so its writers never block.
+    """
+
+    def __init__(self, fd: int, stream: TextIOBase) -> None:
+        """Create a pipe drain.
+
+        :param fd: The read end of the pipe, which is closed by the drain.
+        :param stream: The stream to write the text to.
+        """
+        super().__init__(daemon=True)
+        self._fd = fd
+        self._stream = stream
+        self.error: Exception | None = None
+
+    def run(self) -> None:
+        """Read the pipe until all its write ends are closed."""
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        with open(self._fd, "rb", buffering=0) as pipe:
+            while chunk := pipe.read(_PIPE_CHUNK_SIZE):
+                self._write(decoder.decode(chunk))
+        self._write(decoder.decode(b"", final=True))
+
+    def _write(self, text: str) -> None:
+        if text and self.error is None:
+            try:
+                self._stream.write(text)
+            except Exception as e:
+                self.error = e
+
+
+class _FdRedirect(AbstractContextManager):
+    """Redirect file descriptor 1, and sys.stdout with it, into a drained pipe.
+
+    This captures what C extensions, os.write and subprocesses print as well.
+    """
+
+    def __init__(self, stream: TextIOBase) -> None:
+        self._stream = stream
+
+    def __enter__(self) -> Self:
+        sys.stdout.flush()
+        read_fd, write_fd = os.pipe()
+        self._drain = PipeDrain(read_fd, self._stream)
+        self._drain.start()
+
+        self._saved_fd = os.dup(1)
+        os.dup2(write_fd, 1)
+        os.close(write_fd)
+        self._saved_stdout = sys.stdout
+        sys.stdout = open(1, "w", encoding="utf-8", buffering=1, closefd=False)
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        try:
+            sys.stdout.close()
+        finally:
+            sys.stdout = self._saved_stdout
+            os.dup2(self._saved_fd, 1)
+            os.close(self._saved_fd)
+
+        self._drain.join(PIPE_DRAIN_TIMEOUT)
+        if exc_type is None and self._drain.error is not None:
+            raise self._drain.error
+
+
 class CaptureStdout:
-    """A context manager to capture stdout."""
+    """A context manager to capture stdout.
+
+    The captured text is kept in memory up to STDOUT_MEMORY_LIMIT characters, and
+    spilled to a temporary file beyond it.
+    """
 
-    def __init__(self, capture: bool) -> None:
+    def __init__(
+        self,
+        capture: bool,
+        max_length: int | None = None,
+        device: SpillingTextIO | None = None,
+        fd: bool = False,
+    ) -> None:
         """Create a context manager to capture stdout.
 
         :param capture: Whether to capture stdout.
+        :param max_length: The number of characters that can be printed before an
+            OutputLimitError is raised, or None for no limit. Ignored with device.
+        :param device: The stream to capture stdout into, or None for a new one.
+        :param fd: Whether to capture file descriptor 1 through a pipe, including
+            the output of C extensions and subprocesses. The limit and the stdout
+            checks are then applied once the output is drained.
         """
         self._capture: bool = capture
-        self._capture_device: redirect_stdout[StringIO] | None = None
-        self._io_device: StringIO | None = None
+        self._max_length = max_length
+        self._fd = fd
+        self._capture_device: AbstractContextManager | None = None
+        self._io_device: SpillingTextIO | None = device
+        self._value: str | None = None
 
     def __enter__(self) -> Self:
         """Enter as a context manager."""
         if self._capture:
-            self._io_device = StringIO()
-            self._capture_device = redirect_stdout(self._io_device)
+            if self._io_device is None:
+                self._io_device = SpillingTextIO(hard_limit=self._max_length)
+            self._capture_device = (
+                _FdRedirect(self._io_device)
+                if self._fd
+                else redirect_stdout(self._io_device)
+            )
             self._capture_device.__enter__()
         return self
 
@@ -82,7 +342,18 @@ class CaptureStdout:
     def value(self) -> str | None:
         """The captured stdout."""
         if self._capture and self._io_device:
-            return self._io_device.getvalue()
+            if self._value is None:
+                self._value = self._io_device.getvalue()
+                self._io_device.close()
+            return self._value
+        else:
+            return None
+
+    @property
+    def digest(self) -> str | None:
+        """The hex digest of the captured stdout."""
+        if self._capture and self._io_device:
+            return self._io_device.digest
         else:
             return None
 
@@ -134,7 +405,7 @@ def apply_context_on_fn[T: FunctionType](f: T, context: dict[str, Any]) -> T:
     if not isinstance(f, FunctionType):
         raise TypeError(f"Cannot apply context on {f} because it is not a function")
 
-    _util_logger.debug(f"Applying context {context} on function {f}")
+    _util_logger.debug("Applying context %s on function %s", context, f)
 
     _util_logger.debug("check duplicates in local variables")
     for local_var_name in f.__code__.co_varnames:
@@ -145,18 +416,7 @@ def apply_context_on_fn[T: FunctionType](f: T, context: dict[str, Any]) -> T:
 
     # update closure with context
     _util_logger.debug("Gathering closure with context")
-    closure_mod: Dict[str, int] = {}
-    if f.__closure__ is not None:
-        for index, closure_var_name in enumerate(f.__code__.co_freevars):
-            if closure_var_name in context:
-                _util_logger.debug(
-                    f'Found closure variable "{closure_var_name}" ({index}) in context'
-                )
-                closure_mod[closure_var_name] = index
-            else:
-                _util_logger.debug(
-                    f'Cannot find closure variable "{closure_var_name}" in context, skipped"'
-                )
+    closure_mod = _context_closure_positions(f, context)
 
     g = FunctionType(
         f.__code__,
@@ -175,12 +435,75 @@ def apply_context_on_fn[T: FunctionType](f: T, context: dict[str, Any]) -> T:
     g = update_wrapper(g, f)
     g.__kwdefaults__ = copy(f.__kwdefaults__)
 
-    _util_logger.debug(f"Function {f} copied")
+    _util_logger.debug("Function %s copied", f)
 
     for c_name, c_pos in closure_mod.items():
-        _util_logger.debug(f"Updating closure variable {c_name} at position {c_pos}")
+        _util_logger.debug("Updating closure variable %s at position %s", c_name, c_pos)
         g.__closure__[c_pos].cell_contents = context[c_name]
 
     _util_logger.debug("Closure updated")
 
     return g
+
+
+def _context_closure_positions(
+    f: FunctionType, context: dict[str, Any]
+) -> Dict[str, int]:
+    """Find the closure variables of a function that are in the context."""
+    closure_mod: Dict[str, int] = {}
+    if f.__closure__ is not None:
+        for index, closure_var_name in enumerate(f.__code__.co_freevars):
+            if closure_var_name in context:
+                _util_logger.debug(
+                    'Found closure variable "%s" (%s) in context',
+                    closure_var_name,
+                    index,
+                )
+                closure_mod[closure_var_name] = index
+            else:
+                _util_logger.debug(
+                    'Cannot find closure variable "%s" in context, skipped"',
+                    closure_var_name,
+                )
+    return closure_mod
+
+
+class ContextCache:
+    """Functions with a submission context applied, memoized for a run of the tests.
+
+    Every test loads its own copy of the same submission context. The first test
+    builds the function with apply_context_on_fn, and later tests only refresh the
+    context values in its globals and closure, instead of rebuilding the function and
+    merging the globals of its module again.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty cache."""
+        self._functions: Dict[
+            FunctionType, Tuple[FunctionType, frozenset[str], Dict[str, int]]
+        ] = {}
+
+    def apply[T: FunctionType](self, f: T, context: dict[str, Any]) -> T:
+        """Apply a context on a function, reusing the function built for it before.
+
+        :param f: The function to apply context on.
+        :param context: The context to be applied, which has the same names for all
+            the calls with the same function.
+        :return: The function with context applied.
+        """
+        names = frozenset(context)
+        cached = self._functions.get(f)
+        if cached is None or cached[1] != names:
+            g = apply_context_on_fn(f, context)
+            self._functions[f] = (g, names, _context_closure_positions(f, context))
+            return g
+
+        g, _, closure_mod = cached
+        g.__globals__.update(
+            (c_name, c_val)
+            for c_name, c_val in context.items()
+            if c_name not in closure_mod
+        )
+        for c_name, c_pos in closure_mod.items():
+            g.__closure__[c_pos].cell_contents = context[c_name]
+        return g
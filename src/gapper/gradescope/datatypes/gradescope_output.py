@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Literal, Optional
+from typing import TYPE_CHECKING, List, Literal, Optional, Union
 
 from dataclasses_json import dataclass_json
 
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 VisibilityType = Literal["hidden", "after_due_date", "after_published", "visible"]
 FormatType = Literal["text", "html", "simple_format", "md", "ansi"]
 PassStateType = Literal["passed", "failed"]
+LeaderboardOrderType = Literal["asc", "desc"]
 
 
 @dataclass_json
@@ -64,13 +65,28 @@ class GradescopeTestJson:
         )
 
 
+@dataclass_json
+@dataclass
+class GradescopeLeaderboardEntry:
+    """The JSON schema for a single leaderboard entry.
+
+    :param name: The name of the leaderboard column.
+    :param value: The value of the submission in this column.
+    :param order: The ranking order of the column. "desc" ranks higher values higher.
+    """
+
+    name: str
+    value: Union[float, int, str]
+    order: LeaderboardOrderType = field(default="desc")
+
+
 @dataclass_json
 @dataclass
 class GradescopeJson:
     """The JSON schema for Gradescope.
 
-    We currently don't support the leaderboard and extra_data features of the gradescope
-    schema. Those are documented on the autograder documentation, here:
+    We currently don't support the extra_data feature of the gradescope schema.
+    It is documented on the autograder documentation, here:
     <https://gradescope-autograders.readthedocs.io/en/latest/specs/>.
 
     :param tests: The tests for the problem. Required if no global score provided.
@@ -79,6 +95,7 @@ class GradescopeJson:
     :param output: The top-level, human-readable text output for all the problems.
     :param visibility: The default visibility for each test. Overridden by test-specific settings.
     :param stdout_visibility: Whether to show stdout for the tests. Same options as for visibility.
+    :param leaderboard: The leaderboard entries of the submission.
     """
 
     score: Optional[float] = None
@@ -87,6 +104,7 @@ class GradescopeJson:
     output: Optional[str] = None
     visibility: VisibilityType = "visible"
     stdout_visibility: Optional[str] = None
+    leaderboard: Optional[List[GradescopeLeaderboardEntry]] = None
 
     @classmethod
     def from_test_results(
@@ -44,7 +44,7 @@ def run_autograder(
         metadata = GradescopeSubmissionMetadata.from_file(metadata_file)
         results = tester.run(metadata=metadata)
         ResultSynthesizer(results=results, metadata=metadata).to_gradescope_json(
-            save_path=output_file
+            save_path=output_file, leaderboard=tester.leaderboard or None
         )
     except InternalError as e:
         _autograder_main_logger.error(
@@ -2,6 +2,7 @@
 from pathlib import Path
 
 DEFAULT_TESTER_PICKLE_NAME = "tester.pckl"
+DEFAULT_TEST_DATA_FOLDER = "test_data"
 
 AUTOGRADER_ROOT = Path("/autograder")
 AUTOGRADER_SRC = AUTOGRADER_ROOT / "source"
@@ -0,0 +1,21 @@
+from gapper import binary_input, param, problem, test_case, test_cases
+
+
+@test_cases.params(
+    [binary_input("data/measurements.bin", cast="d"), 2],
+    param(binary_input("data/measurements.bin", cast="d"), k=4),
+)
+@test_case(binary_input("data/measurements.bin", cast="d"))
+@problem()
+def largest(xs: memoryview, k: int = 1) -> list[float]:
+    return sorted(xs, reverse=True)[:k]
+
+
+__problem_config__ = {
+    "is_script": False,
+    "check_stdout": False,
+    "mock_input": False,
+    "captured_context": (),
+    "easy_context": True,
+    "extras": {},
+}
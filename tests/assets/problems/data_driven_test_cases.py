@@ -0,0 +1,20 @@
+from typing import List
+
+from gapper import problem, test_cases
+
+
+@test_cases.from_file("data/weighted_sum.csv", gap_name="csv row")
+@test_cases.from_file("data/weighted_sum.jsonl", gap_max_score=2)
+@problem()
+def weighted_sum(xs: List[int], weight: int = 1) -> int:
+    return sum(xs) * weight
+
+
+__problem_config__ = {
+    "is_script": False,
+    "check_stdout": False,
+    "mock_input": False,
+    "captured_context": (),
+    "easy_context": True,
+    "extras": {},
+}
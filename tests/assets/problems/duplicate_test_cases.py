@@ -0,0 +1,19 @@
+from gapper import param, problem, test_case, test_cases
+
+
+@test_cases.params([1, 2], [2, 1], param(1, 2, gap_weight=2))
+@test_case(1, 2)
+@problem(deduplicate="report")
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+__problem_config__ = {
+    "is_script": False,
+    "check_stdout": False,
+    "mock_input": False,
+    "captured_context": (),
+    "easy_context": True,
+    "deduplicate": "report",
+    "extras": {},
+}
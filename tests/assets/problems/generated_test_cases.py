@@ -0,0 +1,25 @@
+from typing import List
+
+from gapper import problem, test_case, test_cases
+from gapper.core.fuzzing import integers, lists
+
+
+@test_cases.generated(lists(integers(-50, 50)), integers(0, 5), count=20)
+@test_cases.generated(count=10, gap_name="inferred inputs", gap_max_score=2)
+@test_case([1, 2, 3], 2)
+@problem()
+def rotate(xs: List[int], k: int) -> List[int]:
+    if not xs:
+        return []
+    k %= len(xs)
+    return xs[k:] + xs[:k]
+
+
+__problem_config__ = {
+    "is_script": False,
+    "check_stdout": False,
+    "mock_input": False,
+    "captured_context": (),
+    "easy_context": True,
+    "extras": {},
+}
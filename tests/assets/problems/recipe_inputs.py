@@ -0,0 +1,31 @@
+from random import Random
+from typing import List
+
+from gapper import param, problem, test_case
+from gapper.core.test_parameter import TestParam
+
+
+def many_numbers(rng: Random) -> List[List[int]]:
+    return [[rng.randint(-100, 100) for _ in range(20_000)]]
+
+
+def numbers_with_k(rng: Random) -> TestParam:
+    return param([rng.randint(0, 10) for _ in range(10_000)], k=rng.randint(1, 5))
+
+
+@test_case.recipe(numbers_with_k, seed="k", gap_max_score=2)
+@test_case.recipe(many_numbers, seed=1)
+@test_case.recipe(many_numbers, seed=2, gap_name="many numbers")
+@problem()
+def count_multiples(xs: List[int], k: int = 3) -> int:
+    return sum(1 for x in xs if x % k == 0)
+
+
+__problem_config__ = {
+    "is_script": False,
+    "check_stdout": False,
+    "mock_input": False,
+    "captured_context": (),
+    "easy_context": True,
+    "extras": {},
+}
@@ -0,0 +1,5 @@
+import heapq
+
+
+def largest(xs: memoryview, k: int = 1) -> list[float]:
+    return heapq.nlargest(k, xs)
@@ -0,0 +1,8 @@
+from typing import List
+
+
+def weighted_sum(xs: List[int], weight: int = 1) -> int:
+    total = 0
+    for x in xs:
+        total += x * weight
+    return total
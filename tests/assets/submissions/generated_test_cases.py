@@ -0,0 +1,8 @@
+from typing import List
+
+
+def rotate(xs: List[int], k: int) -> List[int]:
+    if not xs:
+        return []
+    k %= len(xs)
+    return xs[k:] + xs[:k]
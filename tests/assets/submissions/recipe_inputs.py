@@ -0,0 +1,5 @@
+from typing import List
+
+
+def count_multiples(xs: List[int], k: int = 3) -> int:
+    return len([x for x in xs if x % k == 0])
@@ -106,3 +106,20 @@ def test_problem_gen_with_file_path(prob: Path, verbose: bool, tmp_path: Path) -
 
     assert result.exit_code == 0
     assert file_path.exists()
+
+
+@pytest.mark.parametrize(
+    "prob",
+    sorted(preset_problem_paths(), key=lambda x: x.name),
+)
+def test_problem_minimize(prob: Path, tmp_path: Path) -> None:
+    args = [
+        "minimize",
+        str(prob.absolute()),
+        "-o",
+        str(tmp_path / "keep.json"),
+    ]
+
+    result = CliRunner().invoke(cli_app, args)
+    assert result.exit_code == 0
+    assert (tmp_path / "keep.json").exists()
@@ -0,0 +1,126 @@
+from typing import List
+
+import pytest
+from gapper import param, problem
+from gapper.core.batch import MAX_REPORTED_MISMATCHES, elementwise_equal
+from gapper.core.errors import InternalError
+from gapper.core.test_result import TestResult
+from gapper.core.unittest_wrapper import TestCaseWrapper
+
+
+@problem()
+def squares(xs: List[int]) -> List[int]:
+    return [x * x for x in xs]
+
+
+def run_batch(test_param, submission) -> TestResult:
+    wrapper = TestCaseWrapper(test_param, squares)
+    return wrapper.run_test(submission, TestResult("batch"))
+
+
+def test_batch_passes_correct_submission() -> None:
+    result = run_batch(param(list(range(100)), gap_batch=True), squares.solution)
+
+    assert result.pass_status == "passed"
+    assert result.descriptions == []
+
+
+def test_batch_reports_first_mismatches() -> None:
+    result = run_batch(
+        param(list(range(20)), gap_batch=True),
+        lambda xs: [x * x if x < 10 else x for x in xs],
+    )
+
+    assert result.pass_status == "failed"
+    assert len(result.descriptions) == MAX_REPORTED_MISMATCHES + 1
+    assert result.descriptions[0] == "Element 10 on input (10): expected 100, got 10."
+    assert result.descriptions[-1].startswith("5 more mismatching")
+    (error,) = result.errors
+    assert "on 10 of 20 batch elements" in error.format()
+
+
+def test_batch_custom_check() -> None:
+    def close(expected: List[int], actual: List[int]) -> List[bool]:
+        return [abs(e - a) <= 1 for e, a in zip(expected, actual)]
+
+    result = run_batch(
+        param([1, 2, 3], gap_batch=close), lambda xs: [x * x + 1 for x in xs]
+    )
+
+    assert result.pass_status == "passed"
+
+
+def test_batch_length_mismatch() -> None:
+    result = run_batch(param([1, 2, 3], gap_batch=True), lambda xs: [1])
+
+    assert result.pass_status == "failed"
+    (error,) = result.errors
+    assert "has 1 results, but 3 are expected" in error.format()
+
+
+def test_batch_gap_expect() -> None:
+    test_param = param([1, 2, 3], gap_batch=True, gap_expect=[1, 4, 9])
+
+    passed, *_ = TestCaseWrapper(test_param, squares).check_test()
+
+    assert passed
+
+
+@pytest.mark.parametrize(
+    "gap_kwargs",
+    [
+        {"gap_fuzz": object()},
+        {"gap_override_test": lambda data: None},
+        {"gap_override_check": lambda expected, actual: None},
+        {"gap_is_pipeline": True},
+    ],
+)
+def test_batch_conflicting_keywords(gap_kwargs) -> None:
+    with pytest.raises(ValueError, match="Cannot specify gap_batch"):
+        param([1], gap_batch=True, **gap_kwargs)
+
+
+def test_elementwise_equal_numpy_rows() -> None:
+    np = pytest.importorskip("numpy")
+
+    expected = np.arange(12).reshape(4, 3)
+    actual = expected.copy()
+    actual[2, 1] = -1
+
+    assert elementwise_equal(expected, actual).tolist() == [True, True, False, True]
+
+    with pytest.raises(AssertionError, match="shape"):
+        elementwise_equal(expected, actual[:2])
+
+
+def test_batch_numpy_arrays() -> None:
+    np = pytest.importorskip("numpy")
+
+    @problem()
+    def scale(xs, factor):
+        return xs * factor
+
+    result = TestCaseWrapper(
+        param(np.arange(6.0), np.full(6, 2.0), gap_batch=True), scale
+    ).run_test(lambda xs, factor: np.where(xs == 3, 0, xs * factor), TestResult("np"))
+
+    assert result.pass_status == "failed"
+    assert result.descriptions[0].startswith("Element 3 on input")
+
+
+def test_elementwise_equal_list_of_numpy_arrays() -> None:
+    np = pytest.importorskip("numpy")
+
+    expected = [np.arange(3), np.arange(3)]
+    actual = [np.arange(3), np.zeros(3)]
+
+    assert elementwise_equal(expected, actual) == [True, False]
+
+
+def test_elementwise_equal_ambiguous_elements() -> None:
+    class Ambiguous:
+        def __eq__(self, other: object) -> bool:
+            raise ValueError("truth value is ambiguous")
+
+    with pytest.raises(InternalError, match="cannot be compared with =="):
+        elementwise_equal([Ambiguous()], [Ambiguous()])
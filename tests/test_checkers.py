@@ -0,0 +1,130 @@
+import math
+from typing import List
+
+import pytest
+from gapper import param, problem
+from gapper.core.checkers import allclose, mapping_equal, sequence_equal
+from gapper.core.test_result import TestResult
+from gapper.core.unittest_wrapper import TestCaseWrapper
+
+
+def check_diff(checker, expected, actual) -> str | None:
+    try:
+        checker(expected, actual)
+    except AssertionError as e:
+        return str(e)
+    return None
+
+
+@pytest.mark.parametrize(
+    "checker, expected, actual, diff",
+    [
+        (allclose(), [[1.0, 2.0], [3.0, 4.0]], [[1.0, 2.0], [3.0, 4.0 + 1e-9]], None),
+        (
+            allclose(),
+            [[1.0, 2.0], [3.0, 4.0]],
+            [[1.0, 2.0], [3.0, 4.1]],
+            "At [1][1]: expected 4.0, got 4.1",
+        ),
+        (allclose(atol=0.1), {"a": [1, 2], "b": "x"}, {"a": [1, 2.05], "b": "x"}, None),
+        (
+            allclose(),
+            {"a": [1, 2], "b": "x"},
+            {"a": [1, 2], "c": "x"},
+            "Missing keys ['b'], unexpected keys ['c']",
+        ),
+        (allclose(), [1.0, "a"], [1.0, "b"], "At [1]: expected 'a', got 'b'"),
+        (allclose(), math.nan, math.nan, "Expected nan, got nan"),
+        (allclose(equal_nan=True), math.nan, math.nan, None),
+        (allclose(), [1, 2], (1, 2), None),
+        (sequence_equal(), [1, 2, 3], (x for x in [1, 2, 4]), "At [2]: expected 3"),
+        (sequence_equal(), [1, 2, 3], 3, "Expected a sequence, got 3"),
+        (sequence_equal(ordered=False), [3, 1, 2], {1, 2, 3}, None),
+        (
+            sequence_equal(ordered=False),
+            [3, 1, 2, 2],
+            [1, 2, 3, 4],
+            "1 missing items [2], 1 unexpected items [4]",
+        ),
+        (sequence_equal(ordered=False, atol=0.01), [2.0, 1.0], [1.001, 2.0], None),
+        (
+            sequence_equal(ordered=False, atol=0.01),
+            [3.0, 1.0],
+            [1.0, 3.5],
+            "1 missing items [3.0], 1 unexpected items [3.5]",
+        ),
+        (sequence_equal(ordered=False), [[1], [2]], [[2], [1]], None),
+        (mapping_equal(atol=0.1), {"a": 1.0}, {"a": 1.05}, None),
+        (mapping_equal(), {"a": 1.0}, {"a": 1.05}, "At ['a']: expected 1.0, got 1.05"),
+        (mapping_equal(), {"a": 1.0}, [1.0], "Expected a mapping, got [1.0]"),
+    ],
+)
+def test_checker_diff(checker, expected, actual, diff) -> None:
+    result = check_diff(checker, expected, actual)
+
+    if diff is None:
+        assert result is None
+    else:
+        assert result is not None and result.startswith(diff)
+
+
+@pytest.mark.parametrize(
+    "checker, expected, actual, diff",
+    [
+        (allclose(rtol=1e-3), "x = 1.0001\ny = 2", "x = 1.0\ny = 2", None),
+        (allclose(), "x = 1.1", "x = 1.0", "Line 1: expected 'x = 1.1'"),
+        (allclose(), "a\nb", "a\nb\n", "Expected 2 lines, got 3"),
+        (sequence_equal(ordered=False), "a\nb", "b\na", None),
+        (sequence_equal(ordered=False), "a\nb", "b\nc", "1 missing items ['a']"),
+    ],
+)
+def test_checker_text_diff(checker, expected, actual, diff) -> None:
+    result = check_diff(checker, expected, actual)
+
+    if diff is None:
+        assert result is None
+    else:
+        assert result is not None and result.startswith(diff)
+
+
+def test_checker_numpy_arrays() -> None:
+    np = pytest.importorskip("numpy")
+
+    expected = np.zeros((3, 4))
+    actual = expected.copy()
+    actual[1, 2] = actual[2, 3] = 1
+
+    assert check_diff(allclose(), expected, expected + 1e-12) is None
+    assert (
+        check_diff(allclose(), expected, actual)
+        == "At [1][2]: expected 0.0, got 1.0 (2 of 12 elements differ)"
+    )
+    assert check_diff(allclose(), expected, actual[:2]).startswith("Expected shape")
+
+
+def test_checker_negative_tolerance() -> None:
+    with pytest.raises(ValueError):
+        allclose(rtol=-1)
+
+
+@problem(check_stdout=True)
+def mean(xs: List[float]) -> float:
+    print(f"mean: {sum(xs) / len(xs)}")
+    return sum(xs) / len(xs)
+
+
+def test_checker_as_override_check() -> None:
+    def submission(xs: List[float]) -> float:
+        total = 0.0
+        for x in reversed(xs):
+            total += x / len(xs)
+        print(f"mean: {total}")
+        return total
+
+    exact = TestCaseWrapper(param([0.1] * 10), mean)
+    assert exact.run_test(submission, TestResult("exact")).pass_status == "failed"
+
+    wrapper = TestCaseWrapper(param([0.1] * 10, gap_override_check=allclose()), mean)
+    result = wrapper.run_test(submission, TestResult("mean"))
+
+    assert result.pass_status == "passed"
@@ -0,0 +1,95 @@
+from typing import Any
+
+from gapper import problem, test_case, test_cases
+from gapper.core.coverage import (
+    CaseCoverage,
+    CoverageCollector,
+    measure_test_coverage,
+    minimize_suite,
+)
+from gapper.core.test_parameter import param
+
+
+@test_cases.singular_params(-1, 0, 1, 2, -5)
+@problem()
+def sign(x: int) -> str:
+    if x > 0:
+        return "positive"
+    elif x < 0:
+        return "negative"
+    else:
+        return "zero"
+
+
+def test_measure_coverage() -> None:
+    coverages = measure_test_coverage(sign)
+
+    assert [case.index for case in coverages] == [0, 1, 2, 3, 4]
+    assert all(case.is_measured for case in coverages)
+    assert coverages[0].covered == coverages[4].covered
+    assert coverages[0].covered != coverages[1].covered
+    assert coverages[2].covered == coverages[3].covered
+
+
+def test_hot_loop_branches_are_disabled() -> None:
+    calls = 0
+
+    class CountingCollector(CoverageCollector):
+        def _on_branch(self, *args: Any) -> Any:
+            nonlocal calls
+            calls += 1
+            return super()._on_branch(*args)
+
+    def spin(n: int) -> int:
+        total = 0
+        for i in range(n):
+            if i % 2:
+                total += i
+        return total
+
+    with CountingCollector([__file__]) as collector:
+        spin(10_000)
+
+    assert calls < 10
+    assert any(entry[0] == "branch" for entry in collector.covered)
+
+
+def test_minimize_sign() -> None:
+    report = minimize_suite(measure_test_coverage(sign))
+
+    assert sorted(entry.case.index for entry in report.keep) == [0, 1, 2]
+    assert [case.index for case in report.redundant] == [3, 4]
+    assert all(entry.gain > 0 for entry in report.keep)
+    assert report.total_coverage == sum(entry.gain for entry in report.keep)
+
+
+def test_minimize_greedy_order() -> None:
+    coverages = [
+        CaseCoverage(0, param(0), frozenset({1})),
+        CaseCoverage(1, param(1), frozenset({1, 2, 3})),
+        CaseCoverage(2, param(2), frozenset({3, 4})),
+        CaseCoverage(3, param(3), frozenset({2})),
+        CaseCoverage(4, param(4), None),
+    ]
+    report = minimize_suite(coverages)
+
+    assert [(entry.case.index, entry.gain) for entry in report.keep] == [
+        (1, 3),
+        (2, 1),
+        (4, 0),
+    ]
+    assert [case.index for case in report.redundant] == [0, 3]
+    assert report.total_coverage == 4
+
+
+@test_case(0)
+@problem()
+def fails(x: int) -> int:
+    raise ValueError(f"bad {x}")
+
+
+def test_measure_records_error() -> None:
+    (case,) = measure_test_coverage(fails)
+
+    assert case.is_measured
+    assert case.error == "ValueError: bad 0"
@@ -0,0 +1,130 @@
+from collections import OrderedDict
+
+import pytest
+from gapper.core.diffing import DiffBudget, assert_equal, render_diff
+
+
+def test_render_diff_equal_values() -> None:
+    assert render_diff([1, {"a": "b"}], [1, {"a": "b"}]) is None
+
+
+def test_render_diff_large_list() -> None:
+    expected = list(range(100_000))
+    actual = list(expected)
+    actual[500] = -1
+    actual[70_000] = -1
+
+    assert render_diff(expected, actual).split("\n") == [
+        "First difference at [500]: expected 500, got -1.",
+        "  expected: [..., 498, 499, 500, 501, 502, ...]",
+        "  actual:   [..., 498, 499, -1, 501, 502, ...]",
+        "1 more difference.",
+    ]
+
+
+def test_render_diff_counting_budget() -> None:
+    expected = list(range(1000))
+    actual = [x + 1 for x in expected]
+
+    description = render_diff(expected, actual, DiffBudget(max_count=10))
+
+    assert description.endswith("At least 10 more differences.")
+
+
+def test_render_diff_nested() -> None:
+    description = render_diff(
+        {"a": [1, 2, {"b": "hello world"}], "c": 1},
+        {"a": [1, 2, {"b": "hello wOrld"}], "d": 1},
+    )
+
+    assert description.split("\n") == [
+        "First difference at ['a'][2]['b'] at character 7: "
+        "expected 'hello world', got 'hello wOrld'.",
+        "2 more differences.",
+    ]
+
+
+def test_render_diff_text_lines() -> None:
+    description = render_diff("a\nb\nc\nd\ne\nf", "a\nb\nc\nX\ne\nf\ng")
+
+    assert description.split("\n") == [
+        "First difference at line 4 at character 0: expected 'd', got 'X'.",
+        "Expected lines 2-6:",
+        "  'b'",
+        "  'c'",
+        "  'd'",
+        "  'e'",
+        "  'f'",
+        "Actual lines 2-6:",
+        "  'b'",
+        "  'c'",
+        "  'X'",
+        "  'e'",
+        "  'f'",
+        "1 more difference.",
+    ]
+
+
+@pytest.mark.parametrize(
+    "expected, actual, first_line",
+    [
+        ([1, 2, 3], [1, 2], "Length differs: expected 3 items, got 2."),
+        ([1, 2], (1, 2), "First difference: expected [1, 2], got (1, 2)."),
+        ({"a": 1}, {}, "Missing at ['a']: expected 1."),
+        ({}, {"a": 1}, "Unexpected at ['a']: got 1."),
+        (1, 2, "First difference: expected 1, got 2."),
+    ],
+)
+def test_render_diff_kinds(expected, actual, first_line) -> None:
+    assert render_diff(expected, actual).split("\n")[0] == first_line
+
+
+def test_render_diff_max_length() -> None:
+    description = render_diff(
+        ["x" * 1000, 1], ["y" * 1000, 2], DiffBudget(max_length=50)
+    )
+
+    assert len(description) == 50
+    assert description.endswith("... (truncated)")
+
+
+def test_render_diff_numpy_arrays() -> None:
+    np = pytest.importorskip("numpy")
+
+    expected = np.zeros((3, 4))
+    actual = expected.copy()
+    actual[1, 2] = actual[2, 3] = 1
+
+    assert render_diff(expected, expected.copy()) is None
+    assert render_diff(expected, actual).split("\n") == [
+        "First difference at [1][2]: expected 0.0, got 1.0.",
+        "  expected: [0.0, 0.0, 0.0, 0.0]",
+        "  actual:   [0.0, 0.0, 1.0, 0.0]",
+        "1 more difference.",
+    ]
+    assert render_diff(expected, actual[:2]).startswith("Shape differs")
+
+
+def test_assert_equal() -> None:
+    assert_equal([1, 2], [1, 2])
+
+    with pytest.raises(AssertionError, match=r"^context\nFirst difference at \[1\]"):
+        assert_equal([1, 2], [1, 3], "context")
+
+
+class _NeverEqual(list):
+    def __eq__(self, other: object) -> bool:
+        return False
+
+    __hash__ = None
+
+
+def test_assert_equal_without_structural_difference() -> None:
+    with pytest.raises(AssertionError, match=r"^First difference: expected Ordered"):
+        assert_equal(OrderedDict(a=1, b=2), OrderedDict(b=2, a=1))
+
+    with pytest.raises(AssertionError, match=r"^First difference at \[0\]"):
+        assert_equal([OrderedDict(a=1, b=2)], [OrderedDict(b=2, a=1)])
+
+    with pytest.raises(AssertionError, match=r"^First difference: expected \[1\]"):
+        assert_equal(_NeverEqual([1]), _NeverEqual([1]))
@@ -0,0 +1,69 @@
+from typing import Any, Dict, List
+
+import pytest
+from gapper import param, pre_hook, pre_tests, problem, tcs
+from gapper.core.tester import Tester
+from gapper.core.types import PostHookData
+
+
+def make_tester(events: List[str], seen: List[Dict[str, Any]], *params) -> Tester:
+    def database(data) -> Any:
+        events.append("open database")
+        yield "db"
+        events.append("close database")
+
+    def connection(data) -> Any:
+        events.append("open connection")
+        yield "conn"
+        events.append("close connection")
+
+    def scratch(data) -> str:
+        events.append("make scratch")
+        return "scratch"
+
+    def record(data: PostHookData) -> None:
+        seen.append(dict(data.fixtures))
+
+    bundled = tcs.bind(
+        gap_pre_hooks=pre_hook(connection, scope="bundle"), gap_post_hooks=record
+    )
+
+    @pre_tests(database, as_test_case=False, scope="session")
+    @tcs.params(
+        param(0, gap_pre_hooks=pre_hook(scratch, scope="test"), gap_post_hooks=record)
+    )
+    @bundled.params(*params)
+    @problem()
+    def square(x: int) -> int:
+        return x * x
+
+    tester = Tester(square)
+    tester._submission = lambda x: x * x
+    return tester
+
+
+def test_fixture_scopes() -> None:
+    events: List[str] = []
+    seen: List[Dict[str, Any]] = []
+    tester = make_tester(events, seen, [1], [2])
+
+    results = tester.run()
+
+    assert [result.pass_status for result in results] == ["passed"] * 3
+    assert events == [
+        "open database",
+        "open connection",
+        "close connection",
+        "make scratch",
+        "close database",
+    ]
+    assert seen == [
+        {"database": "db", "connection": "conn"},
+        {"database": "db", "connection": "conn"},
+        {"database": "db", "scratch": "scratch"},
+    ]
+
+
+def test_invalid_fixture_scope() -> None:
+    with pytest.raises(ValueError, match="scope of a pre_tests hook"):
+        pre_tests(lambda data: None, scope="bundle")
@@ -0,0 +1,142 @@
+import re
+from random import Random
+from time import sleep
+from typing import List, Literal, Tuple
+
+import pytest
+from gapper import fuzz, param, problem
+from gapper.core.fuzzing import (
+    Fuzzer,
+    from_type,
+    integers,
+    lists,
+    sampled_from,
+    text,
+)
+from gapper.core.test_result import TestResult
+from gapper.core.unittest_wrapper import TestCaseWrapper
+
+
+@problem()
+def clamp_sum(xs: List[int], limit: int) -> int:
+    return min(sum(xs), limit)
+
+
+def buggy_clamp_sum(xs: List[int], limit: int) -> int:
+    if len(xs) > 3:
+        return sum(xs)
+    return min(sum(xs), limit)
+
+
+def run_fuzz(fuzzer, submission) -> TestResult:
+    wrapper = TestCaseWrapper(param(gap_fuzz=fuzzer), clamp_sum)
+    return wrapper.run_test(submission, TestResult("fuzzed"))
+
+
+def test_fuzz_passes_correct_submission() -> None:
+    result = run_fuzz(fuzz(budget=0.1), lambda xs, limit: min(sum(xs), limit))
+
+    assert result.pass_status == "passed"
+    assert result.descriptions[0].startswith("Tried ")
+
+
+def test_fuzz_reports_minimized_failure() -> None:
+    result = run_fuzz(
+        fuzz(lists(integers(0, 100), max_size=10), integers(0, 10), budget=1),
+        buggy_clamp_sum,
+    )
+
+    assert result.pass_status == "failed"
+    (error,) = result.errors
+    message = error.format()
+    assert "diverges from the solution" in message
+    assert re.search(r"\(\[[01], [01], [01], [01]\], 0\)", message)
+
+
+def test_fuzz_reports_submission_error() -> None:
+    def raising(xs: List[int], limit: int) -> int:
+        raise RuntimeError("boom")
+
+    result = run_fuzz(fuzz(budget=0.1), raising)
+
+    assert result.pass_status == "failed"
+    assert "RuntimeError: boom" in result.errors[0].format()
+    assert "([], 0)" in result.errors[0].format()
+
+
+def test_fuzz_stops_at_max_examples() -> None:
+    result = run_fuzz(
+        fuzz(budget=10, max_examples=7), lambda xs, limit: min(sum(xs), limit)
+    )
+
+    assert result.descriptions[0].startswith("Tried 7 random inputs")
+
+
+def test_custom_strategy() -> None:
+    fuzzer = fuzz(lambda rng: [rng.randint(0, 1)], integers(5, 5), max_examples=3)
+
+    arg_strategies, _ = fuzzer.resolve_strategies(clamp_sum)
+    assert arg_strategies[0].generate(Random(0)) in ([0], [1])
+    assert list(arg_strategies[0].shrink([1])) == []
+
+
+@pytest.mark.parametrize(
+    "tp, check",
+    [
+        (int, lambda v: isinstance(v, int)),
+        (List[str], lambda v: all(isinstance(s, str) for s in v)),
+        (Tuple[int, bool], lambda v: isinstance(v[1], bool)),
+        (Tuple[int, ...], lambda v: isinstance(v, tuple)),
+        (dict[str, float], lambda v: isinstance(v, dict)),
+        (int | None, lambda v: v is None or isinstance(v, int)),
+        (Literal["a", "b"], lambda v: v in ("a", "b")),
+    ],
+)
+def test_from_type(tp, check) -> None:
+    strategy = from_type(tp)
+    rng = Random(1)
+    assert all(check(strategy.generate(rng)) for _ in range(20))
+
+
+def test_from_type_unsupported() -> None:
+    with pytest.raises(TypeError):
+        from_type(object)
+
+
+def test_shrinking() -> None:
+    assert list(integers(-10, 10).shrink(8)) == [0, 4, 6, 7]
+    assert list(integers(3, 10).shrink(3)) == []
+    assert next(iter(text(min_size=1).shrink("abc"))) in ("bc", "ac", "ab", "c")
+    assert list(sampled_from("xyz").shrink("z")) == ["x", "y"]
+    assert list(integers(0, 10**21).shrink(10**20 + 3))[1] == 5 * 10**19 + 2
+
+
+def test_shrinking_stops_at_budget() -> None:
+    def slow_divergence(args: tuple, kwargs: dict) -> str | None:
+        sleep(0.01)
+        return "diverges" if args[0] > 5 * 10**8 else None
+
+    report = Fuzzer((integers(10**8, 10**9),), budget=0.1, seed=1).run(
+        clamp_sum, slow_divergence
+    )
+
+    assert report.failure is not None
+    assert report.elapsed < 0.5
+    assert report.failure[0][0] > 5 * 10**8
+
+
+def test_fuzz_cannot_take_arguments() -> None:
+    with pytest.raises(ValueError, match="Fuzzed test cases cannot take arguments."):
+        param(1, gap_fuzz=fuzz())
+
+
+def test_fuzz_cannot_infer_unannotated() -> None:
+    @problem()
+    def untyped(x):
+        return x
+
+    wrapper = TestCaseWrapper(param(gap_fuzz=fuzz(budget=0.1)), untyped)
+    result = wrapper.run_test(untyped, TestResult("fuzzed"))
+
+    assert result.pass_status == "failed"
+    assert "Cannot infer fuzzing strategies" in str(result.errors[0])
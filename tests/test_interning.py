@@ -0,0 +1,86 @@
+from pathlib import Path
+
+from gapper import param, problem, test_case, test_cases
+from gapper.core.interning import intern_test_arguments
+from gapper.core.tester import Tester
+
+
+def _make_problem():
+    @test_cases.params(
+        *([list(range(1000)), k] for k in range(5)),
+        param(list(range(1000)), k=5, gap_expect=list(range(1000))),
+        param(list(range(1000)), k=6, gap_expect=list(range(1000))),
+    )
+    @test_case([1, 2], 0)
+    @test_case([1, 2], 1)
+    @problem()
+    def top(xs: list[int], k: int) -> list[int]:
+        return sorted(xs)[-k:]
+
+    return top
+
+
+def test_equal_large_arguments_are_shared() -> None:
+    prob = _make_problem()
+    report = intern_test_arguments(prob)
+
+    small, other_small, *large = prob.test_cases
+    assert small.args[0] is not other_small.args[0]
+
+    shared = large[0].args[0]
+    assert all(case.args[0] is shared for case in large)
+    shared_expect = large[5].param_info.gap_expect
+    assert shared_expect is not shared
+    assert large[6].param_info.gap_expect is shared_expect
+
+    assert report.interned_values == 7
+    assert report.pickle_bytes_saved > 0
+    assert report.load_seconds_saved > 0
+    assert report.memory_bytes_saved > 0
+
+
+def test_interning_twice_finds_nothing() -> None:
+    prob = _make_problem()
+    intern_test_arguments(prob)
+    assert intern_test_arguments(prob).interned_values == 0
+
+
+def test_pipeline_and_override_cases_are_not_interned() -> None:
+    @test_case(list(range(1000)), gap_override_test=lambda *_: None)
+    @test_case(list(range(1000)))
+    @problem()
+    def total(xs: list[int]) -> int:
+        return sum(xs)
+
+    assert intern_test_arguments(total).interned_values == 0
+    first, second = total.test_cases
+    assert first.args[0] is not second.args[0]
+
+
+def test_dump_shrinks_with_interning(tmp_path: Path) -> None:
+    interned, plain = tmp_path / "interned.pckl", tmp_path / "plain.pckl"
+    Tester(_make_problem()).dump_to(plain, intern_args=False)
+    report = Tester(_make_problem()).dump_to(interned)
+
+    assert interned.stat().st_size < plain.stat().st_size
+    assert report.interned_values == 7
+    restored = Tester.from_file(interned)
+    assert restored.problem.test_cases[2].args == (list(range(1000)), 0)
+
+
+def test_arguments_of_one_case_are_not_aliased(tmp_path: Path) -> None:
+    @test_case(list(range(1000)), list(range(1000)))
+    @test_case(list(range(1000)), list(range(1000)))
+    @problem()
+    def merge(xs: list[int], ys: list[int]) -> int:
+        xs.extend(ys)
+        return len(xs) + len(ys)
+
+    dump_file = tmp_path / "merge.pckl"
+    assert Tester(merge).dump_to(dump_file).interned_values == 2
+
+    restored = Tester.from_file(dump_file)
+    first, second = restored.problem.test_cases
+    assert first.args[0] is not first.args[1]
+    restored._submission = lambda xs, ys: len(xs) + 2 * len(ys)
+    assert all(result.is_passed for result in restored.run())
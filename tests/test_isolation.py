@@ -0,0 +1,122 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+from gapper import param, problem
+from gapper.core import isolation
+from gapper.core.errors import IsolatedProcessError
+from gapper.core.isolation import run_forked
+from gapper.core.test_result import TestResult
+from gapper.core.unittest_wrapper import TestCaseWrapper
+from gapper.core.utils import CaptureStdout
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+
+
+def test_run_forked_returns_result_and_stderr() -> None:
+    def child() -> int:
+        print("stray stdout")
+        os.write(2, b"from the fd\n")
+        print("from python", file=sys.stderr)
+        return os.getpid()
+
+    pid, stderr = run_forked(child)
+
+    assert pid != os.getpid()
+    assert stderr == "from the fd\nfrom python\n"
+
+
+def test_run_forked_bounds_stderr() -> None:
+    def child() -> None:
+        os.write(2, b"debug\n")
+        os.write(2, b"x" * 100_000)
+        os.write(2, b"\ntraceback\n")
+
+    _, stderr = run_forked(child, stderr_limit=10)
+
+    assert stderr == "debug\nxxxx\n... (truncated)"
+
+
+def test_run_forked_child_exits() -> None:
+    with pytest.raises(IsolatedProcessError) as info:
+        run_forked(lambda: os._exit(3))
+
+    assert info.value.reason == "exited with code 3"
+
+
+def test_run_forked_kills_hung_child() -> None:
+    def child() -> None:
+        os.write(2, b"started\n")
+        time.sleep(30)
+
+    start = time.monotonic()
+    with pytest.raises(IsolatedProcessError) as info:
+        run_forked(child, timeout=0.5)
+
+    assert time.monotonic() - start < 10
+    assert info.value.reason == "was killed after running for 0.5 seconds"
+    assert info.value.stderr == "started\n"
+
+
+def test_run_forked_joins_lingering_drains() -> None:
+    def child() -> None:
+        # the grandchild keeps the stderr pipe open past the drain timeout
+        subprocess.Popen([sys.executable, "-c", "import time; time.sleep(2.5)"])
+
+    run_forked(child)
+    assert isolation._lingering_drains
+    run_forked(lambda: None)
+    assert not isolation._lingering_drains
+
+
+def test_capture_stdout_fd_level() -> None:
+    with CaptureStdout(capture=True, fd=True) as cm:
+        print("python", flush=True)
+        os.write(1, b"fd\n")
+        subprocess.run([sys.executable, "-c", "print('subprocess')"], check=True)
+
+    assert cm.value == "python\nfd\nsubprocess\n"
+
+
+@problem(check_stdout=True, isolate=True)
+def echo(text: str) -> None:
+    os.write(1, f"{text}\n".encode())
+
+
+def run_echo(submission) -> TestResult:
+    wrapper = TestCaseWrapper(param("hello"), echo)
+    return wrapper.run_test(submission, TestResult("isolated"))
+
+
+def test_isolated_test_passes() -> None:
+    def submission(text: str) -> None:
+        os.write(2, b"debugging\n")
+        print(text)
+
+    result = run_echo(submission)
+
+    assert result.pass_status == "passed"
+    assert result.stderr == "debugging\n"
+
+
+def test_isolated_test_fails_with_formatted_error() -> None:
+    def submission(text: str) -> None:
+        os.write(1, b"goodbye\n")
+
+    result = run_echo(submission)
+
+    assert result.pass_status == "failed"
+    (error,) = result.errors
+    assert "expected 'hello', got 'goodbye'" in error.format()
+
+
+def test_isolated_test_exits() -> None:
+    result = run_echo(lambda text: sys.exit(2))
+
+    assert result.pass_status == "failed"
+    assert result.name is None and result.weight == 1
+    (error,) = result.errors
+    assert "exited with code 1" in error.format()
+    assert "SystemExit: 2" in result.stderr
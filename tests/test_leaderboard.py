@@ -0,0 +1,108 @@
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+from gapper import binary_input, leaderboard, param, problem, test_case
+from gapper.core.problem.extras.leaderboard import LeaderboardMetric
+from gapper.core.result_synthesizer import ResultSynthesizer
+from gapper.core.tester import Tester
+
+
+def make_problem(*decorators):
+    @test_case([3, 1, 2])
+    @problem()
+    def sort_list(xs: List[int]) -> List[int]:
+        return sorted(xs)
+
+    for decorator in decorators:
+        sort_list = decorator(sort_list)
+
+    return sort_list
+
+
+def bubble_sort(xs: List[int]) -> List[int]:
+    xs = list(xs)
+    for i in range(len(xs)):
+        for j in range(len(xs) - i - 1):
+            if xs[j] > xs[j + 1]:
+                xs[j], xs[j + 1] = xs[j + 1], xs[j]
+    return xs
+
+
+def test_leaderboard_registered() -> None:
+    prob = make_problem(
+        leaderboard("Runtime", param(list(range(100)))),
+        leaderboard("Stars", metric=lambda _: 5),
+    )
+
+    runtime, stars = prob.config.extras["leaderboard"]
+    assert runtime.bench_input == param(list(range(100)))
+    assert runtime.resolved_order == "asc"
+    assert stars.resolved_order == "desc"
+
+
+@pytest.mark.parametrize("metric", ["runtime", "memory", "operations"])
+def test_metric_measured(metric: str) -> None:
+    lb_metric = LeaderboardMetric(
+        "metric", param(list(range(50, 0, -1))), metric=metric, repeat=3
+    )
+    value = lb_metric.measure(make_problem(), bubble_sort)
+    assert value > 0
+
+
+def test_operations_are_stable() -> None:
+    lb_metric = LeaderboardMetric(
+        "operations", param(list(range(30, 0, -1))), metric="operations"
+    )
+    prob = make_problem()
+    assert lb_metric.measure(prob, bubble_sort) == lb_metric.measure(prob, bubble_sort)
+
+
+def test_operations_count_only_submission_lines() -> None:
+    def dumps(xs: List[int]) -> str:
+        return json.dumps(xs)
+
+    lb_metric = LeaderboardMetric(
+        "operations", param(list(range(100))), metric="operations", repeat=1
+    )
+    assert lb_metric.measure(make_problem(), dumps) == 1
+
+
+def test_binary_input_rejected() -> None:
+    with pytest.raises(ValueError, match="binary_input cannot be used"):
+        leaderboard("Runtime", param(binary_input(__file__)))
+
+
+def test_invalid_repeat() -> None:
+    with pytest.raises(ValueError, match="repeat must be at least 1."):
+        leaderboard("Runtime", repeat=0)
+
+
+def test_leaderboard_after_passing_tests(tmp_path: Path) -> None:
+    prob = make_problem(
+        leaderboard("Runtime", param([5, 4, 3, 2, 1]), repeat=3),
+        leaderboard("Operations", param([5, 4, 3, 2, 1]), metric="operations"),
+    )
+    tester = Tester(prob)
+    tester._submission = bubble_sort
+    results = tester.run()
+
+    assert [entry.name for entry in tester.leaderboard] == ["Runtime", "Operations"]
+
+    output = tmp_path / "results.json"
+    ResultSynthesizer(results=results, total_score=10).to_gradescope_json(
+        save_path=output, leaderboard=tester.leaderboard
+    )
+    saved = json.loads(output.read_text())
+    assert saved["leaderboard"][0]["name"] == "Runtime"
+    assert saved["leaderboard"][0]["order"] == "asc"
+
+
+def test_no_leaderboard_when_tests_fail() -> None:
+    prob = make_problem(leaderboard("Runtime", param([5, 4, 3, 2, 1])))
+    tester = Tester(prob)
+    tester._submission = lambda xs: xs
+    tester.run()
+
+    assert tester.leaderboard == []
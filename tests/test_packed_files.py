@@ -0,0 +1,132 @@
+from array import array
+from pathlib import Path
+
+import pytest
+from gapper import binary_input, problem, test_case, test_cases
+from gapper.core.packed_files import load_binary_inputs
+from gapper.core.pipeline_support import Constructor, Function
+from gapper.core.problem import Problem
+from gapper.gradescope.vars import DEFAULT_TEST_DATA_FOLDER
+
+from tests.conftest import TEST_PROBLEM_FOLDER
+
+
+def test_binary_input_is_mapped_read_only(tmp_path: Path) -> None:
+    data_file = tmp_path / "numbers.bin"
+    data_file.write_bytes(array("q", [3, 1, 2]).tobytes())
+
+    data = binary_input(data_file, cast="q").load()
+    assert data.readonly
+    assert data.tolist() == [3, 1, 2]
+
+
+def test_empty_binary_input(tmp_path: Path) -> None:
+    data_file = tmp_path / "empty.bin"
+    data_file.write_bytes(b"")
+
+    assert binary_input(data_file).load().tobytes() == b""
+
+
+def test_npy_binary_input(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    data_file = tmp_path / "numbers.npy"
+    np.save(data_file, np.arange(10))
+
+    data = binary_input(data_file).load()
+    assert isinstance(data, np.memmap)
+    assert not data.flags.writeable
+    assert data.sum() == 45
+
+
+def test_load_binary_inputs_keeps_other_args(tmp_path: Path) -> None:
+    data_file = tmp_path / "bytes.bin"
+    data_file.write_bytes(b"abc")
+
+    args, kwargs = load_binary_inputs(
+        (1, binary_input(data_file)), {"data": binary_input(data_file), "k": 2}
+    )
+    assert args[0] == 1 and bytes(args[1]) == b"abc"
+    assert bytes(kwargs["data"]) == b"abc" and kwargs["k"] == 2
+
+
+def test_binary_inputs_are_packed() -> None:
+    prob = Problem.from_path(TEST_PROBLEM_FOLDER / "binary_inputs.py")
+    data_file = TEST_PROBLEM_FOLDER / "data" / "measurements.bin"
+
+    assert [*prob.packed_files.values()] == [data_file]
+    (archive_name,) = prob.packed_files
+    assert archive_name.startswith(f"{DEFAULT_TEST_DATA_FOLDER}/")
+    assert archive_name.endswith("_measurements.bin")
+    assert repr(prob.test_cases[0].args[0]) == "binary_input(measurements.bin)"
+
+
+def test_missing_binary_input() -> None:
+    with pytest.raises(FileNotFoundError, match="does not exist"):
+
+        @test_case(binary_input("missing.bin"))
+        @problem()
+        def size(data: memoryview) -> int:
+            return len(data)
+
+
+def test_binary_inputs_in_combined_bundles_are_packed() -> None:
+    data_file = TEST_PROBLEM_FOLDER / "data" / "measurements.bin"
+
+    relative_path = data_file.relative_to(Path(__file__).parent)
+
+    @test_cases.product([binary_input(relative_path, cast="d")], [1, 2], gap_lazy=True)
+    @problem()
+    def largest(xs: memoryview, k: int) -> list[float]:
+        return sorted(xs, reverse=True)[:k]
+
+    assert [*largest.packed_files.values()] == [data_file]
+
+
+@pytest.mark.parametrize(
+    "gap_kwargs, problem_kwargs, match",
+    [
+        ({}, {"mock_input": True}, "mock_input"),
+        ({"gap_override_test": lambda *args: None}, {}, "gap_override_test"),
+    ],
+)
+def test_binary_input_on_unresolved_path(
+    gap_kwargs: dict, problem_kwargs: dict, match: str
+) -> None:
+    data_file = TEST_PROBLEM_FOLDER / "data" / "measurements.bin"
+
+    with pytest.raises(ValueError, match=match):
+
+        @test_case(binary_input(data_file), **gap_kwargs)
+        @problem(**problem_kwargs)
+        def size(data: memoryview) -> int:
+            return len(data)
+
+    with pytest.raises(ValueError, match=match):
+
+        @test_cases.zip([binary_input(data_file)], gap_lazy=True, **gap_kwargs)
+        @problem(**problem_kwargs)
+        def size(data: memoryview) -> int:
+            return len(data)
+
+
+def test_binary_input_in_pipeline() -> None:
+    data_file = TEST_PROBLEM_FOLDER / "data" / "measurements.bin"
+
+    with pytest.raises(ValueError, match="pipeline"):
+
+        @test_case.pipeline(Constructor(), Function("extend")(binary_input(data_file)))
+        @problem()
+        class Bag(list):
+            pass
+
+
+def test_binary_input_drawn_by_recipe() -> None:
+    data_file = TEST_PROBLEM_FOLDER / "data" / "measurements.bin"
+
+    @test_case.recipe(lambda rng: [binary_input(data_file)])
+    @problem()
+    def size(data: memoryview) -> int:
+        return len(data)
+
+    with pytest.raises(ValueError, match="not packed"):
+        list(size.generate_tests())
@@ -1,7 +1,8 @@
+import re
 from typing import Any, Tuple
 
 import pytest
-from gapper import problem
+from gapper import param, problem, tcs, test_case, test_cases
 from gapper.core.errors import (
     MultipleProblemsDefinedError,
     NoProblemDefinedError,
@@ -109,7 +110,7 @@ def test_load_problem(problem_fixture: Problem[Any, Any]) -> None:
 )
 def test_generate_test_cases(problem_fixture: Problem[Any, Any]) -> None:
     for test_case, test_param in zip(
-        problem_fixture.generate_tests(), problem_fixture.test_cases
+        problem_fixture.generate_tests(), problem_fixture.iter_test_params()
     ):  # type: TestCaseWrapper, TestParam
         assert test_case.problem == problem_fixture
         assert test_case.test_param == test_param
@@ -197,3 +198,81 @@ def test_build_connect_config(
     else:
         with pytest.raises(ValueError):
             build_connect_config(*inputs)
+
+
+def test_duplicates_are_not_checked_by_default() -> None:
+    @test_case(1)
+    @test_case(1)
+    @problem()
+    def identity(x: int) -> int:
+        return x
+
+    assert len(identity.test_cases) == 2
+    assert identity.duplicate_test_params == []
+
+
+def test_duplicates_are_reported() -> None:
+    with pytest.warns(UserWarning, match=re.escape("Test case (1) is registered")):
+
+        @test_case(1, gap_name="again")
+        @test_case(1)
+        @test_case(2)
+        @problem(deduplicate="report")
+        def identity(x: int) -> int:
+            return x
+
+    assert len(identity.test_cases) == 3
+    assert [p.param_info.gap_name for p in identity.duplicate_test_params] == ["again"]
+
+
+def test_duplicate_warning_points_at_registration() -> None:
+    with pytest.warns(UserWarning, match="costs an extra run") as record:
+
+        @tcs.bind(gap_weight=1).params([1], [1])
+        @problem(deduplicate="report")
+        def identity(x: int) -> int:
+            return x
+
+    (warning,) = record
+    assert warning.filename == __file__
+    assert "gap check" in str(warning.message)
+
+
+def test_duplicates_are_merged_with_scores() -> None:
+    with pytest.warns(UserWarning, match="is merged into the first one"):
+
+        @test_cases.params([1], [1], param(1, gap_weight=3, gap_extra_points=1))
+        @test_case(2, gap_max_score=1)
+        @test_case(2, gap_max_score=2)
+        @problem(deduplicate="merge")
+        def identity(x: int) -> int:
+            return x
+
+    first, second = identity.test_cases
+    assert first.args == (2,) and first.param_info.gap_max_score == 3
+    assert second.args == (1,) and second.param_info.gap_weight == 5
+    assert second.param_info.gap_extra_points == 1
+    assert identity.duplicate_test_params == []
+
+
+def test_duplicates_with_different_settings_are_kept() -> None:
+    with pytest.warns(UserWarning, match="gap keywords differ"):
+
+        @test_case(1, gap_weight=1)
+        @test_case(1, gap_max_score=1)
+        @test_case(1, gap_hidden=True)
+        @test_case(1)
+        @problem(deduplicate="merge")
+        def identity(x: int) -> int:
+            return x
+
+    first, hidden, max_scored = identity.test_cases
+    assert first.param_info.gap_weight == 2
+    assert hidden.param_info.gap_hidden
+    assert max_scored.param_info.gap_max_score == 1
+    assert identity.duplicate_test_params == [hidden, max_scored]
+
+
+def test_invalid_deduplicate_option() -> None:
+    with pytest.raises(ValueError, match="deduplicate must be"):
+        problem(deduplicate="drop")  # type: ignore
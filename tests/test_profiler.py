@@ -0,0 +1,98 @@
+from functools import partial
+from pathlib import Path
+from time import perf_counter
+
+from gapper import param, problem
+from gapper.core.profiler import HotLineSampler, submission_source_files
+from gapper.core.test_result import TestResult
+from gapper.core.tester import Tester
+from gapper.core.unittest_wrapper import TestCaseWrapper
+
+
+def spin(seconds: float) -> int:
+    count = 0
+    end = perf_counter() + seconds
+    while perf_counter() < end:
+        count += 1
+    return count
+
+
+class Spinner:
+    def run(self) -> int:
+        return spin(0.01)
+
+
+def test_submission_source_files() -> None:
+    assert submission_source_files(spin) == [__file__]
+    assert submission_source_files(Spinner) == [__file__]
+    assert submission_source_files(object()) == []
+
+
+def test_script_submission_source_files(tmp_path: Path) -> None:
+    @problem(is_script=True)
+    def script() -> None:
+        pass
+
+    script_file = tmp_path / "script.py"
+    script_file.write_text("print('hello')\n")
+    tester = Tester(script).load_submission_from_path(script_file)
+
+    assert submission_source_files(tester.submission) == [str(script_file)]
+
+
+def test_sampler_finds_hot_line() -> None:
+    with HotLineSampler([__file__], interval=0.0005) as sampler:
+        spin(0.2)
+
+    assert sampler.sample_count > 0
+    filename, lineno, _ = sampler.top_lines(1)[0]
+    assert filename == __file__
+    assert spin.__code__.co_firstlineno < lineno < spin.__code__.co_firstlineno + 5
+
+    report = sampler.format_report(1)
+    assert report[0].startswith("Hottest lines in your submission")
+    assert report[1].startswith(f"  test_profiler.py:{lineno} ")
+
+
+def test_sampler_caps_samples() -> None:
+    with HotLineSampler([__file__], interval=0.0001, max_samples=5) as sampler:
+        spin(0.1)
+
+    assert sampler.sample_count == 5
+
+
+def test_profile_reported_on_failure() -> None:
+    @problem()
+    def slow(seconds: float) -> int:
+        return 0
+
+    wrapper = TestCaseWrapper(param(0.2, gap_profile=2), slow)
+    result = wrapper.run_test(spin, TestResult("profiled"))
+
+    assert result.pass_status == "failed"
+    assert result.descriptions[0].startswith("Hottest lines in your submission")
+    assert 1 < len(result.descriptions) <= 3
+
+
+def test_profile_not_reported_on_success() -> None:
+    @problem()
+    def fast(seconds: float) -> int:
+        return spin(seconds) * 0
+
+    wrapper = TestCaseWrapper(param(0.0, gap_profile=2), fast)
+    result = wrapper.run_test(lambda seconds: 0, TestResult("profiled"))
+
+    assert result.is_passed
+    assert result.descriptions == []
+
+
+def test_profile_skipped_without_source_files() -> None:
+    @problem()
+    def slow(seconds: float) -> int:
+        return 0
+
+    wrapper = TestCaseWrapper(param(0.2, gap_profile=2), slow)
+    result = wrapper.run_test(partial(spin), TestResult("profiled"))
+
+    assert result.pass_status == "failed"
+    assert result.descriptions == []
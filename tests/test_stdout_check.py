@@ -0,0 +1,142 @@
+import pytest
+from gapper import param, problem, stdout_check
+from gapper.core.stdout_check import StdoutComparer, StdoutDivergence
+from gapper.core.test_result import TestResult
+from gapper.core.unittest_wrapper import TestCaseWrapper, wrapper_def
+
+
+@pytest.mark.parametrize(
+    "check, expected, actual",
+    [
+        (stdout_check(), "a\nb\n", "a\nb\n"),
+        (stdout_check(), "a\nb\n", "a\nb"),
+        (stdout_check(normalize_whitespace=True), "a  b\n", " a b \n"),
+        (stdout_check(ignore_trailing_newlines=True), "a\nb", "a\nb\n\n\n"),
+        (stdout_check(ignore_trailing_newlines=True), "a\n\n\n", "a"),
+        (stdout_check(ignore_case=True), "Hello\n", "hELLO\n"),
+        (stdout_check(float_digits=2), "pi is 3.14159\n", "pi is 3.1400001\n"),
+        (stdout_check(normalizers=[str.strip]), "a\n", "  a\n"),
+    ],
+)
+def test_compare_normalized_equal(check, expected, actual) -> None:
+    check.compare(expected, actual)
+
+
+@pytest.mark.parametrize(
+    "check, expected, actual, message",
+    [
+        (
+            stdout_check(),
+            "a\nb\n",
+            "a\nc\n",
+            "differs at line 2: expected 'b', got 'c'",
+        ),
+        (
+            stdout_check(),
+            "a\n",
+            "a\nb\n",
+            "more lines than expected, starting at line 2",
+        ),
+        (stdout_check(), "a\nb\n", "a\n", "ends after line 1"),
+        (
+            stdout_check(ignore_trailing_newlines=True),
+            "a\nb",
+            "a\n\nb",
+            "differs at line 2: expected 'b', got ''",
+        ),
+        (stdout_check(float_digits=2), "1.00\n", "1.01\n", "differs at line 1"),
+    ],
+)
+def test_compare_divergence(check, expected, actual, message) -> None:
+    with pytest.raises(StdoutDivergence, match=message):
+        check.compare(expected, actual)
+
+
+def test_comparer_stops_at_first_diverging_line() -> None:
+    comparer = StdoutComparer("a\nb\nc\n", stdout_check())
+
+    comparer.write("a\nb")
+    with pytest.raises(StdoutDivergence, match="line 2"):
+        comparer.write("x\n")
+    with pytest.raises(StdoutDivergence, match="line 2"):
+        comparer.write("c\n")
+    assert comparer.getvalue() == "a\nbx\nc\n"
+
+
+def test_comparer_without_stopping_early() -> None:
+    comparer = StdoutComparer("a\nb\n", stdout_check(stop_early=False))
+
+    comparer.write("x\ny\n")
+    assert str(comparer.divergence) == (
+        "The stdout differs at line 1: expected 'a', got 'x'."
+    )
+    with pytest.raises(StdoutDivergence, match="line 1"):
+        comparer.finish()
+
+
+@problem(check_stdout=stdout_check(ignore_case=True))
+def shout(n: int) -> None:
+    for i in range(n):
+        print(f"LINE {i}")
+
+
+def run_shout(submission) -> TestResult:
+    wrapper = TestCaseWrapper(param(5), shout)
+    return wrapper.run_test(submission, TestResult("stdout"))
+
+
+def test_streaming_passes_normalized_output() -> None:
+    def submission(n: int) -> None:
+        for i in range(n):
+            print(f"line {i}")
+
+    assert run_shout(submission).pass_status == "passed"
+
+
+def test_streaming_stops_submission_early() -> None:
+    printed = []
+
+    def submission(n: int) -> None:
+        for i in range(1000):
+            printed.append(i)
+            print(f"line {i if i != 2 else 'two'}")
+
+    result = run_shout(submission)
+
+    assert result.pass_status == "failed"
+    assert printed == [0, 1, 2]
+    (error,) = result.errors
+    assert "differs at line 3: expected 'LINE 2', got 'line two'" in error.format()
+
+
+def test_streaming_catches_swallowed_divergence() -> None:
+    def submission(n: int) -> None:
+        try:
+            print("wrong")
+        except AssertionError:
+            pass
+
+    result = run_shout(submission)
+
+    assert result.pass_status == "failed"
+    (error,) = result.errors
+    assert "differs at line 1" in error.format()
+
+
+def test_streaming_closes_spilled_comparer(monkeypatch: pytest.MonkeyPatch) -> None:
+    comparers = []
+
+    class SpillingComparer(StdoutComparer):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, memory_limit=4, **kwargs)
+            comparers.append(self)
+
+    monkeypatch.setattr(wrapper_def, "StdoutComparer", SpillingComparer)
+
+    def submission(n: int) -> None:
+        for i in range(n):
+            print(f"line {i}")
+
+    assert run_shout(submission).pass_status == "passed"
+    (comparer,) = comparers
+    assert comparer._spill is not None and comparer._spill.closed
@@ -1,3 +1,5 @@
+from collections import OrderedDict
+from unittest import SkipTest
 from unittest.mock import patch
 
 import pytest
@@ -69,3 +71,65 @@ def test_gap_check(request: pytest.FixtureRequest) -> None:
     for test in gap_check_tester.generate_tests():
         passed, result, out = test.check_test()
         assert passed
+
+
+def test_assertions(dummy_problem) -> None:
+    wrapper = TestCaseWrapper(TestParam(), dummy_problem)
+
+    wrapper.assertEqual([1, 2], [1, 2])
+    wrapper.assertAlmostEqual(0.1 + 0.2, 0.3)
+    wrapper.assertIn(1, [1, 2])
+    with pytest.raises(AssertionError, match=r"^1 != 2 : context$"):
+        wrapper.assertEqual(1, 2, "context")
+    with pytest.raises(AssertionError, match=r"First difference at \[1\]"):
+        wrapper.assertListEqual([1, 2], [1, 3])
+    with wrapper.assertRaises(ValueError):
+        raise ValueError()
+    with wrapper.assertRaisesRegex(ValueError, "bad"):
+        raise ValueError("bad input")
+    with pytest.raises(AttributeError):
+        wrapper.runTest  # noqa: B018
+
+
+def test_assertions_without_false_pass(dummy_problem) -> None:
+    wrapper = TestCaseWrapper(TestParam(), dummy_problem)
+
+    with pytest.raises(AssertionError, match="First difference"):
+        wrapper.assertEqual(OrderedDict(a=1, b=2), OrderedDict(b=2, a=1))
+
+
+def test_test_case_members_forwarded(dummy_problem) -> None:
+    wrapper = TestCaseWrapper(TestParam(), dummy_problem)
+
+    with wrapper.subTest(index=1):
+        wrapper.assertTrue(True)
+    with pytest.raises(SkipTest, match="not applicable"):
+        wrapper.skipTest("not applicable")
+    assert wrapper.id().endswith("TestCaseWrapper.runTest")
+
+
+def test_assertions_type_equality_func(dummy_problem) -> None:
+    def case_insensitive(first: str, second: str, msg: str | None = None) -> None:
+        assert first.lower() == second.lower()
+
+    wrapper = TestCaseWrapper(TestParam(), dummy_problem)
+    wrapper.addTypeEqualityFunc(str, case_insensitive)
+
+    wrapper.assertEqual("ABC", "abc")
+    with pytest.raises(AssertionError):
+        TestCaseWrapper(TestParam(), dummy_problem).assertEqual("ABC", "abc")
+
+
+def test_assertions_type_equality_func_forwarded(dummy_problem) -> None:
+    def case_insensitive(first: str, second: str, msg: str | None = None) -> None:
+        assert first.lower() == second.lower()
+
+    wrapper = TestCaseWrapper(TestParam(), dummy_problem)
+    wrapper.addTypeEqualityFunc(str, case_insensitive)
+
+    delegate = wrapper.assertRaisesRegex.__self__
+    delegate.assertEqual("ABC", "abc")
+    assert (
+        TestCaseWrapper(TestParam(), dummy_problem).assertRaisesRegex.__self__
+        is not delegate
+    )
@@ -1,9 +1,14 @@
 import re
+from pathlib import Path
+from random import Random
 from typing import Any, Dict, Sequence
 
+import dill
 import pytest
-from gapper import param, test_case, test_cases
-from gapper.core.test_parameter import GapReservedKeywords
+from gapper import param, problem, test_case, test_cases
+from gapper.core.fuzzing import Strategy, integers, lists
+from gapper.core.test_parameter import CombinedTestParams, GapReservedKeywords
+from gapper.core.test_result import TestResult
 
 
 def test_gap_keyword_enum() -> None:
@@ -292,3 +297,347 @@ def test_tcs_bind(gap_kwargs) -> None:
 
         for case in bundle.final_params:
             assert getattr(case.param_info, gap_kwargs) is is_set
+
+
+def test_generated_params_are_reproducible() -> None:
+    @test_cases.generated(lists(integers()), count=5, gap_name="sum", gap_hidden=True)
+    @problem()
+    def total(xs: list[int]) -> int:
+        return sum(xs)
+
+    first, second = list(total.iter_test_params()), list(total.iter_test_params())
+    assert len(first) == 5
+    assert first == second
+    assert [p.param_info.gap_name for p in first] == [f"sum #{i}" for i in range(1, 6)]
+    assert all(p.param_info.gap_hidden for p in first)
+
+
+class _Digits(Strategy[int]):
+    def generate(self, rng: Random) -> int:
+        return rng.randrange(10**9)
+
+
+def test_generated_params_seed_ignores_strategy_repr() -> None:
+    def make_problem() -> Any:
+        @test_cases.generated(_Digits(), count=5)
+        @problem()
+        def identity(x: int) -> int:
+            return x
+
+        return identity
+
+    first, second = make_problem(), make_problem()
+    assert list(first.iter_test_params()) == list(second.iter_test_params())
+
+
+def test_generated_params_seed() -> None:
+    @test_cases.generated(integers(), count=5, seed=1)
+    @test_cases.generated(integers(), count=5, seed=2)
+    @problem()
+    def identity(x: int) -> int:
+        return x
+
+    assert (
+        list(identity.iter_test_params())[:5] != list(identity.iter_test_params())[5:]
+    )
+
+
+def test_generated_params_inferred() -> None:
+    @test_cases.generated(count=3)
+    @problem()
+    def repeat(s: str, n: int) -> str:
+        return s * n
+
+    for generated in list(repeat.iter_test_params()):
+        s, n = generated.args
+        assert isinstance(s, str) and isinstance(n, int)
+
+
+def test_generated_params_invalid_count() -> None:
+    with pytest.raises(ValueError, match="count must be at least 1."):
+        test_cases.generated(integers(), count=0)
+
+
+def test_generated_failure_is_shrunk() -> None:
+    @test_cases.generated(lists(integers(0, 100), min_size=5), count=1, seed=0)
+    @problem()
+    def maximum(xs: list[int]) -> int:
+        return max(xs)
+
+    (test,) = maximum.generate_tests()
+    result = test.run_test(lambda xs: xs[0], TestResult("generated"))
+
+    assert result.pass_status == "failed"
+    assert result.descriptions[0].startswith("Minimal failing input found in")
+    assert re.search(r"\(\[[01](, [01]){4}\]\)", result.descriptions[0])
+
+
+def test_generated_failure_shrinking_error_is_reported() -> None:
+    checks: list[int] = []
+
+    def flaky_check(expected: int, actual: int) -> None:
+        checks.append(actual)
+        if len(checks) > 1:
+            raise RuntimeError("broken check")
+        assert expected == actual
+
+    @test_cases.generated(
+        lists(integers(0, 100), min_size=5),
+        count=1,
+        seed=0,
+        gap_override_check=flaky_check,
+    )
+    @problem()
+    def maximum(xs: list[int]) -> int:
+        return max(xs)
+
+    (test,) = maximum.generate_tests()
+    result = test.run_test(lambda xs: -1, TestResult("generated"))
+
+    assert result.pass_status == "failed"
+    assert result.descriptions == [
+        "Shrinking the failing input failed: RuntimeError: broken check"
+    ]
+
+
+@pytest.mark.parametrize("combinator", ["product", "zip"])
+def test_lazy_combined_params_match_eager(combinator: str) -> None:
+    bundle = getattr(test_cases, combinator)
+
+    with pytest.warns(DeprecationWarning):
+        eager = bundle([1, 2, 3], "abc", c=[True, False, None], gap_hidden=True)
+    lazy = bundle(
+        [1, 2, 3],
+        (x for x in "abc"),
+        c=[True, False, None],
+        gap_hidden=True,
+        gap_lazy=True,
+    )
+
+    @lazy
+    @problem()
+    def fn(a: int, b: str, c: bool | None) -> None:
+        pass
+
+    assert len(lazy.final_params) == len(eager.final_params)
+    assert list(fn.iter_test_params()) == eager.final_params
+
+
+def test_lazy_product_is_not_materialized() -> None:
+    bundle = test_cases.product(
+        range(200), range(200), range(50), gap_max_score=0.1, gap_lazy=True
+    )
+
+    assert len(bundle.final_params) == 2_000_000
+    first = next(bundle.final_params.generate(None))
+    assert first == param(0, 0, 0, gap_max_score=0.1)
+
+
+def test_problem_stores_lazy_params_undrawn() -> None:
+    @test_cases.product(range(200), range(200), gap_lazy=True)
+    @problem()
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    (lazy,) = add.test_cases
+    assert isinstance(lazy, CombinedTestParams)
+    assert add.test_cases is add.test_cases
+    assert sum(1 for _ in add.iter_test_params()) == 40_000
+
+
+def test_lazy_per_case_gap_kwargs() -> None:
+    bundle = test_cases.zip([1, 2], [3, 4], gap_name=["one", "two"], gap_lazy=True)
+
+    assert [p.param_info.gap_name for p in bundle.final_params.generate(None)] == [
+        "one",
+        "two",
+    ]
+
+    with pytest.raises(ValueError, match="must have the same length"):
+        test_cases.product([1, 2], [3, 4], gap_name=["one", "two"], gap_lazy=True)
+
+
+def test_lazy_zip_length_mismatch() -> None:
+    with pytest.raises(ValueError, match="must match in zip mode"):
+        test_cases.zip([1, 2], b=[1, 2, 3], gap_lazy=True)
+
+
+def test_lazy_only_for_combinators() -> None:
+    with pytest.raises(ValueError, match="gap_lazy can only be used"):
+        test_cases.params([1, 2], gap_lazy=True)
+
+
+def test_bundle_members_share_param_info() -> None:
+    bundle = test_cases.params([1], [2], [3], gap_hidden=True, gap_max_score=2)
+    first, *rest = bundle.final_params
+    assert all(case.param_info is first.param_info for case in rest)
+    assert first.param_info.gap_hidden and first.param_info.gap_max_score == 2
+
+
+def test_bundle_per_case_gap_kwargs_do_not_leak() -> None:
+    bundle = test_cases.singular_params(
+        1, param(2, gap_weight=3), 3, gap_hidden=True, gap_name=["a", "b", "c"]
+    )
+    assert [case.param_info.gap_name for case in bundle.final_params] == ["a", "b", "c"]
+    assert all(case.param_info.gap_hidden for case in bundle.final_params)
+    assert [case.param_info.gap_weight for case in bundle.final_params] == [
+        None,
+        3,
+        None,
+    ]
+
+    first = bundle.final_params[0]
+    first.update_gap_kwargs(gap_hidden=False)
+    assert not first.param_info.gap_hidden
+    assert all(case.param_info.gap_hidden for case in bundle.final_params[1:])
+
+
+def test_param_info_update_names_replacement() -> None:
+    case = param(1, gap_hidden=True)
+
+    with pytest.deprecated_call(), pytest.raises(TypeError, match="update_gap_kwargs"):
+        case.param_info.update({"gap_hidden": False})
+    assert case.param_info.gap_hidden
+
+
+def test_test_param_is_slotted() -> None:
+    case = param(1, b=2, gap_hidden=True)
+    assert not hasattr(case, "__dict__")
+    assert not hasattr(case.param_info, "__dict__")
+    assert dill.loads(dill.dumps(case)) == case
+
+
+def test_format_is_truncated_with_hash_suffix() -> None:
+    case = param(list(range(1000)), k=5)
+    formatted = case.format()
+    assert len(formatted) == param.format_max_length
+    assert re.fullmatch(r"\(\[0, 1, 2, .*\.\.\.#[0-9a-f]{8}", formatted)
+    assert param(list(range(1000)), k=5).format() == formatted
+    assert param(list(range(1001)), k=5).format() != formatted
+
+
+def test_format_is_cached_until_args_are_set() -> None:
+    case = param([1, 2], k=3)
+    assert case.format() is case.format()
+    assert case.format() == "([1, 2], k=3)"
+
+    case.args = ([4],)
+    assert case.format() == "([4], k=3)"
+    case.kwargs = {}
+    assert case.format() == "([4])"
+
+
+def test_from_file_streams_jsonl_rows(tmp_path: Path) -> None:
+    data_file = tmp_path / "rows.jsonl"
+    data_file.write_text('[1, 2]\n\n{"a": 3, "b": 4, "gap_hidden": true}\n')
+
+    @test_cases.from_file(data_file, gap_name="row", gap_max_score=2)
+    @problem()
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    first, second = list(add.iter_test_params())
+    assert first.args == (1, 2) and first.kwargs == {}
+    assert second.args == () and second.kwargs == {"a": 3, "b": 4}
+    assert [case.param_info.gap_name for case in (first, second)] == [
+        "row #1",
+        "row #2",
+    ]
+    assert [case.param_info.gap_hidden for case in (first, second)] == [False, True]
+    assert all(case.param_info.gap_max_score == 2 for case in (first, second))
+
+
+def test_from_file_parses_csv_cells(tmp_path: Path) -> None:
+    data_file = tmp_path / "rows.csv"
+    data_file.write_text('a,b,gap_name\n"[1, 2]",x,\n3,,named\n')
+
+    @test_cases.from_file(data_file)
+    @problem()
+    def pair(a: Any, b: Any = None) -> Any:
+        return a, b
+
+    first, second = list(pair.iter_test_params())
+    assert first.kwargs == {"a": [1, 2], "b": "x"}
+    assert first.param_info.gap_name is None
+    assert second.kwargs == {"a": 3}
+    assert second.param_info.gap_name == "named"
+
+
+def test_from_file_relative_to_problem_file() -> None:
+    bundle = test_cases.from_file("assets/problems/data/weighted_sum.jsonl")
+
+    @bundle
+    @problem()
+    def weighted_sum(xs: list[int], weight: int = 1) -> int:
+        return sum(xs) * weight
+
+    assert (
+        bundle.path == Path(__file__).parent / "assets/problems/data/weighted_sum.jsonl"
+    )
+    assert [*weighted_sum.packed_files.values()] == [bundle.path]
+    assert len(list(weighted_sum.iter_test_params())) == 3
+
+
+@pytest.mark.parametrize(
+    "path, kwargs, message",
+    [
+        ("rows.txt", {}, "Cannot read test cases from rows.txt"),
+        ("rows.csv", {"a": 1}, "Data files only take gap keywords."),
+        ("rows.csv", {"gap_fuzz": object()}, "cannot be fuzzed"),
+    ],
+)
+def test_from_file_invalid_arguments(
+    path: str, kwargs: Dict[str, Any], message: str
+) -> None:
+    with pytest.raises(ValueError, match=re.escape(message)):
+        test_cases.from_file(path, **kwargs)
+
+
+def test_from_file_invalid_row(tmp_path: Path) -> None:
+    data_file = tmp_path / "rows.jsonl"
+    data_file.write_text('[1]\n{"gap_unknown": 1}\n')
+
+    @test_cases.from_file(data_file)
+    @problem()
+    def identity(x: int) -> int:
+        return x
+
+    with pytest.raises(ValueError, match="Invalid row 2 at line 2 in"):
+        list(identity.iter_test_params())
+
+
+@pytest.mark.parametrize(
+    "name, content, message",
+    [
+        ("rows.csv", "x\n1\n{[]: 1}\n", "row 2 at line 3 .*TypeError"),
+        ("rows.jsonl", "[1]\n\n" + "[" * 100_000 + "\n", "row 2 at line 3 .*Recursion"),
+        ("rows.jsonl", "[1]\n[2\n", "row 2 at line 2 .*JSONDecodeError"),
+    ],
+)
+def test_from_file_unparsable_row(
+    tmp_path: Path, name: str, content: str, message: str
+) -> None:
+    data_file = tmp_path / name
+    data_file.write_text(content)
+
+    @test_cases.from_file(data_file)
+    @problem()
+    def identity(x: Any) -> Any:
+        return x
+
+    with pytest.raises(ValueError, match=message):
+        list(identity.iter_test_params())
+
+
+def test_from_file_converters(tmp_path: Path) -> None:
+    data_file = tmp_path / "rows.csv"
+    data_file.write_text("code,count\n01234,12345\n12345,01234\n")
+
+    @test_cases.from_file(data_file, converters={"code": str})
+    @problem()
+    def pair(code: str, count: Any) -> Any:
+        return code, count
+
+    first, second = list(pair.iter_test_params())
+    assert first.kwargs == {"code": "01234", "count": 12345}
+    assert second.kwargs == {"code": "12345", "count": "01234"}
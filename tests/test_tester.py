@@ -1,8 +1,14 @@
+import subprocess
+import sys
+import threading
+import time
 from copy import deepcopy
 from pathlib import Path
-from typing import Any
+from threading import Barrier, Event
+from typing import Any, Generator, List
 
 import pytest
+from gapper import post_tests, problem, tcs
 from gapper.core.errors import (
     InternalError,
     MultipleSubmissionError,
@@ -10,6 +16,7 @@ from gapper.core.errors import (
 )
 from gapper.core.problem import Problem
 from gapper.core.tester import HookTypes, Tester
+from gapper.core.types import PostTestsData
 
 from tests.conftest import (
     MULTIPLE_SUBMISSIONS_FOLDER,
@@ -105,3 +112,119 @@ def test_post_test(request: pytest.FixtureRequest) -> None:
     assert len(tester.problem.test_cases) + len(tester.problem.post_tests_hooks) == len(
         results
     )
+
+
+def test_recipe_inputs_not_pickled(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> None:
+    tester: Tester = request.getfixturevalue(make_tester_name("recipe_inputs.py"))
+
+    dump_file = tmp_path / "recipe_inputs_tester.dump"
+    tester.dump_to(dump_file)
+    assert dump_file.stat().st_size < 10_000
+
+    restored_tester = Tester.from_file(dump_file)
+    restored_tester.load_submission_from_path(
+        TEST_SUBMISSIONS_FOLDER / "recipe_inputs.py"
+    )
+    results = restored_tester.run()
+
+    assert [result.rich_test_name for result in results] == [
+        "many numbers many_numbers(seed=2)",
+        "many_numbers(seed=1)",
+        "numbers_with_k(seed='k')",
+    ]
+    assert all(result.is_passed for result in results)
+
+
+def make_post_tests_tester(*hooks: post_tests, **kwargs: Any) -> Tester[Any, Any]:
+    prob = tcs.singular_params(1, 2)(problem(**kwargs)(lambda x: x))
+    for hook in hooks:
+        hook(prob)
+
+    tester = Tester(prob)
+    tester._submission = lambda x: x
+    return tester
+
+
+def test_independent_post_tests_run_concurrently() -> None:
+    barrier = Barrier(2, timeout=5)
+
+    def first(data: PostTestsData) -> None:
+        barrier.wait()
+
+    def second(data: PostTestsData) -> None:
+        assert len(data.test_results) == 2
+        barrier.wait()
+
+    def in_order(data: PostTestsData) -> None:
+        pass
+
+    tester = make_post_tests_tester(
+        post_tests(first, independent=True),
+        post_tests(in_order),
+        post_tests(second, independent=True),
+    )
+    results = tester.run()
+
+    assert [result.default_name for result in results[2:]] == [
+        "first",
+        "in_order",
+        "second",
+    ]
+    assert all(result.pass_status == "passed" for result in results)
+
+
+def test_independent_post_tests_timeout() -> None:
+    release = Event()
+    calls: List[str] = []
+
+    def stuck(data: PostTestsData) -> Generator[None, None, None]:
+        calls.append("run")
+        if len(calls) == 1:
+            release.wait(5)
+        yield
+        calls.append("tear down")
+
+    tester = make_post_tests_tester(
+        post_tests(stuck, independent=True), post_tests_timeout=0.05
+    )
+    try:
+        *_, result = tester.run()
+    finally:
+        release.set()
+    for thread in threading.enumerate():
+        if thread.name == "gapper-post-tests-stuck":
+            thread.join(5)
+
+    assert result.default_name == "stuck"
+    assert result.pass_status == "failed"
+    assert "did not finish in 0.05 seconds" in result.errors[0].format()
+    assert calls == ["run"]
+
+    *_, result = tester.run()
+
+    assert result.pass_status == "passed"
+    assert calls == ["run", "run", "tear down"]
+
+
+def test_timed_out_post_tests_do_not_block_exit() -> None:
+    script = """
+import time
+from gapper import post_tests, problem, tcs
+from gapper.core.tester import Tester
+
+@post_tests(lambda data: time.sleep(30), independent=True)
+@tcs.singular_params(1)
+@problem(post_tests_timeout=0.1)
+def identity(x):
+    return x
+
+tester = Tester(identity)
+tester._submission = lambda x: x
+tester.run()
+"""
+    start = time.monotonic()
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=20)
+
+    assert time.monotonic() - start < 15
@@ -1,7 +1,20 @@
+import hashlib
+import io
 import re
 
 import pytest
-from gapper.core.utils import apply_context_on_fn
+from gapper import param, problem
+from gapper.core.errors import OutputLimitError
+from gapper.core.test_result import TestResult
+from gapper.core.unittest_wrapper import TestCaseWrapper
+from gapper.core.utils import (
+    CaptureStdout,
+    ContextCache,
+    SpillingTextIO,
+    apply_context_on_fn,
+    make_stdin,
+    mock_stdin,
+)
 
 
 def test_reject_callable() -> None:
@@ -56,3 +69,124 @@ def test_global() -> None:
     g = apply_context_on_fn(f, {"global_val": 1})
 
     assert g() == 1
+
+
+def test_context_globals_are_exact_dict() -> None:
+    global global_val
+
+    def f():
+        return global_val, len(re.escape("."))
+
+    applied_f = apply_context_on_fn(f, {})
+    assert type(applied_f.__globals__) is dict
+    assert applied_f.__globals__ is not f.__globals__
+
+    global_val = 2
+    try:
+        assert apply_context_on_fn(f, {})() == (2, 2)
+        assert apply_context_on_fn(f, {"global_val": 1})() == (1, 2)
+    finally:
+        del global_val
+
+
+def test_context_cache_reuses_function() -> None:
+    def outer():
+        b: int
+
+        def inner():
+            return global_val, b
+
+        return inner
+
+    f = outer()
+    cache = ContextCache()
+
+    g = cache.apply(f, {"global_val": 1, "b": 2})
+    assert g() == (1, 2)
+
+    assert cache.apply(f, {"global_val": 3, "b": 4}) is g
+    assert g() == (3, 4)
+
+    h = cache.apply(f, {"global_val": 5})
+    assert h is not g
+    assert h() == (5, 4)
+
+
+def test_spilling_text_io() -> None:
+    stream = SpillingTextIO(memory_limit=10)
+    stream.write("hello ")
+    assert not stream.spilled
+
+    stream.write("world\n" * 3)
+    assert stream.spilled
+    assert stream.getvalue() == "hello " + "world\n" * 3
+    assert stream.length == 24
+    assert (
+        stream.digest
+        == hashlib.blake2b(stream.getvalue().encode(), digest_size=16).hexdigest()
+    )
+
+    stream.write("!")
+    assert stream.getvalue().endswith("world\n!")
+    stream.close()
+
+
+def test_spilling_text_io_keeps_text_up_to_hard_limit() -> None:
+    stream = SpillingTextIO(hard_limit=8)
+    stream.write("hello ")
+
+    with pytest.raises(OutputLimitError):
+        stream.write("world")
+    assert stream.getvalue() == "hello wo"
+    stream.close()
+
+
+def test_capture_stdout_limit() -> None:
+    with pytest.raises(OutputLimitError) as exc_info:
+        with CaptureStdout(capture=True, max_length=100) as cm:
+            for i in range(1000):
+                print(i)
+
+    assert exc_info.value.limit == 100
+    assert exc_info.value.preview.startswith("0\n1\n2\n")
+    assert "printed more than 100 characters" in exc_info.value.format()
+    assert len(cm.value) <= 100
+
+
+def test_capture_stdout_limit_fails_test() -> None:
+    @problem(check_stdout=True, max_stdout=1000)
+    def count(n: int) -> None:
+        print(n)
+
+    def chatty(n: int) -> None:
+        while True:
+            print("debug", n)
+
+    result = TestCaseWrapper(param(3), count).run_test(chatty, TestResult("chatty"))
+
+    assert result.pass_status == "failed"
+    (error,) = result.errors
+    assert isinstance(error, OutputLimitError)
+    assert "debug 3" in error.format()
+
+
+def test_mock_stdin_interfaces() -> None:
+    import sys
+
+    with CaptureStdout(capture=True) as cm, mock_stdin(["1", "2", "3\n", "4", "5"]):
+        first = input("first: ")
+        second = sys.stdin.readline()
+        rest = [line for _, line in zip(range(2), sys.stdin)]
+        remaining = sys.stdin.read()
+        with pytest.raises(EOFError):
+            input()
+
+    assert (first, second, rest, remaining) == ("1", "2\n", ["3\n", "4\n"], "5\n")
+    assert cm.value == "first: "
+
+
+def test_make_stdin_spills_large_inputs() -> None:
+    stdin = make_stdin(["a" * 10, "b"], memory_limit=8)
+
+    assert not isinstance(stdin, io.StringIO)
+    assert stdin.read() == "a" * 10 + "\nb\n"
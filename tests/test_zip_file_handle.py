@@ -4,7 +4,11 @@ from textwrap import dedent
 from zipfile import ZipFile
 
 from gapper.core.file_handlers import AutograderZipper
+from gapper.core.problem import Problem
 from gapper.core.tester import Tester
+from gapper.gradescope.vars import DEFAULT_TEST_DATA_FOLDER
+
+from tests.conftest import TEST_PROBLEM_FOLDER
 
 
 def test_zipping(tmp_path: Path) -> None:
@@ -39,3 +43,18 @@ def test_zipping(tmp_path: Path) -> None:
         pip install -e /autograder/source
         python{version_short} -m pip cache purge"""
     )
+
+
+def test_zipping_packs_test_data(tmp_path: Path) -> None:
+    zip_path = tmp_path / "test.zip"
+    problem = Problem.from_path(TEST_PROBLEM_FOLDER / "data_driven_test_cases.py")
+    AutograderZipper(Tester(problem)).generate_zip(zip_path)
+
+    with ZipFile(zip_path, "r") as zip_file:
+        names = zip_file.namelist()
+
+    for archive_name, path in problem.packed_files.items():
+        assert archive_name.startswith(f"{DEFAULT_TEST_DATA_FOLDER}/")
+        assert archive_name in names
+        assert path.exists()
+    assert len(problem.packed_files) == 2